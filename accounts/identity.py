@@ -0,0 +1,95 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from django.conf import settings
+
+from accounts.models import Staff
+
+
+@dataclass(frozen=True)
+class StaffIdentity:
+    """The parts of a Staff row a request needs to be authenticated and authorised."""
+
+    id: str
+    name: str
+    role: str
+    is_active: bool
+
+    @classmethod
+    def from_staff(cls, staff: Staff) -> "StaffIdentity":
+        return cls(id=str(staff.id), name=staff.name, role=staff.role, is_active=staff.is_active)
+
+    def to_staff(self) -> Staff:
+        """
+        Returns a Staff instance carrying only these fields, marked as loaded from the database.
+
+        It is enough to be used as a foreign key value, for permission checks and as the audit actor;
+        it must not be saved. A new instance is built for every request so none is shared between threads.
+        """
+        staff = Staff(id=uuid.UUID(self.id), name=self.name, role=self.role, is_active=self.is_active)
+        staff._state.adding = False
+        return staff
+
+
+class StaffIdentityCache:
+    """
+    In-process TTL/LRU cache of StaffIdentity keyed by staff id.
+
+    Entries live for STAFF_IDENTITY_CACHE_TTL seconds (0 disables the cache) and at most
+    STAFF_IDENTITY_CACHE_SIZE are kept, the least recently used being evicted first. Saving or deleting
+    a Staff row evicts it from this process straight away (see accounts.signals); other worker processes
+    pick the change up when their entry expires, so the TTL bounds how long a role change or deactivation
+    can go unnoticed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return settings.STAFF_IDENTITY_CACHE_TTL > 0
+
+    def get(self, staff_id) -> StaffIdentity | None:
+        key = str(staff_id)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, identity: StaffIdentity):
+        expires_at = time.monotonic() + settings.STAFF_IDENTITY_CACHE_TTL
+        with self._lock:
+            self._entries[identity.id] = (identity, expires_at)
+            self._entries.move_to_end(identity.id)
+            while len(self._entries) > settings.STAFF_IDENTITY_CACHE_SIZE:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, staff_id):
+        with self._lock:
+            self._entries.pop(str(staff_id), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+staff_identity_cache = StaffIdentityCache()
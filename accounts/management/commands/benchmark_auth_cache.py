@@ -0,0 +1,48 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from accounts.identity import staff_identity_cache
+from accounts.models import Staff
+from core.helpers.security import Security
+
+MODES = {
+    "no cache": {"STAFF_IDENTITY_CACHE_TTL": 0, "AUTH_TRUST_TOKEN_ROLE_FOR_READS": False},
+    "identity cache": {"STAFF_IDENTITY_CACHE_TTL": 60, "AUTH_TRUST_TOKEN_ROLE_FOR_READS": False},
+    "trusted role": {"STAFF_IDENTITY_CACHE_TTL": 0, "AUTH_TRUST_TOKEN_ROLE_FOR_READS": True},
+}
+
+
+class Command(BaseCommand):
+    help = "Measure request throughput through the full middleware stack with and without the staff identity cache"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=500, help="Requests per mode")
+        parser.add_argument("--path", default="/api/v1/vendors/", help="Authenticated GET endpoint to call")
+
+    def handle(self, *args, **options):
+        if not (staff := Staff.objects.filter(role=Staff.Role.ADMIN, is_active=True).first()):
+            raise CommandError("An active admin is required to call the API")
+        token = Security.create_token({"staff_id": str(staff.id), "role": staff.role})
+        client = Client(HTTP_AUTHORIZATION=f"Bearer {token}")
+        staff_table = connection.ops.quote_name(Staff._meta.db_table)
+
+        # Logging and auditing are off so the numbers show the authentication cost
+        with override_settings(ALLOWED_HOSTS=["testserver"], ENABLE_API_LOGGING=False, ENABLE_API_DB_AUDIT=False):
+            for _ in range(min(options["requests"], 20)):
+                client.get(options["path"])
+            for mode, overrides in MODES.items():
+                staff_identity_cache.clear()
+                with override_settings(**overrides), CaptureQueriesContext(connection) as context:
+                    start = time.perf_counter()
+                    for _ in range(options["requests"]):
+                        if (response := client.get(options["path"])).status_code >= 400:
+                            raise CommandError(f"{options['path']} returned {response.status_code}")
+                    elapsed = time.perf_counter() - start
+                staff_queries = sum(1 for query in context.captured_queries if f"FROM {staff_table}" in query["sql"])
+                self.stdout.write(
+                    f"{mode:>15}: {options['requests'] / elapsed:,.0f} req/s, {staff_queries} staff queries, cache {staff_identity_cache.stats()}"
+                )
@@ -0,0 +1,83 @@
+import statistics
+import threading
+import time
+from collections import Counter
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import Client
+from django.test.utils import override_settings
+
+from accounts.models import Staff
+from core.helpers.security import Security
+
+NO_THROTTLE = {"LOGIN_THROTTLE_PHONE_LIMIT": 0, "LOGIN_THROTTLE_IP_LIMIT": 0}
+
+
+class Command(BaseCommand):
+    help = "Measure order list latency while other threads hammer the login endpoint with wrong passwords"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=50, help="Order list requests measured per mode")
+        parser.add_argument("--storm-threads", type=int, default=8, help="Concurrent login attackers")
+        parser.add_argument("--storm-interval", type=float, default=0.02, help="Seconds each attacker waits between attempts (network round trip)")
+        parser.add_argument("--path", default="/api/v1/orders/?page_size=20", help="Order endpoint to time")
+
+    def handle(self, *args, **options):
+        if not (staff := Staff.objects.filter(role=Staff.Role.ADMIN, is_active=True).first()):
+            raise CommandError("An active admin is required to call the API")
+        token = Security.create_token({"staff_id": str(staff.id), "role": staff.role})
+        threads = options["storm_threads"]
+
+        modes = [
+            ("no storm", 0, {}),
+            ("storm, unbounded hashing", threads, {**NO_THROTTLE, "PASSWORD_HASH_CONCURRENCY": threads, "PASSWORD_HASH_QUEUE_TIMEOUT": 60}),
+            ("storm, bounded hashing", threads, {**NO_THROTTLE, "PASSWORD_HASH_CONCURRENCY": 1, "PASSWORD_HASH_QUEUE_TIMEOUT": 0.2}),
+            ("storm, throttled", threads, {}),
+        ]
+        with override_settings(ALLOWED_HOSTS=["testserver"], ENABLE_API_LOGGING=False, ENABLE_API_DB_AUDIT=False):
+            client = Client(HTTP_AUTHORIZATION=f"Bearer {token}")
+            client.get(options["path"])
+            for label, storm_threads, overrides in modes:
+                cache.clear()
+                with override_settings(**overrides):
+                    timings, outcomes = self._run(client, options["path"], options["requests"], storm_threads, options["storm_interval"], staff.phone)
+                quantiles = statistics.quantiles(timings, n=100)
+                storm = ", ".join(f"{status}={count}" for status, count in sorted(outcomes.items())) or "-"
+                self.stdout.write(f"{label:>25}: p50 {quantiles[49]:.1f} ms  p99 {quantiles[98]:.1f} ms  logins: {storm}")
+        cache.clear()
+
+    @staticmethod
+    def _run(client, path, requests, storm_threads, interval, phone):
+        stop = threading.Event()
+        outcomes: Counter = Counter()
+
+        def attack():
+            attacker = Client()
+            try:
+                while not stop.is_set():
+                    response = attacker.post("/api/v1/auth/login/", {"phone": phone, "password": "not-the-password"}, content_type="application/json")
+                    outcomes[response.status_code] += 1
+                    stop.wait(interval)
+            finally:
+                connections.close_all()
+
+        workers = [threading.Thread(target=attack, daemon=True) for _ in range(storm_threads)]
+        for worker in workers:
+            worker.start()
+        # Let the storm build up before measuring
+        time.sleep(0.5 if storm_threads else 0)
+
+        timings = []
+        try:
+            for _ in range(requests):
+                start = time.perf_counter()
+                if (response := client.get(path)).status_code >= 400:
+                    raise CommandError(f"{path} returned {response.status_code}")
+                timings.append((time.perf_counter() - start) * 1000)
+        finally:
+            stop.set()
+            for worker in workers:
+                worker.join()
+        return timings, outcomes
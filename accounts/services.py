@@ -1,9 +1,12 @@
+from django.conf import settings
 from django.db import transaction
 from django.utils import timezone
 
+from accounts.identity import StaffIdentity, staff_identity_cache
 from accounts.models import Customer, Staff
-from core.exceptions import Conflict, ResourceNotFound, Unauthorized
+from core.exceptions import Conflict, ResourceNotFound, TooManyRequests, Unauthorized
 from core.helpers.security import Security
+from core.helpers.throttle import SlidingWindowThrottle
 
 
 class StaffService:
@@ -25,19 +28,53 @@ class StaffService:
 
         return staff
 
+    @staticmethod
+    def login(phone, password, client_ip):
+        """
+        Authenticates a staff member by phone and password and returns (staff, token).
+        Refused with TooManyRequests while the phone has too many recent failed attempts or the
+        client IP too many recent attempts (see LOGIN_THROTTLE_*); these are checked before any bcrypt work.
+        """
+        window = settings.LOGIN_THROTTLE_WINDOW_SECONDS
+        phone_limit, ip_limit = settings.LOGIN_THROTTLE_PHONE_LIMIT, settings.LOGIN_THROTTLE_IP_LIMIT
+        if phone_limit and SlidingWindowThrottle.count("login-phone", phone, window) >= phone_limit:
+            raise TooManyRequests("Too many failed login attempts for this phone, please try again later")
+        if ip_limit and client_ip:
+            if SlidingWindowThrottle.count("login-ip", client_ip, window) >= ip_limit:
+                raise TooManyRequests("Too many login attempts, please try again later")
+            SlidingWindowThrottle.hit("login-ip", client_ip, window)
+
+        try:
+            staff = StaffService.get_staff_by_phone(phone)
+            token = StaffService.authenticate_staff_and_get_token(staff=staff, password=password)
+        except (ResourceNotFound, Unauthorized):
+            if phone_limit:
+                SlidingWindowThrottle.hit("login-phone", phone, window)
+            raise
+
+        if phone_limit:
+            SlidingWindowThrottle.reset("login-phone", phone, window)
+        return staff, token
+
     @staticmethod
     def authenticate_staff_and_get_token(staff, password):
         """
         Authenticates a staff member and returns login data.
         """
         # Verify password
-        if not Security.verify_password(password, staff.password):
+        verified, new_hash = Security.verify_and_update_password(password, staff.password)
+        if not verified:
             raise Unauthorized("Invalid phone or password")
 
         # Check if staff is active
         if not staff.is_active:
             raise Unauthorized("Account is deactivated")
 
+        # Rehash with the current bcrypt cost. A direct update, so the hash change is not audited as an edit
+        # (the instance keeps the old hash and its save below only writes last_login)
+        if new_hash:
+            Staff.objects.filter(pk=staff.pk).update(password=new_hash)
+
         # Update last login
         staff.last_login = timezone.now()
         staff.save(update_fields=["last_login"])
@@ -68,6 +105,28 @@ class StaffService:
             raise ResourceNotFound("Staff member not found")
         return staff
 
+    @staticmethod
+    def get_request_staff(staff_id, trusted_role=None):
+        """
+        Retrieves the active staff member a request is authenticated as.
+
+        The identity comes from the in-process staff identity cache when it is enabled, so most requests
+        do not read the staff row. When trusted_role (the token's role claim) is given and the staff member
+        is not cached, the identity is built from the token alone without reading the row.
+        """
+        if not staff_identity_cache.is_enabled() and not trusted_role:
+            return StaffService.get_staff_by_id(staff_id)
+
+        if staff_identity_cache.is_enabled() and (identity := staff_identity_cache.get(staff_id)):
+            return identity.to_staff()
+
+        if trusted_role:
+            return StaffIdentity(id=str(staff_id), name="", role=trusted_role, is_active=True).to_staff()
+
+        staff = StaffService.get_staff_by_id(staff_id)
+        staff_identity_cache.set(StaffIdentity.from_staff(staff))
+        return staff
+
     @staticmethod
     def get_staffs():
         """
@@ -0,0 +1,14 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from accounts.identity import staff_identity_cache
+from accounts.models import Staff
+from core.helpers.security import verified_token_cache
+
+
+@receiver(post_save, sender=Staff)
+@receiver(post_delete, sender=Staff)
+def _invalidate_staff_auth(sender, instance, **kwargs):
+    # A saved staff member (deactivated, role changed, ...) re-authenticates from the row and a fresh token check
+    staff_identity_cache.invalidate(instance.pk)
+    verified_token_cache.revoke_staff(instance.pk)
@@ -9,7 +9,7 @@ from accounts.serializers import (
     StaffQueryParams,
 )
 from accounts.services import CustomerService, StaffService
-from core.authorization import AuthorizationService, Permission, require_permission
+from core.authorization import AuthorizationService, Permission, allow_authenticated, allow_public, require_permission
 from core.decorators import forge
 from core.helpers.pagination import PaginationHelper
 from core.utils import model_unwrap
@@ -33,12 +33,13 @@ class RegisterView(APIView):
 
 class LoginView(APIView):
     @forge
+    @allow_public
     def post(self, request):
         body = LoginSerializer.validate_request(request)
 
-        staff = StaffService.get_staff_by_phone(body.get_value("phone"))
-
-        token = StaffService.authenticate_staff_and_get_token(staff=staff, password=body.get_value("password"))
+        # X-Real-IP is set by nginx from the connection, so unlike X-Forwarded-For it cannot be supplied by the client
+        client_ip = request.META.get("HTTP_X_REAL_IP") or request.META.get("REMOTE_ADDR")
+        staff, token = StaffService.login(body.get_value("phone"), body.get_value("password"), client_ip)
 
         return {"message": "Login successful", "token": token, "role": staff.role}
 
@@ -58,7 +59,13 @@ class CustomerView(APIView):
             return model_unwrap(customer)
 
         customers = CustomerService.get_all_customers()
-        customers, page_info = PaginationHelper.paginate_queryset(customers, params.get_value("page"), params.get_value("page_size"))
+        customers, page_info = PaginationHelper.paginate_queryset(
+            customers,
+            params.get_value("page"),
+            params.get_value("page_size"),
+            cursor=params.get_value("cursor", None),
+            with_total=params.get_value("with_total"),
+        )
         return [model_unwrap(customer) for customer in customers], page_info
 
     @forge
@@ -101,7 +108,13 @@ class StaffView(APIView):
     def get(self, request):
         params = StaffQueryParams.validate_params(request)
         staff_queryset = StaffService.get_staffs()
-        staff_page, page_info = PaginationHelper.paginate_queryset(staff_queryset, params.get_value("page"), params.get_value("page_size"))
+        staff_page, page_info = PaginationHelper.paginate_queryset(
+            staff_queryset,
+            params.get_value("page"),
+            params.get_value("page_size"),
+            cursor=params.get_value("cursor", None),
+            with_total=params.get_value("with_total"),
+        )
         return (
             model_unwrap(
                 staff_page,
@@ -123,6 +136,7 @@ class CurrentStaffPermissionsView(APIView):
     """API to get current staff member's permissions"""
 
     @forge
+    @allow_authenticated
     def get(self, request):
         """Get current staff member's permissions"""
         # Get the current staff from request (set by auth middleware)
@@ -141,11 +155,15 @@ class MeView(APIView):
     """Return the authenticated staff's profile"""
 
     @forge
+    @allow_authenticated
     def get(self, request):
         staff = getattr(request, "staff", None)
         if not staff:
             return {"error": "No authenticated staff found"}, 401
 
+        # request.staff may be a cached identity carrying only id/name/role, so the profile is read from the row
+        staff = StaffService.get_staff_by_id(staff.id)
+
         # Return a concise profile; exclude password and timestamps by default
         data = model_unwrap(
             staff,
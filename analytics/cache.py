@@ -0,0 +1,126 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from analytics.constants import AnalyticsType
+
+CACHE_PREFIX = "analytics"
+_MISSING = object()
+
+# Models each cached section is derived from; a write to any of them invalidates the section
+_ORDER_GRAPH = {"orders.Order", "orders.OrderItem", "orders.ServiceOrderItem", "production.PrintingJob", "production.BoxOrder"}
+_PROFIT_INPUTS = _ORDER_GRAPH | {"orders.Bill", "orders.BillAdjustment", "inventory.Card", "inventory.InventoryTransaction"}
+
+SECTION_DEPENDENCIES: dict[str, set[str]] = {
+    # Dashboard sections (see DashboardService.SECTIONS)
+    "stock": {"inventory.Card"},
+    "orders": {"orders.Order"},
+    "bills": {"orders.Bill"},
+    "profit": _PROFIT_INPUTS,
+    "sales": _ORDER_GRAPH,
+    "production": {"production.PrintingJob", "production.BoxOrder"},
+    # Detailed analytics types
+    AnalyticsType.YEARLY_PROFIT.value: _PROFIT_INPUTS,
+    AnalyticsType.YEARLY_SALE.value: _ORDER_GRAPH,
+    AnalyticsType.LOW_STOCK_CARDS.value: {"inventory.Card", "inventory.Vendor"},
+    AnalyticsType.MEDIUM_STOCK_CARDS.value: {"inventory.Card", "inventory.Vendor"},
+    AnalyticsType.OUT_OF_STOCK_CARDS.value: {"inventory.Card", "inventory.Vendor"},
+    AnalyticsType.PENDING_ORDERS.value: _ORDER_GRAPH | {"orders.Bill", "accounts.Customer"},
+    AnalyticsType.TODAYS_ORDERS.value: _ORDER_GRAPH | {"orders.Bill", "accounts.Customer"},
+    AnalyticsType.PENDING_BILLS.value: _PROFIT_INPUTS | {"orders.Payment", "accounts.Customer"},
+    AnalyticsType.PENDING_PRINTING_JOBS.value: {"production.PrintingJob", "production.Printer", "production.TracingStudio"},
+    AnalyticsType.PENDING_BOX_JOBS.value: {"production.BoxOrder", "production.BoxMaker"},
+}
+
+MODEL_SECTIONS: dict[str, set[str]] = {}
+for _section, _models in SECTION_DEPENDENCIES.items():
+    for _label in _models:
+        MODEL_SECTIONS.setdefault(_label, set()).add(_section)
+
+
+def _generation_key(section: str) -> str:
+    return f"{CACHE_PREFIX}:gen:{section}"
+
+
+def _data_key(section: str, suffix: str, generation) -> str:
+    # The local date is part of the key so day-relative figures ("today", "this month") roll over at midnight
+    return f"{CACHE_PREFIX}:data:{section}:{suffix}:{timezone.localdate().isoformat()}:{generation}"
+
+
+def is_enabled() -> bool:
+    return settings.ANALYTICS_CACHE_TTL > 0
+
+
+def _generations(sections) -> dict:
+    keys = {section: _generation_key(section) for section in sections}
+    stored = cache.get_many(keys.values())
+    return {section: stored.get(key, 0) for section, key in keys.items()}
+
+
+def get_many(sections, suffix: str = "") -> dict:
+    """Returns {section: value} for the sections currently cached."""
+    if not is_enabled():
+        return {}
+    generations = _generations(sections)
+    keys = {_data_key(section, suffix, generation): section for section, generation in generations.items()}
+    return {keys[key]: value for key, value in cache.get_many(keys.keys()).items()}
+
+
+def get_or_compute(section: str, compute, suffix: str = ""):
+    """
+    Returns the cached value for a section, computing and storing it on a miss.
+    Only one caller recomputes a given key at a time (single-flight): the others wait for
+    its result for up to ANALYTICS_CACHE_LOCK_TIMEOUT seconds before computing it themselves.
+    """
+    if not is_enabled():
+        return compute()
+
+    # Resolve the generation up front so a result computed across an invalidation is stored under the old key
+    key = _data_key(section, suffix, _generations([section])[section])
+    value = cache.get(key, _MISSING)
+    if value is not _MISSING:
+        return value
+
+    lock_key = f"{key}:lock"
+    lock_timeout = settings.ANALYTICS_CACHE_LOCK_TIMEOUT
+    if cache.add(lock_key, 1, lock_timeout):
+        try:
+            value = compute()
+            cache.set(key, value, settings.ANALYTICS_CACHE_TTL)
+        finally:
+            cache.delete(lock_key)
+        return value
+
+    deadline = time.monotonic() + lock_timeout
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        value = cache.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        if cache.get(lock_key) is None:
+            # The computing caller finished without storing a value (e.g. it raised)
+            break
+    return compute()
+
+
+def invalidate_sections(sections) -> None:
+    if not sections:
+        return
+    token = time.time_ns()
+    cache.set_many({_generation_key(section): token for section in sections}, None)
+
+
+def invalidate_models(*model_labels: str) -> None:
+    """
+    Invalidates every section derived from the given models once the current transaction commits.
+    Signal receivers call this for regular saves/deletes; code that writes through queryset.update()
+    or bulk_create() must call it itself.
+    """
+    sections = set()
+    for label in model_labels:
+        sections |= MODEL_SECTIONS.get(label, set())
+    if sections:
+        transaction.on_commit(lambda: invalidate_sections(sections))
@@ -0,0 +1,59 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from dateutil.relativedelta import relativedelta  # type: ignore
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from analytics.services import AnalyticsService, OrderAnalyticsService
+from orders.services import OrderService
+
+CENT = Decimal("0.01")
+
+
+class Command(BaseCommand):
+    help = "Compare the set-based monthly profit engine with the per-order Python profit calculation"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--months", type=int, default=12, help="Number of months to check, counting back from the current one")
+
+    def handle(self, *args, **options):
+        current_month_start = timezone.now().date().replace(day=1)
+        mismatches = 0
+
+        for i in range(max(options["months"], 1)):
+            start_of_month = current_month_start - relativedelta(months=i)
+            end_of_month = start_of_month + relativedelta(months=1) - timedelta(days=1)
+            month_key = start_of_month.strftime("%Y-%m")
+
+            engine = AnalyticsService._calculate_profit_by_month(start_of_month, end_of_month).get(
+                month_key, {"profit": Decimal("0.0"), "orders_pending_expense_logging": 0}
+            )
+            expected = self._python_profit(start_of_month, end_of_month)
+
+            # Compared at cent precision: backends without a native decimal type (SQLite) sum through floats.
+            profit_matches = engine["profit"].quantize(CENT) == expected["profit"].quantize(CENT)
+            if not profit_matches or engine["orders_pending_expense_logging"] != expected["orders_pending_expense_logging"]:
+                mismatches += 1
+                self.stderr.write(
+                    f"{month_key}: engine profit={engine['profit']} pending={engine['orders_pending_expense_logging']}, "
+                    f"python profit={expected['profit']} pending={expected['orders_pending_expense_logging']}"
+                )
+            else:
+                self.stdout.write(f"{month_key}: profit={engine['profit']:.2f} pending={engine['orders_pending_expense_logging']} OK")
+
+        if mismatches:
+            raise CommandError(f"{mismatches} month(s) differ between the profit engine and the Python calculation")
+        self.stdout.write(self.style.SUCCESS("Profit engine matches the Python calculation"))
+
+    @staticmethod
+    def _python_profit(start_date, end_date):
+        total_profit = Decimal("0.0")
+        pending_orders_count = 0
+        for order in OrderService.get_orders_queryset().filter(order_date__date__range=[start_date, end_date]):
+            profit = OrderAnalyticsService.calculate_order_profit(order)
+            if profit is None:
+                pending_orders_count += 1
+            else:
+                total_profit += profit
+        return {"profit": total_profit, "orders_pending_expense_logging": pending_orders_count}
@@ -7,3 +7,8 @@ from core.helpers.param_serializer import ParamSerializer
 class DetailedAnalyticsParams(ParamSerializer):
     type = serializers.ChoiceField(choices=AnalyticsType.choices, required=True)
     days = serializers.IntegerField(min_value=1, max_value=5, required=False, default=1)
+
+
+class DashboardParams(ParamSerializer):
+    debug = serializers.BooleanField(required=False, default=False)
+    parallel = serializers.BooleanField(required=False, allow_null=True, default=None)
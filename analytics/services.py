@@ -1,12 +1,17 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 from decimal import Decimal
 
 from dateutil.relativedelta import relativedelta  # type: ignore
 from django.conf import settings
-from django.db.models import Count, DecimalField, ExpressionWrapper, F, Max, Min, OuterRef, Q, Subquery, Sum
+from django.db import connections
+from django.db.models import Count, DecimalField, Exists, ExpressionWrapper, F, Max, Min, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce, TruncMonth
 from django.utils import timezone
 
-from core.constants import PRICE_DECIMAL_PLACES
+from analytics import cache as analytics_cache
+from core.constants import PRICE_DECIMAL_PLACES, TOTAL_MAX_DIGITS
 from inventory.models import Card, InventoryTransaction
 from orders.models import Bill, BillAdjustment, Order, OrderItem, ServiceOrderItem
 from orders.services import OrderService
@@ -15,62 +20,108 @@ from production.models import BoxOrder, PrintingJob
 
 class AnalyticsService:
     @staticmethod
-    def get_low_stock_items():
-        return Card.objects.filter(quantity__gt=settings.OUT_OF_STOCK_THRESHOLD, quantity__lte=settings.LOW_STOCK_THRESHOLD, is_active=True).count()
-
-    @staticmethod
-    def get_out_of_stock_items():
-        return Card.objects.filter(quantity__lte=settings.OUT_OF_STOCK_THRESHOLD, is_active=True).count()
+    def get_pending_orders():
+        return Order.objects.exclude(order_status__in=[Order.OrderStatus.DELIVERED, Order.OrderStatus.FULLY_PAID]).count()
 
     @staticmethod
-    def get_medium_stock_items():
-        return Card.objects.filter(
-            quantity__gt=settings.LOW_STOCK_THRESHOLD,
-            quantity__lte=settings.MEDIUM_STOCK_THRESHOLD,
-            is_active=True,
-        ).count()
+    def get_todays_orders(today: date):
+        return Order.objects.filter(order_date__date=today).count()
 
     @staticmethod
-    def get_total_orders_current_month():
-        today = timezone.now().date()
-        start_of_month = today.replace(day=1)
-        # To get the end of the month, we can find the first day of the next month and subtract one day.
-        next_month_start = (start_of_month.replace(day=28) + timedelta(days=4)).replace(day=1)
-        end_of_month = next_month_start - timedelta(days=1)
-        return Order.objects.filter(order_date__date__range=[start_of_month, end_of_month]).count()
+    def get_pending_bills_count():
+        return Bill.objects.filter(Q(payment_status=Bill.PaymentStatus.PENDING) | Q(payment_status=Bill.PaymentStatus.PARTIAL)).count()
 
     @staticmethod
-    def get_monthly_order_change():
-        today = timezone.now().date()
-
-        # Current month orders
-        current_month_start = today.replace(day=1)
-        next_month_start = (current_month_start.replace(day=28) + timedelta(days=4)).replace(day=1)
-        current_month_end = next_month_start - timedelta(days=1)
-        current_month_orders = Order.objects.filter(order_date__date__range=[current_month_start, current_month_end]).count()
-
-        # Previous month orders
-        prev_month_end = current_month_start - timedelta(days=1)
-        prev_month_start = prev_month_end.replace(day=1)
-        previous_month_orders = Order.objects.filter(order_date__date__range=[prev_month_start, prev_month_end]).count()
-
-        if previous_month_orders == 0:
-            return 100.0 if current_month_orders > 0 else 0.0
-
-        change = ((current_month_orders - previous_month_orders) / previous_month_orders) * 100
-        return round(change, 2)
+    def _pending_expense_condition():
+        """
+        Matches orders that still have production/service expenses to log.
+        Same readiness rules as OrderAnalyticsService.calculate_order_profit.
+        """
+        return (
+            Exists(
+                PrintingJob.objects.filter(order_item__order_id=OuterRef("pk"), order_item__requires_printing=True).filter(
+                    Q(total_printing_expense__isnull=True) | Q(total_tracing_expense__isnull=True)
+                )
+            )
+            | Exists(BoxOrder.objects.filter(order_item__order_id=OuterRef("pk"), order_item__requires_box=True, total_box_expense__isnull=True))
+            | Exists(ServiceOrderItem.objects.filter(order_id=OuterRef("pk"), total_expense__isnull=True))
+        )
 
     @staticmethod
-    def get_pending_orders():
-        return Order.objects.exclude(order_status__in=[Order.OrderStatus.DELIVERED, Order.OrderStatus.FULLY_PAID]).count()
+    def _sum_by_month(queryset, order_date_field, expression):
+        money_field = DecimalField(max_digits=TOTAL_MAX_DIGITS, decimal_places=PRICE_DECIMAL_PLACES)
+        rows = (
+            queryset.order_by()
+            .annotate(month=TruncMonth(order_date_field))
+            .values("month")
+            .annotate(total=Sum(ExpressionWrapper(expression, output_field=money_field)))
+        )
+        return {row["month"].strftime("%Y-%m"): row["total"] or Decimal("0.0") for row in rows}
 
     @staticmethod
-    def get_todays_orders(today: date):
-        return Order.objects.filter(order_date__date=today).count()
+    def _calculate_profit_by_month(start_date, end_date):
+        """
+        Set-based version of the per-order profit rules, grouped by the calendar month of order_date.
+        Instead of loading every order graph, it runs one aggregate query per table:
+        - orders still pending expense logging are counted and excluded from profit
+        - card items: (price_per_item - discount_amount - sale-time cost_price) * quantity
+        - printing jobs, box orders and service items: charged amount minus logged expenses
+        - bill adjustments are subtracted
+        Returns {"YYYY-MM": {"profit": Decimal, "orders_pending_expense_logging": int}} for months that have orders.
+        """
+        period_orders = Order.objects.filter(order_date__date__range=[start_date, end_date])
+        pending_condition = AnalyticsService._pending_expense_condition()
+        ready_orders = period_orders.exclude(pending_condition).values("id")
 
-    @staticmethod
-    def get_pending_bills_count():
-        return Bill.objects.filter(Q(payment_status=Bill.PaymentStatus.PENDING) | Q(payment_status=Bill.PaymentStatus.PARTIAL)).count()
+        pending_rows = (
+            period_orders.filter(pending_condition).order_by().annotate(month=TruncMonth("order_date")).values("month").annotate(count=Count("id"))
+        )
+        order_months = period_orders.order_by().annotate(month=TruncMonth("order_date")).values_list("month", flat=True).distinct()
+
+        # Cost captured on the SALE transaction, falling back to the card's current cost price
+        sale_cost_price = Coalesce(
+            Subquery(
+                InventoryTransaction.objects.filter(order_item_id=OuterRef("pk"), transaction_type=InventoryTransaction.TransactionType.SALE)
+                .order_by("created_at")
+                .values("cost_price")[:1]
+            ),
+            F("card__cost_price"),
+        )
+        sum_by_month = AnalyticsService._sum_by_month
+        profit_parts = [
+            sum_by_month(
+                OrderItem.objects.filter(order_id__in=ready_orders),
+                "order__order_date",
+                (F("price_per_item") - F("discount_amount") - sale_cost_price) * F("quantity"),
+            ),
+            sum_by_month(
+                PrintingJob.objects.filter(order_item__order_id__in=ready_orders),
+                "order_item__order__order_date",
+                F("total_printing_cost") - (F("total_printing_expense") + F("total_tracing_expense")),
+            ),
+            sum_by_month(
+                BoxOrder.objects.filter(order_item__order_id__in=ready_orders),
+                "order_item__order__order_date",
+                F("total_box_cost") - F("total_box_expense"),
+            ),
+            sum_by_month(
+                ServiceOrderItem.objects.filter(order_id__in=ready_orders),
+                "order__order_date",
+                F("total_cost") - F("total_expense"),
+            ),
+        ]
+        adjustments = sum_by_month(BillAdjustment.objects.filter(bill__order_id__in=ready_orders), "bill__order__order_date", F("amount"))
+
+        results = {month.strftime("%Y-%m"): {"profit": Decimal("0.0"), "orders_pending_expense_logging": 0} for month in order_months}
+        for row in pending_rows:
+            results[row["month"].strftime("%Y-%m")]["orders_pending_expense_logging"] = row["count"]
+        for part in profit_parts:
+            for month, total in part.items():
+                results[month]["profit"] += total
+        for month, total in adjustments.items():
+            results[month]["profit"] -= total
+
+        return results
 
     @staticmethod
     def _calculate_profit_for_period(start_date, end_date):
@@ -78,87 +129,11 @@ class AnalyticsService:
         A helper method to calculate gross profit and pending orders for a specific time period.
         It checks if all production expenses have been logged before including an order in the calculation.
         """
-        # Get all orders created in the specified period
-        period_orders_qs = Order.objects.filter(order_date__date__range=[start_date, end_date]).prefetch_related(
-            "order_items__card",
-            "order_items__printing_jobs",
-            "order_items__box_orders",
-            "order_items__inventory_transactions",
-            "service_items",
-        )
-        period_orders = list(period_orders_qs)
-
-        # Pre-compute adjustments per order to reflect actual money generated (exclude adjustments)
-        order_ids = [o.id for o in period_orders]
-        adjustments_map: dict[str, Decimal] = {}
-        if order_ids:
-            adj_rows = BillAdjustment.objects.filter(bill__order_id__in=order_ids).values("bill__order_id").annotate(total=Sum("amount"))
-            for row in adj_rows:
-                adjustments_map[str(row["bill__order_id"])] = row["total"] or Decimal("0.0")
-
         total_profit = Decimal("0.0")
         pending_orders_count = 0
-
-        for order in period_orders:
-            is_ready_for_calculation = True
-            current_order_profit = Decimal("0.0")
-
-            for item in order.order_items.all():
-                # Check if all required expenses are logged
-                if item.requires_printing:
-                    for job in item.printing_jobs.all():
-                        if job.total_printing_expense is None or job.total_tracing_expense is None:
-                            is_ready_for_calculation = False
-                            break
-                if not is_ready_for_calculation:
-                    break
-
-                if item.requires_box:
-                    for box in item.box_orders.all():
-                        if box.total_box_expense is None:
-                            is_ready_for_calculation = False
-                            break
-                if not is_ready_for_calculation:
-                    break
-
-                # If ready, calculate profit for this item using transaction-linked cost when available
-                inventory_transactions = getattr(item, "inventory_transactions", None)
-                if inventory_transactions and hasattr(inventory_transactions, "all"):
-                    transactions = inventory_transactions.all()
-                else:
-                    transactions = []
-
-                sale_tx = next(
-                    (tx for tx in transactions if tx.transaction_type == InventoryTransaction.TransactionType.SALE),
-                    None,
-                )
-                effective_cost_price = sale_tx.cost_price if sale_tx else item.card.cost_price
-                card_sale_profit = (item.price_per_item - item.discount_amount - effective_cost_price) * item.quantity
-                current_order_profit += card_sale_profit
-
-                for job in item.printing_jobs.all():
-                    current_order_profit += job.total_printing_cost - (job.total_printing_expense + job.total_tracing_expense)
-
-                for box in item.box_orders.all():
-                    current_order_profit += box.total_box_cost - box.total_box_expense
-
-            if not is_ready_for_calculation:
-                pending_orders_count += 1
-                continue
-
-            # Include third-party service items (must have total_expense to finalize)
-            for s_item in order.service_items.all():
-                if s_item.total_expense is None:
-                    is_ready_for_calculation = False
-                    break
-                current_order_profit += s_item.total_cost - s_item.total_expense
-
-            if is_ready_for_calculation:
-                # Subtract any bill adjustments tied to this order's bill
-                order_adjustments = adjustments_map.get(str(order.id), Decimal("0.0"))
-                total_profit += current_order_profit - order_adjustments
-            else:
-                pending_orders_count += 1
+        for month_data in AnalyticsService._calculate_profit_by_month(start_date, end_date).values():
+            total_profit += month_data["profit"]
+            pending_orders_count += month_data["orders_pending_expense_logging"]
 
         return {"profit": total_profit, "orders_pending_expense_logging": pending_orders_count}
 
@@ -194,20 +169,20 @@ class AnalyticsService:
         This is perfect for powering a year-over-year profit chart.
         """
         today = timezone.now().date()
-        yearly_data = []
-        for i in range(12):
-            # Calculate start and end date for each of the last 12 months
-            month_date = today - relativedelta(months=i)
-            start_of_month = month_date.replace(day=1)
-            next_month_start = (start_of_month.replace(day=28) + timedelta(days=4)).replace(day=1)
-            end_of_month = next_month_start - timedelta(days=1)
+        current_month_start = today.replace(day=1)
+        next_month_start = (current_month_start.replace(day=28) + timedelta(days=4)).replace(day=1)
+        first_month_start = current_month_start - relativedelta(months=11)
 
-            # Use the helper function to calculate profit for that month
-            profit_data = AnalyticsService._calculate_profit_for_period(start_of_month, end_of_month)
+        # One grouped calculation for the whole window instead of one per month
+        profit_by_month = AnalyticsService._calculate_profit_by_month(first_month_start, next_month_start - timedelta(days=1))
 
-            yearly_data.append({"month": start_of_month.strftime("%Y-%m"), "profit": f"{profit_data['profit']:.2f}"})
+        yearly_data = []
+        for i in range(11, -1, -1):  # Oldest month first
+            month_key = (current_month_start - relativedelta(months=i)).strftime("%Y-%m")
+            profit = profit_by_month.get(month_key, {}).get("profit", Decimal("0.0"))
+            yearly_data.append({"month": month_key, "profit": f"{profit:.2f}"})
 
-        return yearly_data[::-1]  # Reverse to get oldest month first
+        return yearly_data
 
     @staticmethod
     def _calculate_sales_for_period(start_date, end_date):
@@ -221,7 +196,7 @@ class AnalyticsService:
         # Items revenue
         item_revenue_expr = ExpressionWrapper(
             (F("price_per_item") - F("discount_amount")) * F("quantity"),
-            output_field=DecimalField(max_digits=18, decimal_places=PRICE_DECIMAL_PLACES),
+            output_field=DecimalField(max_digits=TOTAL_MAX_DIGITS, decimal_places=PRICE_DECIMAL_PLACES),
         )
         items_total = OrderItem.objects.filter(order__order_date__date__range=[start_date, end_date]).aggregate(total=Sum(item_revenue_expr)).get(
             "total"
@@ -271,12 +246,6 @@ class AnalyticsService:
 
         return yearly_data[::-1]
 
-    @staticmethod
-    def get_pending_production_counts():
-        pending_printing = PrintingJob.objects.exclude(printing_status=PrintingJob.PrintingStatus.COMPLETED).count()
-        pending_boxing = BoxOrder.objects.exclude(box_status=BoxOrder.BoxStatus.COMPLETED).count()
-        return pending_printing, pending_boxing
-
     @staticmethod
     def get_low_stock_cards_list():
         return Card.objects.filter(
@@ -305,7 +274,7 @@ class AnalyticsService:
     def get_pending_bills_list():
         return (
             Bill.objects.filter(Q(payment_status=Bill.PaymentStatus.PENDING) | Q(payment_status=Bill.PaymentStatus.PARTIAL))
-            .select_related("order", "order__customer")
+            .select_related("order", "order__customer", "order__financials")
             .order_by("-created_at")
         )
 
@@ -331,13 +300,140 @@ class AnalyticsService:
         offset_days = max(days, 1) - 1
         target_date = today - timedelta(days=offset_days)
 
-        return (
-            OrderService.get_orders_queryset()
-            .select_related("bill")
-            .filter(order_date__date=target_date)
-            .order_by("-order_date")
+        return OrderService.get_orders_queryset().filter(order_date__date=target_date).order_by("-order_date")
+
+
+class DashboardService:
+    """
+    Builds the dashboard in a handful of grouped queries instead of one query per figure.
+    Each section is independent, so sections can run concurrently on a small thread pool;
+    Django gives every worker thread its own database connection.
+    """
+
+    @staticmethod
+    def _stock_section():
+        out_of_stock = Q(quantity__lte=settings.OUT_OF_STOCK_THRESHOLD)
+        low_stock = Q(quantity__gt=settings.OUT_OF_STOCK_THRESHOLD, quantity__lte=settings.LOW_STOCK_THRESHOLD)
+        medium_stock = Q(quantity__gt=settings.LOW_STOCK_THRESHOLD, quantity__lte=settings.MEDIUM_STOCK_THRESHOLD)
+        return Card.objects.filter(is_active=True).aggregate(
+            low_stock_items=Count("id", filter=low_stock),
+            out_of_stock_items=Count("id", filter=out_of_stock),
+            medium_stock_items=Count("id", filter=medium_stock),
         )
 
+    @staticmethod
+    def _orders_section():
+        today = timezone.now().date()
+        current_month_start = today.replace(day=1)
+        next_month_start = (current_month_start.replace(day=28) + timedelta(days=4)).replace(day=1)
+        current_month_end = next_month_start - timedelta(days=1)
+        prev_month_end = current_month_start - timedelta(days=1)
+        prev_month_start = prev_month_end.replace(day=1)
+
+        counts = Order.objects.aggregate(
+            current_month=Count("id", filter=Q(order_date__date__range=[current_month_start, current_month_end])),
+            previous_month=Count("id", filter=Q(order_date__date__range=[prev_month_start, prev_month_end])),
+            pending=Count("id", filter=~Q(order_status__in=[Order.OrderStatus.DELIVERED, Order.OrderStatus.FULLY_PAID])),
+            today=Count("id", filter=Q(order_date__date=today)),
+        )
+
+        current_month_orders, previous_month_orders = counts["current_month"], counts["previous_month"]
+        if previous_month_orders == 0:
+            change = 100.0 if current_month_orders > 0 else 0.0
+        else:
+            change = round(((current_month_orders - previous_month_orders) / previous_month_orders) * 100, 2)
+
+        return {
+            "total_orders_current_month": current_month_orders,
+            "monthly_order_change_percentage": change,
+            "pending_orders": counts["pending"],
+            "todays_orders": counts["today"],
+        }
+
+    @staticmethod
+    def _bills_section():
+        return {"pending_bills": AnalyticsService.get_pending_bills_count()}
+
+    @staticmethod
+    def _production_section():
+        printing = PrintingJob.objects.aggregate(pending=Count("id", filter=~Q(printing_status=PrintingJob.PrintingStatus.COMPLETED)))
+        boxing = BoxOrder.objects.aggregate(pending=Count("id", filter=~Q(box_status=BoxOrder.BoxStatus.COMPLETED)))
+        return {"pending_printing_jobs": printing["pending"], "pending_box_jobs": boxing["pending"]}
+
+    @staticmethod
+    def _profit_section():
+        profit_analysis = AnalyticsService.get_monthly_profit_analysis()
+        return {
+            "monthly_profit": f"{profit_analysis['monthly_profit']:.2f}",
+            "orders_pending_expense_logging": profit_analysis["orders_pending_expense_logging"],
+        }
+
+    @staticmethod
+    def _sales_section():
+        return {"total_sale_current_month": f"{AnalyticsService.get_monthly_total_sale():.2f}"}
+
+    SECTIONS = {
+        "stock": _stock_section,
+        "orders": _orders_section,
+        "bills": _bills_section,
+        "profit": _profit_section,
+        "sales": _sales_section,
+        "production": _production_section,
+    }
+
+    @staticmethod
+    def _timed(section_fn, close_connections=False):
+        started = time.perf_counter()
+        try:
+            return section_fn(), (time.perf_counter() - started) * 1000
+        finally:
+            if close_connections:
+                # Worker threads open their own connections; release them instead of leaking one per thread
+                connections.close_all()
+
+    @staticmethod
+    def compute_sections(section_names, parallel: bool | None = None):
+        """
+        Returns ({section: data}, {section: elapsed_ms}) for the named sections.
+        Sections are served from the analytics cache when possible; only the missing ones are
+        computed (and timed), concurrently when parallel is set (default: settings.DASHBOARD_PARALLEL_QUERIES).
+        """
+        if parallel is None:
+            parallel = settings.DASHBOARD_PARALLEL_QUERIES
+        data = analytics_cache.get_many(section_names)
+        section_fns = {
+            name: (lambda name=name: analytics_cache.get_or_compute(name, DashboardService.SECTIONS[name]))
+            for name in section_names
+            if name not in data
+        }
+
+        if parallel and len(section_fns) > 1:
+            max_workers = max(1, min(settings.DASHBOARD_MAX_WORKERS, len(section_fns)))
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dashboard") as executor:
+                futures = {name: executor.submit(DashboardService._timed, fn, True) for name, fn in section_fns.items()}
+                results = {name: future.result() for name, future in futures.items()}
+        else:
+            results = {name: DashboardService._timed(fn) for name, fn in section_fns.items()}
+
+        data.update({name: result[0] for name, result in results.items()})
+        timings = {name: round(result[1], 2) for name, result in results.items()}
+        return {name: data[name] for name in section_names}, timings
+
+    @staticmethod
+    def get_dashboard(parallel: bool | None = None, include_timings: bool = False):
+        started = time.perf_counter()
+        section_names = list(DashboardService.SECTIONS)
+        sections, timings = DashboardService.compute_sections(section_names, parallel=parallel)
+
+        dashboard = {}
+        for section_data in sections.values():
+            dashboard.update(section_data)
+
+        if include_timings:
+            dashboard["timings_ms"] = {**timings, "total": round((time.perf_counter() - started) * 1000, 2)}
+            dashboard["cached_sections"] = [name for name in section_names if name not in timings]
+        return dashboard
+
 
 class CardAnalyticsService:
     """Per-card business analytics and summary statistics."""
@@ -407,15 +503,15 @@ class CardAnalyticsService:
         # Aggregations for core metrics
         revenue_expr = ExpressionWrapper(
             (F("price_per_item") - F("discount_amount")) * F("quantity"),
-            output_field=DecimalField(max_digits=18, decimal_places=PRICE_DECIMAL_PLACES),
+            output_field=DecimalField(max_digits=TOTAL_MAX_DIGITS, decimal_places=PRICE_DECIMAL_PLACES),
         )
         cost_expr = ExpressionWrapper(
             F("quantity") * F("sale_cost_price"),
-            output_field=DecimalField(max_digits=18, decimal_places=PRICE_DECIMAL_PLACES),
+            output_field=DecimalField(max_digits=TOTAL_MAX_DIGITS, decimal_places=PRICE_DECIMAL_PLACES),
         )
         discount_total_expr = ExpressionWrapper(
             F("discount_amount") * F("quantity"),
-            output_field=DecimalField(max_digits=18, decimal_places=PRICE_DECIMAL_PLACES),
+            output_field=DecimalField(max_digits=TOTAL_MAX_DIGITS, decimal_places=PRICE_DECIMAL_PLACES),
         )
 
         aggregates = annotated_items.aggregate(
@@ -440,7 +536,7 @@ class CardAnalyticsService:
         # Weighted average discount rate relative to list price
         price_total_expr = ExpressionWrapper(
             F("price_per_item") * F("quantity"),
-            output_field=DecimalField(max_digits=18, decimal_places=PRICE_DECIMAL_PLACES),
+            output_field=DecimalField(max_digits=TOTAL_MAX_DIGITS, decimal_places=PRICE_DECIMAL_PLACES),
         )
         price_total = annotated_items.aggregate(total=Sum(price_total_expr)).get("total") or Decimal("0.00")
         avg_discount_rate = (discount_total / price_total) if price_total > 0 else Decimal("0.00")
@@ -500,6 +596,40 @@ class OrderAnalyticsService:
 
     @staticmethod
     def calculate_order_profit(order: Order) -> Decimal | None:
+        return OrderAnalyticsService.calculate_order_profits([order])[order.id]
+
+    @staticmethod
+    def calculate_order_profits(orders) -> dict:
+        """
+        Returns {order_id: profit or None} for a page of orders.
+
+        Items, printing jobs, box orders, inventory transactions and service items are read from the
+        orders' prefetched relations (see OrderService.get_orders_queryset); bill adjustments for the
+        whole page come from a single grouped aggregate.
+        """
+        orders = list(orders)
+        if not orders:
+            return {}
+
+        adjustments = dict(
+            BillAdjustment.objects.filter(bill__order_id__in=[order.id for order in orders])
+            .order_by()
+            .values("bill__order_id")
+            .annotate(total=Sum("amount"))
+            .values_list("bill__order_id", "total")
+        )
+
+        profits = {}
+        for order in orders:
+            profit = OrderAnalyticsService._profit_before_adjustments(order)
+            if profit is not None:
+                # Subtract any bill adjustments tied to this order's bill
+                profit -= adjustments.get(order.id) or Decimal("0.0")
+            profits[order.id] = profit
+        return profits
+
+    @staticmethod
+    def _profit_before_adjustments(order: Order) -> Decimal | None:
         # Guard: ensure all required production expenses are logged
         is_ready_for_calculation = True
         current_order_profit = Decimal("0.0")
@@ -557,10 +687,6 @@ class OrderAnalyticsService:
                 return None
             current_order_profit += s_item.total_cost - s_item.total_expense
 
-        # Subtract any bill adjustments tied to this order's bill
-        order_adjustments = BillAdjustment.objects.filter(bill__order_id=order.id).aggregate(total=Sum("amount")).get("total") or Decimal("0.0")
-        current_order_profit -= order_adjustments
-
         return current_order_profit
 
     @staticmethod
@@ -0,0 +1,16 @@
+from django.db.models.signals import post_save, pre_delete
+from django.dispatch import receiver
+
+from analytics.cache import MODEL_SECTIONS, invalidate_models
+
+
+@receiver(post_save)
+def _invalidate_analytics_on_save(sender, instance, **kwargs):
+    if sender._meta.label in MODEL_SECTIONS:
+        invalidate_models(sender._meta.label)
+
+
+@receiver(pre_delete)
+def _invalidate_analytics_on_delete(sender, instance, **kwargs):
+    if sender._meta.label in MODEL_SECTIONS:
+        invalidate_models(sender._meta.label)
@@ -0,0 +1,215 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from dateutil.relativedelta import relativedelta  # type: ignore
+from django.test import TestCase
+from django.utils import timezone
+
+from accounts.models import Customer, Staff
+from analytics.services import AnalyticsService, OrderAnalyticsService
+from inventory.models import Card, InventoryTransaction, Vendor
+from orders.models import Bill, BillAdjustment, Order, OrderItem, ServiceOrderItem
+from orders.services import OrderService
+from production.models import BoxOrder, PrintingJob
+
+SALE = InventoryTransaction.TransactionType.SALE
+
+
+class ProfitEngineParityTests(TestCase):
+    """
+    The set-based monthly profit engine against the per-order Python rules (OrderAnalyticsService) and
+    hand-computed figures. Every amount is a multiple of 0.25 so that SQLite, which sums decimals as
+    floats, still gives exact results.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        # bulk_create throughout: it skips the audit and order-financials signals
+        (cls.staff,) = Staff.objects.bulk_create([Staff(username="analyst", phone="9000000000", name="Analyst")])
+        (cls.customer,) = Customer.objects.bulk_create([Customer(name="Customer", phone="9000000001")])
+        (vendor,) = Vendor.objects.bulk_create([Vendor(name="Vendor", phone="9000000002")])
+        cls.card_a, cls.card_b = Card.objects.bulk_create(
+            [
+                Card(vendor=vendor, barcode="A", sell_price=Decimal("50.00"), cost_price=Decimal("40.25")),
+                Card(vendor=vendor, barcode="B", sell_price=Decimal("45.00"), cost_price=Decimal("30.50")),
+            ]
+        )
+        cls.current_month = timezone.localdate().replace(day=1)
+
+        # Three months back: card items only. Sale-time cost, card-cost fallback, and a non-sale transaction that is ignored
+        order = cls._order(3)
+        item = cls._item(order, cls.card_a, 10, "50.00", discount="2.50")
+        cls._transaction(item, SALE, "38.75")  # (50 - 2.50 - 38.75) * 10 = 87.50
+        cls._transaction(item, InventoryTransaction.TransactionType.RETURN, "1.00")
+        cls._item(cls._order(3), cls.card_b, 4, "45.00")  # (45 - 30.50) * 4 = 58.00
+
+        # Two months back: printing and box charges less their logged expenses, and an order still missing its tracing expense
+        order = cls._order(2)
+        item = cls._item(order, cls.card_a, 2, "60.00", printing=True, box=True)
+        cls._transaction(item, SALE, "40.25")  # (60 - 40.25) * 2 = 39.50
+        PrintingJob.objects.bulk_create(
+            [
+                PrintingJob(
+                    order_item=item,
+                    print_quantity=2,
+                    total_printing_cost=Decimal("500.00"),
+                    total_printing_expense=Decimal("300.25"),
+                    total_tracing_expense=Decimal("50.50"),
+                )
+            ]
+        )  # 500 - 350.75 = 149.25
+        cls._box(item, "200.00", "120.75")  # 79.25
+        item = cls._item(cls._order(2), cls.card_b, 1, "40.00", printing=True)
+        PrintingJob.objects.bulk_create(
+            [PrintingJob(order_item=item, print_quantity=1, total_printing_cost=Decimal("100.00"), total_printing_expense=Decimal("60.00"))]
+        )
+
+        # Last month: a service item and bill adjustments, plus orders pending a service expense and a box expense
+        order = cls._order(1)
+        cls._item(order, cls.card_b, 3, "35.50", discount="0.50")  # (35.50 - 0.50 - 30.50) * 3 = 13.50
+        cls._service(order, "1000.00", "650.25")  # 349.75
+        cls._adjustments(order, "25.50", "10.00")  # -35.50
+        order = cls._order(1)
+        cls._service(order, "300.00", None)
+        cls._adjustments(order, "5.00")
+        cls._box(cls._item(cls._order(1), cls.card_a, 1, "45.00", box=True), "80.00", None)
+
+        # This month: card item with a sale-time cost, less an adjustment
+        order = cls._order(0)
+        cls._transaction(cls._item(order, cls.card_a, 5, "48.00", discount="1.00"), SALE, "39.50")  # (48 - 1 - 39.50) * 5 = 37.50
+        cls._adjustments(order, "7.25")
+
+        cls.expected = {
+            cls._month_key(3): {"profit": Decimal("145.50"), "orders_pending_expense_logging": 0, "sales": Decimal("655.00")},
+            cls._month_key(2): {"profit": Decimal("268.00"), "orders_pending_expense_logging": 1, "sales": Decimal("960.00")},
+            cls._month_key(1): {"profit": Decimal("327.75"), "orders_pending_expense_logging": 2, "sales": Decimal("1530.00")},
+            cls._month_key(0): {"profit": Decimal("30.25"), "orders_pending_expense_logging": 0, "sales": Decimal("235.00")},
+        }
+
+    @classmethod
+    def _month_start(cls, months_back: int):
+        return cls.current_month - relativedelta(months=months_back)
+
+    @classmethod
+    def _month_key(cls, months_back: int) -> str:
+        return cls._month_start(months_back).strftime("%Y-%m")
+
+    @classmethod
+    def _order(cls, months_back: int) -> Order:
+        (order,) = Order.objects.bulk_create([Order(name="Order", customer=cls.customer, staff=cls.staff)])
+        month = cls._month_start(months_back)
+        # order_date is auto_now_add, so it is moved into the wanted month afterwards
+        Order.objects.filter(id=order.id).update(order_date=timezone.make_aware(datetime(month.year, month.month, 10, 12)))
+        return order
+
+    @staticmethod
+    def _item(order, card, quantity, price, discount="0.00", printing=False, box=False) -> OrderItem:
+        (item,) = OrderItem.objects.bulk_create(
+            [
+                OrderItem(
+                    order=order,
+                    card=card,
+                    quantity=quantity,
+                    price_per_item=Decimal(price),
+                    discount_amount=Decimal(discount),
+                    requires_printing=printing,
+                    requires_box=box,
+                )
+            ]
+        )
+        return item
+
+    @classmethod
+    def _transaction(cls, item, transaction_type, cost_price):
+        InventoryTransaction.objects.bulk_create(
+            [
+                InventoryTransaction(
+                    card=item.card,
+                    staff=cls.staff,
+                    transaction_type=transaction_type,
+                    order_item=item,
+                    quantity_changed=-item.quantity,
+                    cost_price=Decimal(cost_price),
+                )
+            ]
+        )
+
+    @staticmethod
+    def _box(item, cost, expense):
+        BoxOrder.objects.bulk_create(
+            [
+                BoxOrder(
+                    order_item=item,
+                    box_type=BoxOrder.BoxType.FOLDING,
+                    box_quantity=item.quantity,
+                    total_box_cost=Decimal(cost),
+                    total_box_expense=Decimal(expense) if expense is not None else None,
+                )
+            ]
+        )
+
+    @staticmethod
+    def _service(order, cost, expense):
+        ServiceOrderItem.objects.bulk_create(
+            [
+                ServiceOrderItem(
+                    order=order,
+                    service_type=ServiceOrderItem.ServiceType.DIGITAL_CARD,
+                    quantity=1,
+                    total_cost=Decimal(cost),
+                    total_expense=Decimal(expense) if expense is not None else None,
+                )
+            ]
+        )
+
+    @classmethod
+    def _adjustments(cls, order, *amounts):
+        (bill,) = Bill.objects.bulk_create([Bill(order=order)])
+        BillAdjustment.objects.bulk_create(
+            [
+                BillAdjustment(bill=bill, staff=cls.staff, adjustment_type=BillAdjustment.AdjustmentType.OTHER, amount=Decimal(amount), reason="-")
+                for amount in amounts
+            ]
+        )
+
+    def _python_rules(self, start_date, end_date) -> dict:
+        """The per-order calculation, totalled the way the engine reports it."""
+        orders = OrderService.get_orders_queryset().filter(order_date__date__range=[start_date, end_date])
+        profits = OrderAnalyticsService.calculate_order_profits(orders).values()
+        return {
+            "profit": sum((profit for profit in profits if profit is not None), Decimal("0.0")),
+            "orders_pending_expense_logging": sum(1 for profit in profits if profit is None),
+        }
+
+    def test_monthly_profit_matches_the_per_order_rules(self):
+        start_date = self._month_start(3)
+        end_date = self.current_month + relativedelta(months=1) - timedelta(days=1)
+        engine = AnalyticsService._calculate_profit_by_month(start_date, end_date)
+        self.assertEqual(set(engine), set(self.expected))
+
+        for months_back in range(4):
+            month_key = self._month_key(months_back)
+            month_start = self._month_start(months_back)
+            month_end = month_start + relativedelta(months=1) - timedelta(days=1)
+            expected = self.expected[month_key]
+            with self.subTest(month=month_key):
+                self.assertEqual(self._python_rules(month_start, month_end), {k: expected[k] for k in ("profit", "orders_pending_expense_logging")})
+                self.assertEqual(engine[month_key]["profit"], expected["profit"])
+                self.assertEqual(engine[month_key]["orders_pending_expense_logging"], expected["orders_pending_expense_logging"])
+                self.assertEqual(AnalyticsService._calculate_sales_for_period(month_start, month_end), expected["sales"])
+
+    def test_period_totals_add_up_the_months(self):
+        start_date = self._month_start(3)
+        end_date = self.current_month + relativedelta(months=1) - timedelta(days=1)
+        period = AnalyticsService._calculate_profit_for_period(start_date, end_date)
+        self.assertEqual(period, self._python_rules(start_date, end_date))
+        self.assertEqual(period, {"profit": Decimal("771.50"), "orders_pending_expense_logging": 3})
+
+    def test_yearly_profit_analysis_reports_every_month(self):
+        yearly = AnalyticsService.get_yearly_profit_analysis()
+        expected = []
+        for months_back in range(11, -1, -1):
+            month_key = self._month_key(months_back)
+            profit = self.expected[month_key]["profit"] if month_key in self.expected else Decimal("0")
+            expected.append({"month": month_key, "profit": f"{profit:.2f}"})
+        self.assertEqual(yearly, expected)
@@ -1,57 +1,37 @@
-from decimal import Decimal
-
-from django.db import models
-from django.utils import timezone
 from rest_framework.views import APIView
 
+from analytics import cache as analytics_cache
 from analytics.constants import AnalyticsType
-from analytics.serializers import DetailedAnalyticsParams
-from analytics.services import AnalyticsService
+from analytics.serializers import DashboardParams, DetailedAnalyticsParams
+from analytics.services import AnalyticsService, DashboardService
+from core.authorization import allow_authenticated
 from core.decorators import forge
 from core.utils import model_unwrap
-from orders.services import BillService
+from orders.services import OrderFinancialsService
 
 
 class DashboardView(APIView):
     @forge
+    @allow_authenticated
     def get(self, request):
-        today = timezone.now().date()
-
-        low_stock_items = AnalyticsService.get_low_stock_items()
-        out_of_stock_items = AnalyticsService.get_out_of_stock_items()
-        medium_stock_items = AnalyticsService.get_medium_stock_items()
-        total_orders = AnalyticsService.get_total_orders_current_month()
-        monthly_order_change = AnalyticsService.get_monthly_order_change()
-        pending_orders = AnalyticsService.get_pending_orders()
-        todays_orders = AnalyticsService.get_todays_orders(today)
-        pending_bills_count = AnalyticsService.get_pending_bills_count()
-        profit_analysis = AnalyticsService.get_monthly_profit_analysis()
-        monthly_total_sale = AnalyticsService.get_monthly_total_sale()
-        pending_printing, pending_boxing = AnalyticsService.get_pending_production_counts()
-
-        return {
-            "low_stock_items": low_stock_items,
-            "out_of_stock_items": out_of_stock_items,
-            "medium_stock_items": medium_stock_items,
-            "total_orders_current_month": total_orders,
-            "monthly_order_change_percentage": monthly_order_change,
-            "pending_orders": pending_orders,
-            "todays_orders": todays_orders,
-            "pending_bills": pending_bills_count,
-            "monthly_profit": f"{profit_analysis['monthly_profit']:.2f}",
-            "total_sale_current_month": f"{monthly_total_sale:.2f}",
-            "orders_pending_expense_logging": profit_analysis["orders_pending_expense_logging"],
-            "pending_printing_jobs": pending_printing,
-            "pending_box_jobs": pending_boxing,
-        }
+        params = DashboardParams.validate_params(request)
+        return DashboardService.get_dashboard(parallel=params.get_value("parallel"), include_timings=params.get_value("debug"))
 
 
 class DetailedAnalyticsView(APIView):
     @forge
+    @allow_authenticated
     def get(self, request):
         params = DetailedAnalyticsParams.validate_params(request)
         analytics_type = params.get_value("type")
+        days = params.get_value("days", 1)
+
+        # Only today's orders depend on a parameter besides the type
+        suffix = f"days={days}" if analytics_type == AnalyticsType.TODAYS_ORDERS else ""
+        return analytics_cache.get_or_compute(analytics_type, lambda: self._fetch(analytics_type, days), suffix=suffix)
 
+    @staticmethod
+    def _fetch(analytics_type, days):
         data_fetchers = {
             AnalyticsType.YEARLY_PROFIT: AnalyticsService.get_yearly_profit_analysis,
             AnalyticsType.YEARLY_SALE: AnalyticsService.get_yearly_sale_analysis,
@@ -79,7 +59,6 @@ class DetailedAnalyticsView(APIView):
             return data
         elif analytics_type == AnalyticsType.TODAYS_ORDERS:
             # Custom weaving to include nested order_items, printing_jobs, box_orders, service_items, and bill_id
-            days = params.get_value("days", 1)
             queryset = fetcher(days=days)
             results = []
             for order in queryset:
@@ -121,16 +100,11 @@ class DetailedAnalyticsView(APIView):
         elif analytics_type == AnalyticsType.PENDING_BILLS:
             # Compute summaries and pending amounts similar to Bill API
             bills_qs = fetcher()
-            detailed_bills = BillService.calculate_bills_details_in_bulk(bills_qs)
             results = []
-            for bill_details in detailed_bills:
-                bill_instance = bill_details["bill_instance"]
-                summary = bill_details["summary"]
-
-                total_paid = bill_instance.payments.aggregate(total=models.Sum("amount")).get("total") or Decimal("0.00")
-                total_adjusted = bill_instance.adjustments.aggregate(total=models.Sum("amount")).get("total") or Decimal("0.00")
-                summary_with_pending = dict(summary)
-                summary_with_pending["pending_amount"] = summary["total_with_tax"] - (total_paid + total_adjusted)
+            for bill_instance in bills_qs:
+                financials = OrderFinancialsService.get_for_order(bill_instance.order)
+                summary_with_pending = financials.summary()
+                summary_with_pending["pending_amount"] = financials.pending_amount
 
                 serialized_bill = model_unwrap(bill_instance)
                 serialized_bill["order"] = model_unwrap(bill_instance.order)
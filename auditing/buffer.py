@@ -0,0 +1,115 @@
+import logging
+import threading
+import weakref
+
+from django.conf import settings
+from django.db import transaction
+
+from auditing.models import ModelAuditLog
+
+logger = logging.getLogger(__name__)
+
+
+class _Group:
+    """Entries written while one particular set of savepoints was open."""
+
+    def __init__(self, savepoint_ids):
+        self.savepoint_ids = savepoint_ids
+        self.entries = []
+
+    def __call__(self):
+        # The entries are written by AuditBuffer.flush; this hook only ties the group's lifetime to its savepoints
+        pass
+
+
+class AuditBuffer:
+    """
+    Collects ModelAuditLog entries for the current transaction and writes them with one bulk_create
+    after it commits.
+
+    Entries are grouped by the savepoints open when they were added. Each group is registered as an
+    on_commit hook and the buffer only keeps weak references to it, so when Django discards the hooks
+    of a rolled-back savepoint or transaction, the group and its entries go with them. The flush is
+    registered once per outermost atomic block (again only if its own savepoint was rolled back) and
+    writes every group still alive, whatever order the hooks run in; a failed write is logged rather
+    than raised, since the transaction has already committed. If more than
+    AUDIT_BUFFER_MAX_ENTRIES entries pile up, the pending groups are written early inside the
+    transaction, where a rollback still undoes them. Outside a transaction every entry is written
+    immediately.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    @property
+    def _state(self):
+        if not hasattr(self._local, "groups"):
+            self._local.groups = weakref.WeakValueDictionary()
+            self._local.flush_hook = None
+            self._local.pending = 0
+        return self._local
+
+    def add(self, entry: ModelAuditLog):
+        connection = transaction.get_connection()
+        if not connection.in_atomic_block:
+            ModelAuditLog.objects.bulk_create([entry])
+            return
+
+        state = self._state
+        if state.flush_hook is None or state.flush_hook() is None:
+            # First entry of this transaction, or the savepoint the flush was registered in was rolled back.
+            # Only groups that survived still count towards the spill limit.
+            state.pending = sum(len(group.entries) for group in state.groups.values())
+            flush = self.flush
+            transaction.on_commit(flush, robust=False)
+            state.flush_hook = weakref.ref(flush)
+
+        key = tuple(connection.savepoint_ids)
+        group = state.groups.get(key)
+        if group is None:
+            group = _Group(key)
+            state.groups[key] = group
+            transaction.on_commit(group, robust=False)
+        group.entries.append(entry)
+        state.pending += 1
+
+        if state.pending > settings.AUDIT_BUFFER_MAX_ENTRIES:
+            self.spill()
+
+    def add_many(self, entries):
+        if not transaction.get_connection().in_atomic_block:
+            ModelAuditLog.objects.bulk_create(entries)
+            return
+        for entry in entries:
+            self.add(entry)
+
+    def _take_entries(self) -> list:
+        state = self._state
+        entries = []
+        for group in list(state.groups.values()):
+            entries.extend(group.entries)
+            group.entries = []
+        state.pending = 0
+        return entries
+
+    def spill(self):
+        """Writes every pending entry now, inside the current transaction."""
+        if entries := self._take_entries():
+            ModelAuditLog.objects.bulk_create(entries)
+
+    def flush(self):
+        entries = self._take_entries()
+        state = self._state
+        state.groups = weakref.WeakValueDictionary()
+        state.flush_hook = None
+        if not entries:
+            return
+        # The business data has already committed: a failed audit write must not fail the request or stop
+        # the on_commit hooks registered after this one (cache invalidation, similarity index updates)
+        try:
+            ModelAuditLog.objects.bulk_create(entries)
+        except Exception:
+            logger.exception("Could not write %s model audit row(s)", len(entries))
+
+
+audit_buffer = AuditBuffer()
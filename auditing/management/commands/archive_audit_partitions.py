@@ -0,0 +1,44 @@
+from pathlib import Path
+
+from dateutil.relativedelta import relativedelta  # type: ignore
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from auditing import partitions
+
+
+class Command(BaseCommand):
+    help = "Archive audit log partitions older than the retention period to gzipped NDJSON, then detach and drop them"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retention-months", type=int, default=settings.AUDIT_RETENTION_MONTHS, help="Full months to keep besides the current one"
+        )
+        parser.add_argument("--directory", default=settings.AUDIT_ARCHIVE_DIR, help="Where the archives are written")
+        parser.add_argument("--dry-run", action="store_true", help="List the partitions that would be archived")
+
+    def handle(self, *args, **options):
+        if not partitions.is_supported():
+            raise CommandError("Audit table partitioning requires PostgreSQL")
+
+        cutoff = partitions.month_start(timezone.localdate()) - relativedelta(months=options["retention_months"])
+        directory = Path(options["directory"])
+        archived = 0
+        for model in partitions.PARTITIONED_MODELS:
+            table = model._meta.db_table
+            for month, name in partitions.monthly_partitions(table).items():
+                if month >= cutoff:
+                    continue
+                if options["dry_run"]:
+                    self.stdout.write(f"Would archive {name}")
+                    continue
+                # Archive while the partition is still attached, so a failed run can simply be repeated
+                path, rows = partitions.archive_table(name, directory)
+                with transaction.atomic():
+                    partitions.detach_partition(table, name)
+                    partitions.drop_table(name)
+                archived += 1
+                self.stdout.write(f"Archived {rows} row(s) from {name} to {path}")
+        self.stdout.write(self.style.SUCCESS(f"{archived} partition(s) archived; keeping data from {cutoff.isoformat()} on"))
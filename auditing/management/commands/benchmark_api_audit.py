@@ -0,0 +1,54 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from accounts.models import Staff
+from auditing.models import APIAuditLog
+from auditing.writer import api_audit_writer
+from core.helpers.security import Security
+
+MODES = {
+    "off": {"ENABLE_API_DB_AUDIT": False},
+    "sync": {"ENABLE_API_DB_AUDIT": True, "API_AUDIT_ASYNC": False},
+    "async": {"ENABLE_API_DB_AUDIT": True, "API_AUDIT_ASYNC": True},
+}
+
+
+class Command(BaseCommand):
+    help = "Measure request latency (p50/p99) with API audit logging off, written inline, and written by the background writer"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=500, help="Requests per mode")
+        parser.add_argument("--path", default="/api/v1/vendors/", help="Authenticated GET endpoint to call")
+        parser.add_argument("--keep", action="store_true", help="Keep the audit rows written by the benchmark")
+
+    def handle(self, *args, **options):
+        if not (staff := Staff.objects.filter(role=Staff.Role.ADMIN, is_active=True).first()):
+            raise CommandError("An active admin is required to call the API")
+        token = Security.create_token({"staff_id": str(staff.id), "role": staff.role})
+        client = Client(HTTP_AUTHORIZATION=f"Bearer {token}")
+        started_at = timezone.now()
+
+        with override_settings(ALLOWED_HOSTS=["testserver"], ENABLE_API_LOGGING=False):
+            for _ in range(min(options["requests"], 20)):
+                client.get(options["path"])
+            for mode, overrides in MODES.items():
+                with override_settings(**overrides):
+                    timings = []
+                    for _ in range(options["requests"]):
+                        start = time.perf_counter()
+                        response = client.get(options["path"])
+                        timings.append((time.perf_counter() - start) * 1000)
+                        if response.status_code >= 400:
+                            raise CommandError(f"{options['path']} returned {response.status_code}")
+                quantiles = statistics.quantiles(timings, n=100)
+                self.stdout.write(f"{mode:>6}: p50 {quantiles[49]:.2f} ms  p99 {quantiles[98]:.2f} ms")
+
+        api_audit_writer.shutdown()
+        self.stdout.write(f"Background writer: {api_audit_writer.stats()}")
+        if not options["keep"]:
+            APIAuditLog.objects.filter(endpoint=options["path"], staff=staff, created_at__gte=started_at).delete()
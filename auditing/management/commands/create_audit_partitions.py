@@ -0,0 +1,41 @@
+from dateutil.relativedelta import relativedelta  # type: ignore
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError
+from django.utils import timezone
+
+from auditing import partitions
+
+
+class Command(BaseCommand):
+    help = "Create the monthly audit log partitions for the current month and the months ahead"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--months-ahead", type=int, default=settings.AUDIT_PARTITION_MONTHS_AHEAD, help="Future months to cover")
+
+    def handle(self, *args, **options):
+        if not partitions.is_supported():
+            raise CommandError("Audit table partitioning requires PostgreSQL")
+
+        current = partitions.month_start(timezone.localdate())
+        failed = []
+        for model in partitions.PARTITIONED_MODELS:
+            table = model._meta.db_table
+            for offset in range(options["months_ahead"] + 1):
+                month = current + relativedelta(months=offset)
+                name = partitions.partition_name(table, month)
+                try:
+                    moved = partitions.create_partition(table, month)
+                except DatabaseError as e:
+                    # Leave this month to the next run and carry on with the others
+                    self.stderr.write(self.style.ERROR(f"Could not create {name}: {e}"))
+                    failed.append(name)
+                    continue
+                if moved is not None:
+                    self.stdout.write(f"Created {name}" + (f", moving {moved} row(s) out of the default partition" if moved else ""))
+            if stray := partitions.default_partition_row_count(table):
+                default_partition = partitions.default_partition_name(table)
+                self.stdout.write(self.style.WARNING(f"{default_partition} holds {stray} row(s) outside the monthly partitions"))
+        if failed:
+            raise CommandError(f"Failed to create {len(failed)} partition(s): {', '.join(failed)}")
+        self.stdout.write(self.style.SUCCESS("Audit partitions are up to date"))
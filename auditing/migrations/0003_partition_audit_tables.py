@@ -0,0 +1,69 @@
+from datetime import date
+
+from dateutil.relativedelta import relativedelta  # type: ignore
+from django.db import migrations
+
+AUDIT_TABLES = ["api_audit_logs", "model_audit_logs"]
+MONTHS_AHEAD = 3
+
+
+def _partition_table(schema_editor, table):
+    """Rebuilds `table` as a table partitioned by month on created_at, keeping its rows, indexes and foreign keys.
+
+    PostgreSQL requires the partition key in the primary key, so the database key becomes (id, created_at);
+    Django keeps treating id as the primary key.
+    """
+    quote = schema_editor.quote_name
+    legacy = f"{table}_legacy"
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT indexname, indexdef FROM pg_indexes WHERE schemaname = current_schema() AND tablename = %s", [table])
+        indexes = cursor.fetchall()
+        cursor.execute("SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'f'", [table])
+        foreign_keys = cursor.fetchall()
+        cursor.execute("SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'p'", [table])
+        primary_key = cursor.fetchone()[0]
+        cursor.execute(f"SELECT MIN(created_at) FROM {quote(table)}")
+        oldest = cursor.fetchone()[0]
+
+        cursor.execute(f"ALTER TABLE {quote(table)} RENAME TO {quote(legacy)}")
+        for name, _ in indexes:
+            cursor.execute(f"ALTER INDEX {quote(name)} RENAME TO {quote(f'{name[:50]}_legacy')}")
+
+        cursor.execute(
+            f"CREATE TABLE {quote(table)} (LIKE {quote(legacy)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS, "
+            f"CONSTRAINT {quote(primary_key)} PRIMARY KEY (id, created_at)) PARTITION BY RANGE (created_at)"
+        )
+        for name, definition in foreign_keys:
+            cursor.execute(f"ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(name)} {definition}")
+        for name, definition in indexes:
+            if name != primary_key:
+                cursor.execute(definition)
+
+        month = (oldest.date() if oldest else date.today()).replace(day=1)
+        last = date.today().replace(day=1) + relativedelta(months=MONTHS_AHEAD)
+        while month <= last:
+            cursor.execute(
+                f"CREATE TABLE {quote(f'{table}_p{month.year:04d}_{month.month:02d}')} PARTITION OF {quote(table)} FOR VALUES FROM (%s) TO (%s)",
+                [month.isoformat(), (month + relativedelta(months=1)).isoformat()],
+            )
+            month += relativedelta(months=1)
+        cursor.execute(f"CREATE TABLE {quote(f'{table}_default')} PARTITION OF {quote(table)} DEFAULT")
+
+        cursor.execute(f"INSERT INTO {quote(table)} SELECT * FROM {quote(legacy)}")
+        cursor.execute(f"DROP TABLE {quote(legacy)}")
+
+
+def partition_audit_tables(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table in AUDIT_TABLES:
+        _partition_table(schema_editor, table)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("auditing", "0002_apiauditlog_modelauditlog_delete_auditlog_and_more"),
+    ]
+
+    # Partitioning is a storage change only, so the reverse leaves the partitioned tables in place
+    operations = [migrations.RunPython(partition_audit_tables, migrations.RunPython.noop)]
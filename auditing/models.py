@@ -1,6 +1,7 @@
 import uuid
 
 from django.db import models
+from django.utils import timezone
 
 from accounts.models import Staff
 from core.constants import ACTION_LENGTH, LONG_TEXT_LENGTH, MODEL_NAME_LENGTH, TEXT_LENGTH
@@ -64,7 +65,8 @@ class APIAuditLog(models.Model):
     headers = models.JSONField(default=dict, blank=True)
     request_id = models.UUIDField(null=True, blank=True)
     response_size_bytes = models.IntegerField(null=True, blank=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Not auto_now_add: the middleware stamps the request time, which the background writer must keep
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
 
     class Meta:
         db_table = "api_audit_logs"
@@ -0,0 +1,122 @@
+"""
+Monthly range partitions for the audit tables (PostgreSQL only).
+
+Both audit tables are partitioned by created_at, one partition per calendar month named
+<table>_pYYYY_MM, plus a <table>_default partition that catches rows no monthly partition covers.
+Future partitions are created ahead of time by `create_audit_partitions`; partitions older than the
+retention window are detached, archived as gzipped NDJSON and dropped by `archive_audit_partitions`.
+"""
+
+import gzip
+import re
+from datetime import date
+from pathlib import Path
+
+from dateutil.relativedelta import relativedelta  # type: ignore
+from django.db import connection, transaction
+
+from auditing.models import APIAuditLog, ModelAuditLog
+
+PARTITIONED_MODELS = (APIAuditLog, ModelAuditLog)
+PARTITION_KEY = "created_at"
+_PARTITION_SUFFIX = re.compile(r"_p(\d{4})_(\d{2})$")
+
+
+def is_supported() -> bool:
+    return connection.vendor == "postgresql"
+
+
+def month_start(value: date) -> date:
+    return value.replace(day=1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month.year:04d}_{month.month:02d}"
+
+
+def default_partition_name(table: str) -> str:
+    return f"{table}_default"
+
+
+def create_partition(table: str, month: date) -> int | None:
+    """
+    Creates the partition for the month containing `month`. Returns None when it already exists, otherwise
+    the number of rows it took over from the default partition.
+
+    PostgreSQL refuses to add a partition while the default partition holds rows in its range, so when it
+    does the default is detached, the partition created, those rows moved across and the default
+    reattached, all in one transaction.
+    """
+    month = month_start(month)
+    name = partition_name(table, month)
+    if name in monthly_partitions(table).values():
+        return None
+    quote = connection.ops.quote_name
+    default_partition = default_partition_name(table)
+    bounds = [month.isoformat(), (month + relativedelta(months=1)).isoformat()]
+    in_range = f"{PARTITION_KEY} >= %s AND {PARTITION_KEY} < %s"
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"SELECT EXISTS (SELECT 1 FROM {quote(default_partition)} WHERE {in_range})", bounds)
+        if not cursor.fetchone()[0]:
+            cursor.execute(f"CREATE TABLE {quote(name)} PARTITION OF {quote(table)} FOR VALUES FROM (%s) TO (%s)", bounds)
+            return 0
+        cursor.execute(f"ALTER TABLE {quote(table)} DETACH PARTITION {quote(default_partition)}")
+        cursor.execute(f"CREATE TABLE {quote(name)} PARTITION OF {quote(table)} FOR VALUES FROM (%s) TO (%s)", bounds)
+        cursor.execute(f"INSERT INTO {quote(name)} SELECT * FROM {quote(default_partition)} WHERE {in_range}", bounds)
+        moved = cursor.rowcount
+        cursor.execute(f"DELETE FROM {quote(default_partition)} WHERE {in_range}", bounds)
+        cursor.execute(f"ALTER TABLE {quote(table)} ATTACH PARTITION {quote(default_partition)} DEFAULT")
+    return moved
+
+
+def monthly_partitions(table: str) -> dict:
+    """Returns {month: partition name} for the monthly partitions currently attached to `table`."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = %s",
+            [table],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+    partitions = {}
+    for name in names:
+        if match := _PARTITION_SUFFIX.search(name):
+            partitions[date(int(match.group(1)), int(match.group(2)), 1)] = name
+    return dict(sorted(partitions.items()))
+
+
+def default_partition_row_count(table: str) -> int:
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT COUNT(*) FROM {connection.ops.quote_name(default_partition_name(table))}")
+        return cursor.fetchone()[0]
+
+
+def detach_partition(table: str, name: str):
+    quote = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {quote(table)} DETACH PARTITION {quote(name)}")
+
+
+def archive_table(name: str, directory: Path) -> tuple[Path, int]:
+    """Streams every row of `name` to <directory>/<name>.ndjson.gz and returns (path, row count)."""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{name}.ndjson.gz"
+    partial_path = path.with_suffix(".gz.partial")
+    rows = 0
+    with gzip.open(partial_path, "wt", encoding="utf-8") as archive:
+        # A server-side cursor keeps memory flat however large the partition is
+        with connection.chunked_cursor() as cursor:
+            cursor.execute(f"SELECT row_to_json(t)::text FROM {connection.ops.quote_name(name)} t ORDER BY {PARTITION_KEY}")
+            for (line,) in cursor:
+                archive.write(line)
+                archive.write("\n")
+                rows += 1
+    partial_path.replace(path)
+    return path, rows
+
+
+def drop_table(name: str):
+    with connection.cursor() as cursor:
+        cursor.execute(f"DROP TABLE {connection.ops.quote_name(name)}")
@@ -7,6 +7,8 @@ from core.helpers.param_serializer import ParamSerializer
 class AuditLogQueryParams(ParamSerializer):
     page = serializers.IntegerField(required=False, min_value=1, default=PAGINATION_DEFAULT_PAGE)
     page_size = serializers.IntegerField(required=False, min_value=1, max_value=100, default=PAGINATION_DEFAULT_PAGE_SIZE)
+    cursor = serializers.CharField(required=False, allow_blank=True)
+    with_total = serializers.BooleanField(required=False, default=False)
     # Optional filters
     staff_id = serializers.UUIDField(required=False)
     request_id = serializers.UUIDField(required=False)
@@ -0,0 +1,42 @@
+from auditing.buffer import audit_buffer
+from auditing.context import get_current_staff
+from auditing.models import ModelAuditLog
+from auditing.utils import diff, instance_state, is_audited_model
+
+
+class ModelAuditService:
+    @staticmethod
+    def record_bulk_changes(created=(), updated=()):
+        """Audits rows written with bulk_create() or queryset.update(), which never reach the save signals.
+
+        `created` holds the new instances; `updated` holds (instance, old_values, new_values) tuples.
+        The entries join the transaction's audit buffer, which writes them with a single insert.
+        """
+        staff = get_current_staff()
+        entries = []
+        for instance in created:
+            if is_audited_model(type(instance)):
+                entries.append(
+                    ModelAuditLog(
+                        staff=staff,
+                        model_name=instance._meta.label,
+                        model_id=instance.pk,
+                        action=ModelAuditLog.Action.CREATE,
+                        old_values={},
+                        new_values=instance_state(instance),
+                    )
+                )
+        for instance, old_values, new_values in updated:
+            old_diff, new_diff = diff(old_values, new_values)
+            if is_audited_model(type(instance)) and (old_diff or new_diff):
+                entries.append(
+                    ModelAuditLog(
+                        staff=staff,
+                        model_name=instance._meta.label,
+                        model_id=instance.pk,
+                        action=ModelAuditLog.Action.UPDATE,
+                        old_values=old_diff,
+                        new_values=new_diff,
+                    )
+                )
+        audit_buffer.add_many(entries)
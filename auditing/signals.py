@@ -1,17 +1,38 @@
-from django.db.models.signals import post_save, pre_delete, pre_save
+from django.apps import apps
+from django.conf import settings
+from django.db.models.signals import post_init, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 
+from auditing.buffer import audit_buffer
 from auditing.context import get_current_staff
 from auditing.models import ModelAuditLog
 from auditing.utils import diff, instance_state, is_audited_model
 
 
+def _audit_snapshot(sender, instance, **kwargs):
+    # Captures the loaded values so that a later save can diff without re-reading the row.
+    # Instances with deferred fields get no snapshot and fall back to a SELECT on save.
+    if settings.AUDIT_LOAD_SNAPSHOTS and not instance.get_deferred_fields():
+        instance.__audit_snapshot = instance_state(instance)
+
+
+for _model in apps.get_models():
+    if is_audited_model(_model):
+        post_init.connect(_audit_snapshot, sender=_model)
+
+
 @receiver(pre_save)
 def _audit_pre_save(sender, instance, **kwargs):
     if not is_audited_model(sender):
         return
-    if getattr(instance, "pk", None) and sender.objects.filter(pk=instance.pk).exists():
-        instance.__audit_old = instance_state(sender.objects.get(pk=instance.pk))
+    snapshot = instance.__dict__.get("__audit_snapshot")
+    if instance._state.adding and sender._meta.pk.has_default():
+        # Django always inserts these, so there is no previous state to look up
+        instance.__audit_old = None
+    elif snapshot is not None and not instance._state.adding:
+        instance.__audit_old = snapshot
+    elif getattr(instance, "pk", None) and (current := sender.objects.filter(pk=instance.pk).first()):
+        instance.__audit_old = instance_state(current)
     else:
         instance.__audit_old = None
 
@@ -22,17 +43,33 @@ def _audit_post_save(sender, instance, created: bool, **kwargs):
         return
     old_values = getattr(instance, "__audit_old", None) or {}
     new_values = instance_state(instance)
+    if settings.AUDIT_LOAD_SNAPSHOTS:
+        instance.__audit_snapshot = new_values
     staff = get_current_staff()
     if created:
-        ModelAuditLog.objects.create(
-            staff=staff, model_name=sender._meta.label, model_id=instance.pk, action=ModelAuditLog.Action.CREATE, old_values={}, new_values=new_values
+        audit_buffer.add(
+            ModelAuditLog(
+                staff=staff,
+                model_name=sender._meta.label,
+                model_id=instance.pk,
+                action=ModelAuditLog.Action.CREATE,
+                old_values={},
+                new_values=new_values,
+            )
         )
         return
     old_diff, new_diff = diff(old_values, new_values)
     if not old_diff and not new_diff:
         return
-    ModelAuditLog.objects.create(
-        staff=staff, model_name=sender._meta.label, model_id=instance.pk, action=ModelAuditLog.Action.UPDATE, old_values=old_diff, new_values=new_diff
+    audit_buffer.add(
+        ModelAuditLog(
+            staff=staff,
+            model_name=sender._meta.label,
+            model_id=instance.pk,
+            action=ModelAuditLog.Action.UPDATE,
+            old_values=old_diff,
+            new_values=new_diff,
+        )
     )
 
 
@@ -40,11 +77,13 @@ def _audit_post_save(sender, instance, created: bool, **kwargs):
 def _audit_pre_delete(sender, instance, **kwargs):
     if not is_audited_model(sender):
         return
-    ModelAuditLog.objects.create(
-        staff=get_current_staff(),
-        model_name=sender._meta.label,
-        model_id=instance.pk,
-        action=ModelAuditLog.Action.DELETE,
-        old_values=instance_state(instance),
-        new_values={},
+    audit_buffer.add(
+        ModelAuditLog(
+            staff=get_current_staff(),
+            model_name=sender._meta.label,
+            model_id=instance.pk,
+            action=ModelAuditLog.Action.DELETE,
+            old_values=instance_state(instance),
+            new_values={},
+        )
     )
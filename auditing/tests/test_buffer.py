@@ -0,0 +1,129 @@
+import uuid
+from unittest import mock
+
+from django.db import transaction
+from django.test import TestCase, override_settings
+
+from accounts.models import Staff
+from auditing.buffer import audit_buffer
+from auditing.models import ModelAuditLog
+
+
+class AuditBufferTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # bulk_create skips the audit signals
+        (cls.staff,) = Staff.objects.bulk_create([Staff(username="auditor", phone="9000000000", name="Auditor")])
+
+    def _add(self, label: str):
+        audit_buffer.add(ModelAuditLog(staff=self.staff, model_name=label, model_id=uuid.uuid4(), action=ModelAuditLog.Action.CREATE))
+
+    def _written(self) -> list:
+        return sorted(ModelAuditLog.objects.values_list("model_name", flat=True))
+
+    def _commit(self, callbacks, queries=1):
+        # Runs the hooks a real commit would run, in order
+        with self.assertNumQueries(queries):
+            for callback in callbacks:
+                callback()
+
+    def test_entries_are_written_with_one_insert_after_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            with transaction.atomic():
+                for label in ("a", "b", "c"):
+                    self._add(label)
+                self.assertEqual(self._written(), [])
+        self._commit(callbacks)
+        self.assertEqual(self._written(), ["a", "b", "c"])
+
+    def test_released_savepoints_share_the_insert(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            with transaction.atomic():
+                with transaction.atomic():
+                    self._add("inner")
+                self._add("outer")
+                with transaction.atomic():
+                    self._add("sibling")
+        self._commit(callbacks)
+        self.assertEqual(self._written(), ["inner", "outer", "sibling"])
+
+    def test_rolled_back_savepoint_drops_only_its_entries(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            with transaction.atomic():
+                self._add("before")
+                try:
+                    with transaction.atomic():
+                        self._add("rolled-back")
+                        raise ValueError
+                except ValueError:
+                    pass
+                self._add("after")
+        self._commit(callbacks)
+        self.assertEqual(self._written(), ["after", "before"])
+
+    def test_flush_is_registered_again_when_its_savepoint_rolls_back(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            with transaction.atomic():
+                try:
+                    with transaction.atomic():
+                        self._add("rolled-back")
+                        raise ValueError
+                except ValueError:
+                    pass
+                self._add("kept")
+        self._commit(callbacks)
+        self.assertEqual(self._written(), ["kept"])
+
+    def test_rolled_back_transaction_leaves_nothing_behind(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            try:
+                with transaction.atomic():
+                    self._add("rolled-back")
+                    raise ValueError
+            except ValueError:
+                pass
+            with transaction.atomic():
+                self._add("next")
+        self._commit(callbacks)
+        self.assertEqual(self._written(), ["next"])
+
+    @override_settings(AUDIT_BUFFER_MAX_ENTRIES=2)
+    def test_spill_writes_inside_the_transaction(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            with transaction.atomic():
+                for label in ("a", "b", "c"):
+                    self._add(label)
+                self.assertEqual(self._written(), ["a", "b", "c"])
+                self._add("d")
+        self._commit(callbacks)
+        self.assertEqual(self._written(), ["a", "b", "c", "d"])
+
+    def test_failed_flush_is_logged_and_later_hooks_still_run(self):
+        later = mock.Mock()
+        with self.captureOnCommitCallbacks() as callbacks:
+            with transaction.atomic():
+                self._add("a")
+                transaction.on_commit(later)
+        with (
+            mock.patch.object(ModelAuditLog.objects, "bulk_create", side_effect=RuntimeError("database gone")),
+            self.assertLogs("auditing.buffer", level="ERROR") as logs,
+        ):
+            self._commit(callbacks, queries=0)
+        later.assert_called_once_with()
+        self.assertIn("Could not write 1 model audit row(s)", logs.output[0])
+
+    @override_settings(AUDIT_BUFFER_MAX_ENTRIES=2)
+    def test_rolled_back_entries_do_not_count_towards_the_next_spill(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            try:
+                with transaction.atomic():
+                    self._add("rolled-back-1")
+                    self._add("rolled-back-2")
+                    raise ValueError
+            except ValueError:
+                pass
+            with transaction.atomic():
+                self._add("next")
+                self.assertEqual(self._written(), [])
+        self._commit(callbacks)
+        self.assertEqual(self._written(), ["next"])
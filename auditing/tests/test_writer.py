@@ -0,0 +1,48 @@
+import queue
+from datetime import timedelta
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from auditing.models import APIAuditLog
+from auditing.writer import APIAuditWriter
+
+
+@override_settings(API_AUDIT_QUEUE_MAX_BYTES=100, API_AUDIT_BUSY_SAMPLE_RATE=0.0)
+class APIAuditWriterQueueTests(SimpleTestCase):
+    def setUp(self):
+        # No worker thread: rows stay queued so the accounting can be inspected
+        self.writer = APIAuditWriter()
+        self.writer._queue = queue.Queue(maxsize=10)
+        patcher = mock.patch.object(self.writer, "_ensure_started")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_rows_past_the_byte_limit_are_dropped(self):
+        self.assertTrue(self.writer.submit(lambda: None, is_error=True, size=60))
+        self.assertFalse(self.writer.submit(lambda: None, is_error=True, size=60))
+        self.assertTrue(self.writer.submit(lambda: None, is_error=True, size=40))
+        stats = self.writer.stats()
+        self.assertEqual((stats["queued"], stats["queued_bytes"], stats["dropped"]), (2, 100, 1))
+
+    def test_successful_rows_are_sampled_once_the_bytes_are_busy(self):
+        self.assertTrue(self.writer.submit(lambda: None, size=80))
+        self.assertFalse(self.writer.submit(lambda: None, size=1))
+        self.assertTrue(self.writer.submit(lambda: None, is_error=True, size=10))
+        stats = self.writer.stats()
+        self.assertEqual((stats["queued_bytes"], stats["sampled_out"], stats["dropped"]), (90, 1, 0))
+
+    def test_bytes_are_released_when_the_row_count_limit_drops_a_row(self):
+        self.writer._queue = queue.Queue(maxsize=1)
+        self.assertTrue(self.writer.submit(lambda: None, is_error=True, size=10))
+        self.assertFalse(self.writer.submit(lambda: None, is_error=True, size=10))
+        self.assertEqual(self.writer.stats()["queued_bytes"], 10)
+
+
+class APIAuditLogCreatedAtTests(TestCase):
+    def test_created_at_taken_on_the_request_thread_is_kept(self):
+        requested_at = timezone.now() - timedelta(seconds=5)
+        entry = APIAuditLog(endpoint="/api/v1/orders", request_method="GET", created_at=requested_at)
+        APIAuditLog.objects.bulk_create([entry])
+        self.assertEqual(APIAuditLog.objects.get(id=entry.id).created_at, requested_at)
@@ -34,6 +34,8 @@ class ModelAuditLogListView(APIView):
             queryset=queryset,
             page=params.get_value("page"),
             page_size=params.get_value("page_size"),
+            cursor=params.get_value("cursor", None),
+            with_total=params.get_value("with_total"),
         )
 
         return model_unwrap(data, include_timestamps=True), pagination
@@ -65,6 +67,8 @@ class APIAuditLogListView(APIView):
             queryset=queryset,
             page=params.get_value("page"),
             page_size=params.get_value("page_size"),
+            cursor=params.get_value("cursor", None),
+            with_total=params.get_value("with_total"),
         )
 
         return model_unwrap(data, include_timestamps=True), pagination
@@ -0,0 +1,156 @@
+import atexit
+import logging
+import os
+import queue
+import random
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+from auditing.models import APIAuditLog
+
+logger = logging.getLogger(__name__)
+
+# Share of the queue in use above which new rows are sampled instead of all kept
+BUSY_QUEUE_FRACTION = 0.8
+
+
+class APIAuditWriter:
+    """
+    Writes APIAuditLog rows from a background thread so requests never wait on the insert.
+
+    Requests submit a zero-argument callable that builds the row; the worker thread (with its own
+    database connection) builds the rows and writes them with bulk_create every
+    API_AUDIT_BATCH_SIZE rows or API_AUDIT_FLUSH_INTERVAL_MS milliseconds, whichever comes first.
+
+    The queue is bounded by API_AUDIT_QUEUE_SIZE rows and, since each row holds the raw request and
+    response bodies until it is built, by API_AUDIT_QUEUE_MAX_BYTES of body data. Once either is more
+    than BUSY_QUEUE_FRACTION used only API_AUDIT_BUSY_SAMPLE_RATE of the successful requests are kept
+    (errors always are), and when either is exhausted rows are dropped; both are counted and reported.
+    The queue is drained on interpreter exit.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._queue = None
+        self._thread = None
+        self._pid = None
+        self._stopping = threading.Event()
+        self._bytes_lock = threading.Lock()
+        self._queued_bytes = 0
+        self.written = 0
+        self.dropped = 0
+        self.sampled_out = 0
+        self.failed = 0
+
+    def _ensure_started(self):
+        # Started lazily (and again after a fork) so that every worker process runs its own thread
+        if self._pid == os.getpid() and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._pid == os.getpid() and self._thread.is_alive():
+                return
+            self._queue = queue.Queue(maxsize=settings.API_AUDIT_QUEUE_SIZE)
+            self._queued_bytes = 0
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="api-audit-writer", daemon=True)
+            self._thread.start()
+            if self._pid is None:
+                atexit.register(self.shutdown)
+            self._pid = os.getpid()
+
+    def submit(self, build_entry, is_error: bool = False, size: int = 0) -> bool:
+        """
+        Queues a row for writing. `size` is the number of body bytes `build_entry` holds on to.
+        Returns False when the row was sampled out or dropped.
+        """
+        self._ensure_started()
+        max_bytes = settings.API_AUDIT_QUEUE_MAX_BYTES
+        busy = self._queue.qsize() >= self._queue.maxsize * BUSY_QUEUE_FRACTION or self._queued_bytes >= max_bytes * BUSY_QUEUE_FRACTION
+        if not is_error and busy and random.random() >= settings.API_AUDIT_BUSY_SAMPLE_RATE:
+            self.sampled_out += 1
+            return False
+        with self._bytes_lock:
+            if self._queued_bytes + size > max_bytes:
+                self.dropped += 1
+                return False
+            self._queued_bytes += size
+        try:
+            self._queue.put_nowait((build_entry, size))
+        except queue.Full:
+            self._release(size)
+            self.dropped += 1
+            return False
+        return True
+
+    def _release(self, size: int):
+        with self._bytes_lock:
+            self._queued_bytes -= size
+
+    def stats(self) -> dict:
+        return {
+            "queued": self._queue.qsize() if self._queue else 0,
+            "queued_bytes": self._queued_bytes,
+            "written": self.written,
+            "dropped": self.dropped,
+            "sampled_out": self.sampled_out,
+            "failed": self.failed,
+        }
+
+    def shutdown(self, timeout: float = 5.0):
+        """Stops the worker after it has written everything already queued."""
+        if self._thread is None or self._pid != os.getpid() or not self._thread.is_alive():
+            return
+        self._stopping.set()
+        self._thread.join(timeout)
+
+    def _run(self):
+        batch_size = settings.API_AUDIT_BATCH_SIZE
+        interval = settings.API_AUDIT_FLUSH_INTERVAL_MS / 1000
+        reported_losses = 0
+        batch = []
+        deadline = time.monotonic() + interval
+        try:
+            while True:
+                stopping = self._stopping.is_set()
+                try:
+                    build_entry, size = self._queue.get(timeout=0 if stopping else max(deadline - time.monotonic(), 0.001))
+                    self._release(size)
+                    batch.append(build_entry)
+                except queue.Empty:
+                    if stopping:
+                        break
+                if len(batch) >= batch_size or time.monotonic() >= deadline:
+                    self._write(batch)
+                    batch = []
+                    deadline = time.monotonic() + interval
+                    losses = self.dropped + self.sampled_out
+                    if losses > reported_losses:
+                        logger.warning("API audit queue saturated: %s row(s) dropped, %s sampled out so far", self.dropped, self.sampled_out)
+                        reported_losses = losses
+            self._write(batch)
+        finally:
+            connection.close()
+
+    def _write(self, builders):
+        if not builders:
+            return
+        close_old_connections()
+        entries = []
+        for build_entry in builders:
+            try:
+                entries.append(build_entry())
+            except Exception:
+                self.failed += 1
+                logger.exception("Could not build API audit row")
+        try:
+            APIAuditLog.objects.bulk_create(entries)
+            self.written += len(entries)
+        except Exception:
+            self.failed += len(entries)
+            logger.exception("Could not write %s API audit row(s)", len(entries))
+
+
+api_audit_writer = APIAuditWriter()
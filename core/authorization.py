@@ -1,5 +1,6 @@
+from dataclasses import dataclass
 from functools import wraps
-from typing import Callable, List, Optional, Union
+from typing import Callable, Dict, Iterable, List, Optional, Union
 
 from django.core.exceptions import PermissionDenied
 from django.http import HttpRequest
@@ -106,9 +107,50 @@ class RolePermissions:
     ]
 
 
+# Every permission gets one bit, in declaration order; each role's permission list is compiled into one mask
+PERMISSION_BITS: Dict[str, int] = {
+    permission: 1 << index
+    for index, permission in enumerate(
+        dict.fromkeys(value for name, value in Permission.__dict__.items() if not name.startswith("__") and isinstance(value, str))
+    )
+}
+
+
+def compile_permission_mask(permissions: Iterable[str]) -> Optional[int]:
+    """ORs the bits of `permissions` together. Returns None when one of them is not a known permission."""
+    mask = 0
+    for permission in permissions:
+        if (bit := PERMISSION_BITS.get(permission)) is None:
+            return None
+        mask |= bit
+    return mask
+
+
+ROLE_PERMISSION_MASKS: Dict[str, int] = {
+    Staff.Role.ADMIN: compile_permission_mask(RolePermissions.ADMIN_PERMISSIONS) or 0,
+    Staff.Role.MANAGER: compile_permission_mask(RolePermissions.MANAGER_PERMISSIONS) or 0,
+    Staff.Role.SALES: compile_permission_mask(RolePermissions.SALES_PERMISSIONS) or 0,
+}
+
+
 class AuthorizationService:
     """Service for handling authorization logic"""
 
+    @staticmethod
+    def get_permission_mask(staff: Staff) -> int:
+        """Get the compiled permission mask for a specific user"""
+        return ROLE_PERMISSION_MASKS.get(staff.role, 0)
+
+    @staticmethod
+    def has_mask(staff: Staff, required_mask: Optional[int]) -> bool:
+        """Check if user holds every permission in a compiled mask (None never matches)"""
+        return required_mask is not None and ROLE_PERMISSION_MASKS.get(staff.role, 0) & required_mask == required_mask
+
+    @staticmethod
+    def has_any_mask(staff: Staff, mask: int) -> bool:
+        """Check if user holds at least one permission in a compiled mask"""
+        return bool(ROLE_PERMISSION_MASKS.get(staff.role, 0) & mask)
+
     @staticmethod
     def get_user_permissions(staff: Staff) -> List[str]:
         """Get permissions for a specific user"""
@@ -123,20 +165,73 @@ class AuthorizationService:
     @staticmethod
     def has_permission(staff: Staff, permission: str) -> bool:
         """Check if user has specific permission"""
-        user_permissions = AuthorizationService.get_user_permissions(staff)
-        return permission in user_permissions
+        return bool(ROLE_PERMISSION_MASKS.get(staff.role, 0) & PERMISSION_BITS.get(permission, 0))
 
     @staticmethod
     def has_any_permission(staff: Staff, permissions: List[str]) -> bool:
         """Check if user has any of the specified permissions"""
-        user_permissions = AuthorizationService.get_user_permissions(staff)
-        return any(permission in user_permissions for permission in permissions)
+        return AuthorizationService.has_any_mask(staff, compile_permission_mask(p for p in permissions if p in PERMISSION_BITS) or 0)
 
     @staticmethod
     def has_all_permissions(staff: Staff, permissions: List[str]) -> bool:
         """Check if user has all of the specified permissions"""
-        user_permissions = AuthorizationService.get_user_permissions(staff)
-        return all(permission in user_permissions for permission in permissions)
+        return AuthorizationService.has_mask(staff, compile_permission_mask(permissions))
+
+
+@dataclass(frozen=True)
+class EndpointRule:
+    """What an endpoint requires: all/any of `permissions`, a `role`, any authenticated staff, or nothing (public)"""
+
+    ALL = "all"
+    ANY = "any"
+    ROLE = "role"
+    AUTHENTICATED = "authenticated"
+    PUBLIC = "public"
+
+    kind: str
+    permissions: tuple = ()
+    role: Optional[str] = None
+
+
+class EndpointPermissionRegistry:
+    """
+    Central record of what every view handler requires, filled in by the decorators below.
+
+    Handlers are keyed by "<module>.<qualname>" (e.g. "orders.views.OrderView.post"), which is kept
+    by functools.wraps, so the key is the same whichever decorators wrap the handler. The
+    `check_endpoint_permissions` system check uses it to report handlers that declare nothing.
+    """
+
+    def __init__(self):
+        self._rules: Dict[str, EndpointRule] = {}
+
+    @staticmethod
+    def key(func: Callable) -> str:
+        return f"{func.__module__}.{func.__qualname__}"
+
+    def register(self, func: Callable, rule: EndpointRule):
+        self._rules[self.key(func)] = rule
+
+    def get(self, func: Callable) -> Optional[EndpointRule]:
+        return self._rules.get(self.key(func))
+
+    def rules(self) -> Dict[str, EndpointRule]:
+        return dict(self._rules)
+
+
+endpoint_permissions = EndpointPermissionRegistry()
+
+
+def allow_authenticated(func: Callable):
+    """Declares that any authenticated staff member may call the handler"""
+    endpoint_permissions.register(func, EndpointRule(EndpointRule.AUTHENTICATED))
+    return func
+
+
+def allow_public(func: Callable):
+    """Declares that the handler is reachable without authentication (its path must be in SKIP_AUTH_PATTERNS)"""
+    endpoint_permissions.register(func, EndpointRule(EndpointRule.PUBLIC))
+    return func
 
 
 class PermissionMixin:
@@ -191,7 +286,13 @@ class DRFPermission(BasePermission):
 def require_permission(permission: Union[str, List[str]]):
     """Decorator for requiring specific permissions"""
 
+    permissions = (permission,) if isinstance(permission, str) else tuple(permission)
+    # Compiled once per decorated handler; None (an unknown permission) is never granted
+    required_mask = compile_permission_mask(permissions)
+
     def decorator(func: Callable):
+        endpoint_permissions.register(func, EndpointRule(EndpointRule.ALL, permissions))
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Extract request from args (assuming it's the first argument after self)
@@ -207,12 +308,7 @@ def require_permission(permission: Union[str, List[str]]):
                     error=Unauthorized("Authentication required"),
                 ).response()
 
-            if isinstance(permission, str):
-                has_perm = AuthorizationService.has_permission(request.staff, permission)
-            else:
-                has_perm = AuthorizationService.has_all_permissions(request.staff, permission)
-
-            if not has_perm:
+            if not AuthorizationService.has_mask(request.staff, required_mask):
                 return APIResponse(
                     success=False,
                     status_code=status.HTTP_403_FORBIDDEN,
@@ -228,8 +324,11 @@ def require_permission(permission: Union[str, List[str]]):
 
 def require_any_permission(permissions: List[str]):
     """Decorator for requiring any of the specified permissions"""
+    mask = compile_permission_mask(p for p in permissions if p in PERMISSION_BITS) or 0
 
     def decorator(func: Callable):
+        endpoint_permissions.register(func, EndpointRule(EndpointRule.ANY, tuple(permissions)))
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             request = args[1] if len(args) > 1 else None
@@ -243,7 +342,7 @@ def require_any_permission(permissions: List[str]):
                     status=status.HTTP_401_UNAUTHORIZED,
                 )
 
-            if not AuthorizationService.has_any_permission(request.staff, permissions):
+            if not AuthorizationService.has_any_mask(request.staff, mask):
                 return Response(
                     {"error": "Insufficient permissions"},
                     status=status.HTTP_403_FORBIDDEN,
@@ -260,6 +359,8 @@ def require_role(role: str):
     """Decorator for requiring specific role"""
 
     def decorator(func: Callable):
+        endpoint_permissions.register(func, EndpointRule(EndpointRule.ROLE, role=role))
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             request = args[1] if len(args) > 1 else None
@@ -0,0 +1,42 @@
+from django.core.checks import Warning, register
+from django.urls import URLPattern, URLResolver, get_resolver
+
+from core.authorization import endpoint_permissions
+
+
+def iter_endpoints(patterns=None, prefix=""):
+    """Yields (route, handler) for every view handler reachable through the URLconf, skipping Django's own views."""
+    for pattern in get_resolver().url_patterns if patterns is None else patterns:
+        route = prefix + str(pattern.pattern)
+        if isinstance(pattern, URLResolver):
+            yield from iter_endpoints(pattern.url_patterns, route)
+            continue
+        if not isinstance(pattern, URLPattern) or pattern.callback.__module__.startswith("django."):
+            continue
+        view_class = getattr(pattern.callback, "view_class", None)
+        if view_class is None:
+            yield route, pattern.callback
+            continue
+        for method in view_class.http_method_names:
+            # options is answered by the framework itself; head falls back to get
+            if method not in ("options", "head") and (handler := getattr(view_class, method, None)):
+                yield route, handler
+
+
+@register("security")
+def check_endpoint_permissions(app_configs, **kwargs):
+    """Reports every endpoint handler that declares no permission rule (see core.authorization)."""
+    unprotected = {}
+    for route, handler in iter_endpoints():
+        if endpoint_permissions.get(handler) is None:
+            # A handler mounted on several routes is reported once, with its first route
+            unprotected.setdefault(endpoint_permissions.key(handler), (route, handler))
+    return [
+        Warning(
+            f"{key} ({route}) declares no permissions",
+            hint="Decorate it with require_permission, require_any_permission, require_role, allow_authenticated or allow_public.",
+            obj=handler,
+            id="core.W001",
+        )
+        for key, (route, handler) in unprotected.items()
+    ]
@@ -19,6 +19,8 @@ PRICE_MAX_DIGITS = 10
 PRICE_DECIMAL_PLACES = 2
 TAX_MAX_DIGITS = 5
 TAX_DECIMAL_PLACES = 2
+TOTAL_MAX_DIGITS = 18  # For order-level aggregates (sums of many price fields)
+TOTAL_DECIMAL_PLACES = 6  # Keeps tax amounts exact (price dp + tax dp + percentage scaling)
 
 # Default values
 DEFAULT_QUANTITY = 0
@@ -34,3 +36,12 @@ SERIALIZER_MAX_PHONE_LENGTH = PHONE_LENGTH
 
 PAGINATION_DEFAULT_PAGE = 1
 PAGINATION_DEFAULT_PAGE_SIZE = 10
+
+# Card image similarity (Hamming distance between 64-bit perceptual hashes)
+SIMILARITY_DEFAULT_MAX_DISTANCE = 6
+SIMILARITY_MAX_DISTANCE = 64
+SIMILARITY_DEFAULT_LIMIT = 20
+SIMILARITY_MAX_LIMIT = 100
+IMAGE_HASH_LENGTH = 16  # 64-bit hashes, hex encoded
+COLOR_HISTOGRAM_LENGTH = 128  # 64 one-byte bins, hex encoded
+SHA256_HEX_LENGTH = 64
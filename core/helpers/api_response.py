@@ -1,6 +1,74 @@
+import json
+import math
 from typing import Any, Dict, Optional
 
-from django.http import JsonResponse
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+class StdlibJSONRenderer:
+    """Encodes exactly as JsonResponse does (json.dumps with DjangoJSONEncoder)."""
+
+    name = "stdlib"
+
+    @staticmethod
+    def render(data: Any) -> bytes:
+        return json.dumps(data, cls=DjangoJSONEncoder).encode()
+
+
+class OrjsonJSONRenderer:
+    """
+    Encodes with orjson, producing the same values as StdlibJSONRenderer.
+
+    UUIDs, strings, numbers and containers are encoded natively. Datetimes are passed through to
+    DjangoJSONEncoder so they keep its millisecond precision and "Z" suffix, and Decimals become the
+    same strings as today. The output is compact and unescaped UTF-8, so it differs from the stdlib
+    output in whitespace and escaping only; this is why it is opt-in. Anything orjson rejects (e.g.
+    integers wider than 64 bits) or would change (NaN and infinities, which it writes as null) is
+    encoded with the stdlib renderer instead.
+    """
+
+    name = "orjson"
+    _encoder = DjangoJSONEncoder()
+
+    @staticmethod
+    def _has_non_finite_float(data: Any) -> bool:
+        if isinstance(data, float):
+            return not math.isfinite(data)
+        if isinstance(data, dict):
+            return any(OrjsonJSONRenderer._has_non_finite_float(value) for value in data.values())
+        if isinstance(data, (list, tuple)):
+            return any(OrjsonJSONRenderer._has_non_finite_float(value) for value in data)
+        return False
+
+    @staticmethod
+    def render(data: Any) -> bytes:
+        # Datetimes, Decimals and lazy strings reach DjangoJSONEncoder.default exactly as they do today
+        try:
+            output = orjson.dumps(data, default=OrjsonJSONRenderer._encoder.default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+        except orjson.JSONEncodeError:
+            return StdlibJSONRenderer.render(data)
+        # orjson writes non-finite floats as null, so only payloads containing a null need the check
+        if b"null" in output and OrjsonJSONRenderer._has_non_finite_float(data):
+            return StdlibJSONRenderer.render(data)
+        return output
+
+
+JSON_RENDERERS = {StdlibJSONRenderer.name: StdlibJSONRenderer, OrjsonJSONRenderer.name: OrjsonJSONRenderer}
+
+
+def get_json_renderer():
+    """Returns the renderer named by API_JSON_RENDERER, using the stdlib one when orjson is not installed."""
+    renderer = JSON_RENDERERS.get(settings.API_JSON_RENDERER, StdlibJSONRenderer)
+    if renderer is OrjsonJSONRenderer and orjson is None:
+        return StdlibJSONRenderer
+    return renderer
 
 
 class APIResponse:
@@ -28,7 +96,7 @@ class APIResponse:
             "details": getattr(self.error, "details", str(self.error)),
         }
 
-    def response(self) -> JsonResponse:
+    def response(self) -> HttpResponse:
         response_data: Dict[str, Any] = {
             "success": self.success,
         }
@@ -42,7 +110,7 @@ class APIResponse:
         if self.pagination:
             response_data["pagination"] = self.pagination
 
-        return JsonResponse(response_data, status=self.status_code)
+        return HttpResponse(get_json_renderer().render(response_data), content_type="application/json", status=self.status_code)
 
     def __str__(self) -> str:
         return f"APIResponse(success={self.success}, status_code={self.status_code}, data={self.data}, error={self.error})"
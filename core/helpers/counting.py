@@ -0,0 +1,81 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
+
+
+class QueryCounter:
+    """
+    Chooses how to produce a list's total_items.
+
+    On PostgreSQL the planner is asked first: pg_class.reltuples for an unfiltered table (summed over
+    the partitions of a partitioned one) or the EXPLAIN row estimate for a filtered query. When that
+    estimate reaches PAGINATION_ESTIMATE_THRESHOLD rows it is returned as is, since an exact COUNT(*)
+    would scan the whole range. Smaller sets, and every set on other databases, are counted exactly and
+    the result is cached per normalised query for PAGINATION_COUNT_CACHE_TTL seconds.
+    """
+
+    CACHE_PREFIX = "pagination:count"
+
+    @staticmethod
+    def count(queryset) -> tuple[int, bool]:
+        """Returns (total, estimated)."""
+        queryset = queryset.order_by()
+        connection = connections[queryset.db]
+        if connection.vendor == "postgresql":
+            estimate = QueryCounter._estimate(queryset, connection)
+            if estimate is not None and estimate >= settings.PAGINATION_ESTIMATE_THRESHOLD:
+                return estimate, True
+        return QueryCounter._exact(queryset), False
+
+    @staticmethod
+    def _cache_key(queryset) -> str:
+        sql, params = queryset.query.sql_with_params()
+        digest = hashlib.sha256(json.dumps([queryset.db, sql, [str(param) for param in params]]).encode()).hexdigest()
+        return f"{QueryCounter.CACHE_PREFIX}:{digest}"
+
+    @staticmethod
+    def _exact(queryset) -> int:
+        ttl = settings.PAGINATION_COUNT_CACHE_TTL
+        if ttl <= 0:
+            return queryset.count()
+        try:
+            key = QueryCounter._cache_key(queryset)
+        except EmptyResultSet:
+            # The query can never match (e.g. .none() or __in=[]), so it has no SQL to key on
+            return 0
+        if (total := cache.get(key)) is None:
+            total = queryset.count()
+            cache.set(key, total, ttl)
+        return total
+
+    @staticmethod
+    def _estimate(queryset, connection) -> int | None:
+        if not queryset.query.where:
+            return QueryCounter._table_estimate(queryset.model._meta.db_table, connection)
+        try:
+            sql, params = queryset.query.sql_with_params()
+        except EmptyResultSet:
+            return 0
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    @staticmethod
+    def _table_estimate(table: str, connection) -> int | None:
+        with connection.cursor() as cursor:
+            # reltuples is -1 until a table is analysed; a partitioned parent's estimate is the sum of its partitions
+            cursor.execute(
+                "SELECT CASE WHEN c.relkind = 'p' THEN ("
+                "SELECT SUM(p.reltuples) FROM pg_inherits i JOIN pg_class p ON p.oid = i.inhrelid WHERE i.inhparent = c.oid AND p.reltuples >= 0"
+                ") ELSE NULLIF(c.reltuples, -1) END FROM pg_class c WHERE c.oid = %s::regclass",
+                [table],
+            )
+            estimate = cursor.fetchone()[0]
+        return int(estimate) if estimate is not None else None
@@ -1,11 +1,24 @@
-import os
+import logging
+from dataclasses import dataclass
 
-import shortuuid
 from django.conf import settings
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from django.utils._os import safe_join
 
 from core.exceptions import BadRequest, InternalServerError
+from core.helpers.image_utils import ImageFingerprint, ImageUtils
+from core.helpers.image_variants import ImageVariants
+from core.helpers.media_storage import media_storage
+from core.models import MediaBlob
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StoredImage:
+    url: str
+    variants: dict
+    fingerprint: ImageFingerprint
 
 
 class ImageUpload:
@@ -21,23 +34,46 @@ class ImageUpload:
             raise BadRequest("Invalid image extension")
 
     @staticmethod
-    def upload_image_and_get_url(image: InMemoryUploadedFile):
+    def get_media_path(image_url: str) -> str | None:
+        """Maps a URL returned by upload_image_and_get_url back to its file under MEDIA_ROOT."""
+        relative_path = media_storage.relative_path_for_url(image_url)
+        if not relative_path:
+            return None
+        try:
+            return safe_join(settings.MEDIA_ROOT, relative_path)
+        except Exception:
+            return None
+
+    @staticmethod
+    def store_image(image: InMemoryUploadedFile) -> MediaBlob:
         ImageUpload.verify_image(image)
-        image.file.seek(0)
         try:
-            extension = os.path.splitext(image.name)[1].lstrip(".")
-            filename = f"{shortuuid.uuid()}.{extension}"
-            relative_dir = settings.IMAGE_UPLOAD_FOLDER.strip("/")
-            relative_path = os.path.join(relative_dir, filename)
-            destination_dir = safe_join(settings.MEDIA_ROOT, relative_dir)
-            os.makedirs(destination_dir, exist_ok=True)
-            destination_path = safe_join(destination_dir, filename)
-            with open(destination_path, "wb") as out_file:
-                out_file.write(image.file.read())
-            public_base = settings.PUBLIC_BASE_URL.rstrip("/") if settings.PUBLIC_BASE_URL else ""
-            if public_base:
-                return f"{public_base}{settings.MEDIA_URL}{relative_path}"
-            return f"{settings.MEDIA_URL}{relative_path}"
+            return media_storage.store(image)
         except Exception as e:
             print(e)
             raise InternalServerError("Failed to upload image")
+
+    @staticmethod
+    def upload_image_and_get_url(image: InMemoryUploadedFile):
+        blob = ImageUpload.store_image(image)
+        return media_storage.url_for(blob.path)
+
+    @staticmethod
+    def upload_card_image(image: InMemoryUploadedFile) -> StoredImage:
+        """
+        Streams the upload into storage, then builds its fingerprint and its thumbnail/medium variants
+        from the stored file.
+
+        The fingerprint gets its own handle: draft() only applies once per decode, so a handle drafted
+        at variant size would hash differently from the query images hashed by generate_fingerprint.
+        """
+        blob = ImageUpload.store_image(image)
+        source_path = media_storage.path(blob.path)
+        try:
+            fingerprint = ImageUtils.fingerprint_file(source_path)
+            with ImageVariants.open_for_variants(source_path) as source:
+                variants = ImageVariants.generate_from_image(source, blob.digest)
+        except Exception:
+            logger.exception("Failed to process image")
+            raise InternalServerError("Failed to process image")
+        return StoredImage(url=media_storage.url_for(blob.path), variants=variants, fingerprint=fingerprint)
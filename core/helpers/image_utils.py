@@ -1,20 +1,81 @@
+from dataclasses import dataclass
+
 import imagehash
+import numpy as np
 import shortuuid
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from PIL import Image
 
 from core.exceptions import InternalServerError
 
+# Images are decoded at roughly this size before hashing; every hash works on 32x32 pixels or less
+FINGERPRINT_WORKING_SIZE = 128
+# Levels kept per RGB channel in the colour histogram (4 levels -> 64 bins)
+COLOR_HISTOGRAM_LEVELS = 4
+
+
+@dataclass(frozen=True)
+class ImageFingerprint:
+    average_hash: str
+    phash: str
+    dhash: str
+    color_histogram: str
+
+    def as_card_fields(self) -> dict:
+        return {"perceptual_hash": self.average_hash, "phash": self.phash, "dhash": self.dhash, "color_histogram": self.color_histogram}
+
 
 class ImageUtils:
     @staticmethod
-    def generate_perceptual_hash(image: InMemoryUploadedFile) -> str:
+    def _downsample(pil_image: Image.Image) -> Image.Image:
+        # JPEG can decode straight at 1/2, 1/4 or 1/8 scale; other formats are shrunk right after decoding
+        pil_image.draft("RGB", (FINGERPRINT_WORKING_SIZE, FINGERPRINT_WORKING_SIZE))
+        factor = min(pil_image.size) // FINGERPRINT_WORKING_SIZE
+        if factor > 1:
+            pil_image = pil_image.reduce(factor)
+        return pil_image.convert("RGB")
+
+    @staticmethod
+    def _color_histogram(rgb_image: Image.Image) -> str:
+        """64-bin RGB histogram, L1-normalised to one byte per bin and hex encoded."""
+        pixels = np.asarray(rgb_image, dtype=np.uint8).reshape(-1, 3) // (256 // COLOR_HISTOGRAM_LEVELS)
+        bins = (pixels[:, 0].astype(np.intp) * COLOR_HISTOGRAM_LEVELS + pixels[:, 1]) * COLOR_HISTOGRAM_LEVELS + pixels[:, 2]
+        counts = np.bincount(bins, minlength=COLOR_HISTOGRAM_LEVELS**3)
+        scaled = np.rint(counts * 255 / max(counts.sum(), 1)).astype(np.uint8)
+        return scaled.tobytes().hex()
+
+    @staticmethod
+    def fingerprint_image(pil_image: Image.Image) -> ImageFingerprint:
+        rgb_image = ImageUtils._downsample(pil_image)
+        gray_image = rgb_image.convert("L")
+        return ImageFingerprint(
+            average_hash=str(imagehash.average_hash(gray_image)),
+            phash=str(imagehash.phash(gray_image)),
+            dhash=str(imagehash.dhash(gray_image)),
+            color_histogram=ImageUtils._color_histogram(rgb_image),
+        )
+
+    @staticmethod
+    def fingerprint_file(path: str) -> ImageFingerprint:
+        with Image.open(path) as pil_image:
+            return ImageUtils.fingerprint_image(pil_image)
+
+    @staticmethod
+    def generate_fingerprint(image: InMemoryUploadedFile) -> ImageFingerprint:
         try:
             image.file.seek(0)
-            pil_image = Image.open(image.file)
-            hash_value = imagehash.average_hash(pil_image)
-            return str(hash_value)
+            with Image.open(image.file) as pil_image:
+                return ImageUtils.fingerprint_image(pil_image)
         except Exception:
+            raise InternalServerError("Failed to generate image fingerprint")
+        finally:
+            image.file.seek(0)
+
+    @staticmethod
+    def generate_perceptual_hash(image: InMemoryUploadedFile) -> str:
+        try:
+            return ImageUtils.generate_fingerprint(image).average_hash
+        except InternalServerError:
             raise InternalServerError("Failed to generate perceptual hash")
 
     @staticmethod
@@ -0,0 +1,102 @@
+import hashlib
+import os
+import tempfile
+
+from django.conf import settings
+from django.utils._os import safe_join
+from PIL import Image, ImageOps
+
+# Longest edge in pixels of each generated variant
+IMAGE_VARIANT_SIZES = {"thumbnail": 320, "medium": 1024}
+# Encoded formats written for every variant: extension -> (PIL format, save options)
+IMAGE_VARIANT_FORMATS = {
+    "webp": ("WEBP", {"quality": 80, "method": 4}),
+    "jpeg": ("JPEG", {"quality": 82, "optimize": True, "progressive": True}),
+}
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+class ImageVariants:
+    """
+    Resized WebP/JPEG copies of uploaded images, stored content-addressed under
+    MEDIA_ROOT/<IMAGE_VARIANT_FOLDER>/<sha256[:2]>/<sha256>/<variant>.<ext>, where sha256 is the digest
+    of the original file. Identical uploads therefore share variants and existing files are never rewritten.
+    """
+
+    @staticmethod
+    def file_digest(path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as source:
+            for chunk in iter(lambda: source.read(READ_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def media_url(relative_path: str) -> str:
+        public_base = settings.PUBLIC_BASE_URL.rstrip("/") if settings.PUBLIC_BASE_URL else ""
+        return f"{public_base}{settings.MEDIA_URL}{relative_path}"
+
+    @staticmethod
+    def _write_atomic(image: Image.Image, destination_path: str, pil_format: str, options: dict):
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(destination_path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as out_file:
+                image.save(out_file, format=pil_format, **options)
+            os.replace(temp_path, destination_path)
+        except Exception:
+            os.unlink(temp_path)
+            raise
+
+    @staticmethod
+    def generate(source_path: str, digest: str | None = None) -> dict:
+        """
+        Writes any missing variants of the image at source_path and returns their URLs as
+        {variant: {extension: url}}.
+        """
+        digest = digest or ImageVariants.file_digest(source_path)
+        with Image.open(source_path) as source:
+            return ImageVariants.generate_from_image(source, digest)
+
+    @staticmethod
+    def open_for_variants(source_path: str) -> Image.Image:
+        """Opens an image and decodes JPEGs at the smallest scale still covering the largest variant."""
+        source = Image.open(source_path)
+        source.draft("RGB", ImageVariants._draft_size(source.size))
+        source.load()
+        return source
+
+    @staticmethod
+    def _draft_size(size: tuple[int, int]) -> tuple[int, int]:
+        # draft() keeps both edges at least this large; scale the box so only the longest edge has to cover the largest variant
+        largest = max(IMAGE_VARIANT_SIZES.values())
+        longest_edge = max(max(size), 1)
+        return max(1, -(-size[0] * largest // longest_edge)), max(1, -(-size[1] * largest // longest_edge))
+
+    @staticmethod
+    def generate_from_image(source: Image.Image, digest: str) -> dict:
+        """Same as generate() for an image that is already open (it is not modified)."""
+        relative_dir = "/".join([settings.IMAGE_VARIANT_FOLDER.strip("/"), digest[:2], digest])
+        destination_dir = safe_join(settings.MEDIA_ROOT, relative_dir)
+        os.makedirs(destination_dir, exist_ok=True)
+
+        targets = {(variant, extension): f"{variant}.{extension}" for variant in IMAGE_VARIANT_SIZES for extension in IMAGE_VARIANT_FORMATS}
+        missing = {key for key, filename in targets.items() if not os.path.exists(os.path.join(destination_dir, filename))}
+
+        if missing:
+            source.draft("RGB", ImageVariants._draft_size(source.size))
+            # Shrink before rotating so only the small copy is transposed (convert keeps the EXIF orientation)
+            largest = max(IMAGE_VARIANT_SIZES.values())
+            base = source.convert("RGB")
+            base.thumbnail((largest, largest), Image.Resampling.LANCZOS)
+            base = ImageOps.exif_transpose(base)
+            # Largest first so each smaller variant is resized from the previous one
+            for variant, size in sorted(IMAGE_VARIANT_SIZES.items(), key=lambda item: -item[1]):
+                base.thumbnail((size, size), Image.Resampling.LANCZOS)
+                for extension, (pil_format, options) in IMAGE_VARIANT_FORMATS.items():
+                    if (variant, extension) in missing:
+                        ImageVariants._write_atomic(base, os.path.join(destination_dir, targets[(variant, extension)]), pil_format, options)
+
+        variants: dict = {}
+        for (variant, extension), filename in targets.items():
+            variants.setdefault(variant, {})[extension] = ImageVariants.media_url(f"{relative_dir}/{filename}")
+        return variants
@@ -0,0 +1,128 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.db.models import F
+from django.utils import timezone
+from django.utils._os import safe_join
+
+from core.helpers.image_variants import ImageVariants
+from core.models import MediaBlob
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    Stores each distinct file once under MEDIA_ROOT/<folder>/<sha256[:2]>/<sha256><ext>.
+
+    Uploads are streamed through SHA-256 chunk by chunk; when a blob with the same digest already
+    exists its file is reused. MediaBlob.ref_count tracks how many records point at a blob
+    (see acquire/release), and collect_garbage removes blobs nobody references any more.
+    """
+
+    def __init__(self, folder: str | None = None):
+        super().__init__(location=settings.MEDIA_ROOT, base_url=settings.MEDIA_URL)
+        self.folder = (folder or settings.IMAGE_UPLOAD_FOLDER).strip("/")
+
+    def digest_path(self, digest: str, extension: str) -> str:
+        return f"{self.folder}/{digest[:2]}/{digest}{extension.lower()}"
+
+    def url_for(self, relative_path: str) -> str:
+        return ImageVariants.media_url(relative_path)
+
+    def relative_path_for_url(self, url: str) -> str | None:
+        _, marker, relative_path = url.partition(settings.MEDIA_URL)
+        return relative_path if marker and relative_path else None
+
+    def _spool(self, uploaded_file) -> tuple[str, str, int]:
+        """
+        Streams the upload chunk by chunk into a temp file inside the storage folder (same filesystem as
+        the final location, so it can be renamed into place) while hashing it. Returns (temp_path, digest, size).
+        """
+        spool_dir = self.path(self.folder)
+        os.makedirs(spool_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=spool_dir, suffix=".tmp")
+        digest, size = hashlib.sha256(), 0
+        try:
+            with os.fdopen(fd, "wb") as out_file:
+                uploaded_file.seek(0)
+                for chunk in uploaded_file.chunks():
+                    digest.update(chunk)
+                    out_file.write(chunk)
+                    size += len(chunk)
+        except Exception:
+            os.unlink(temp_path)
+            raise
+        return temp_path, digest.hexdigest(), size
+
+    def store(self, uploaded_file) -> MediaBlob:
+        """Stores an uploaded file (or reuses the identical stored one) and returns its blob. ref_count is not changed."""
+        temp_path, digest, size = self._spool(uploaded_file)
+        try:
+            blob = MediaBlob.objects.filter(digest=digest).first()
+            if blob and self.exists(blob.path):
+                return blob
+
+            relative_path = blob.path if blob else self.digest_path(digest, os.path.splitext(uploaded_file.name)[1])
+            destination_path = self.path(relative_path)
+            os.makedirs(os.path.dirname(destination_path), exist_ok=True)
+            os.replace(temp_path, destination_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+        blob, _ = MediaBlob.objects.update_or_create(digest=digest, defaults={"path": relative_path, "size": size})
+        return blob
+
+    def adopt(self, source_path: str) -> MediaBlob:
+        """Copies an existing file under MEDIA_ROOT into the content-addressed layout (hard link when possible)."""
+        digest, size = ImageVariants.file_digest(source_path), os.path.getsize(source_path)
+
+        blob = MediaBlob.objects.filter(digest=digest).first()
+        relative_path = blob.path if blob else self.digest_path(digest, os.path.splitext(source_path)[1])
+        destination_path = self.path(relative_path)
+        if not os.path.exists(destination_path):
+            os.makedirs(os.path.dirname(destination_path), exist_ok=True)
+            try:
+                os.link(source_path, destination_path)
+            except OSError:
+                shutil.copy2(source_path, destination_path)
+        if not blob:
+            blob = MediaBlob.objects.create(digest=digest, path=relative_path, size=size)
+        return blob
+
+    # ------------------------------------------------------------------
+    # Reference counting
+    # ------------------------------------------------------------------
+    def _update_ref_count(self, url: str, delta: int):
+        relative_path = self.relative_path_for_url(url or "")
+        if relative_path:
+            MediaBlob.objects.filter(path=relative_path).update(ref_count=F("ref_count") + delta, updated_at=timezone.now())
+
+    def acquire(self, url: str):
+        self._update_ref_count(url, 1)
+
+    def release(self, url: str):
+        self._update_ref_count(url, -1)
+
+    def collect_garbage(self, grace: timedelta, dry_run: bool = False) -> list[MediaBlob]:
+        """
+        Deletes blobs (file, generated variants and row) that have had no references for at least `grace`.
+        The grace period keeps files uploaded for a record that has not been saved yet.
+        """
+        orphans = list(MediaBlob.objects.filter(ref_count__lte=0, updated_at__lt=timezone.now() - grace))
+        if dry_run:
+            return orphans
+        for blob in orphans:
+            if self.exists(blob.path):
+                self.delete(blob.path)
+            variants_dir = safe_join(settings.MEDIA_ROOT, settings.IMAGE_VARIANT_FOLDER.strip("/"), blob.digest[:2], blob.digest)
+            shutil.rmtree(variants_dir, ignore_errors=True)
+            blob.delete()
+        return orphans
+
+
+media_storage = ContentAddressedStorage()
@@ -1,6 +1,13 @@
 from typing import Any, Dict
 
+from django.core import signing
 from django.core.paginator import Paginator
+from django.db.models import Q
+
+from core.exceptions import BadRequest
+from core.helpers.counting import QueryCounter
+
+CURSOR_SALT = "core.pagination.cursor"
 
 
 class PaginationHelper:
@@ -9,6 +16,8 @@ class PaginationHelper:
         queryset,
         page: int,
         page_size: int,
+        cursor: str | None = None,
+        with_total: bool = False,
     ) -> tuple[Dict[str, Any], Dict[str, Any]]:
         """
         Paginate a queryset and return data and pagination info as tuple.
@@ -17,17 +26,26 @@ class PaginationHelper:
             queryset: Django QuerySet to paginate
             page: Page number (1-indexed)
             page_size: Number of items per page
+            cursor: Opt into keyset pagination; "" requests the first page, otherwise a cursor from a previous response
+            with_total: In cursor mode, whether to also count the matching rows
 
         Returns:
             Tuple of (data_dict, pagination_dict) for use with @forge decorator
         """
+        if cursor is not None:
+            return PaginationHelper.paginate_by_cursor(queryset, cursor, page_size, with_total)
+
+        total_items, estimated = QueryCounter.count(queryset)
+        if estimated:
+            return PaginationHelper._paginate_estimated(queryset, page, page_size, total_items)
+
         paginator = Paginator(queryset, page_size)
+        # The total comes from the count strategy (possibly cached) rather than a fresh COUNT(*)
+        paginator.count = total_items
         total_pages = paginator.num_pages
 
         # Check if the requested page is valid
         if page > total_pages and total_pages > 0:
-            from core.exceptions import BadRequest
-
             raise BadRequest(f"Page {page} does not exist. Total pages: {total_pages}")
 
         page_obj = paginator.get_page(page)
@@ -36,6 +54,7 @@ class PaginationHelper:
             "current_page": page,
             "page_size": page_size,
             "total_items": page_obj.paginator.count,
+            "total_items_estimated": False,
             "total_pages": page_obj.paginator.num_pages,
             "has_next": page_obj.has_next(),
             "has_previous": page_obj.has_previous(),
@@ -44,3 +63,129 @@ class PaginationHelper:
         }
 
         return page_obj.object_list, pagination_info
+
+    @staticmethod
+    def _paginate_estimated(queryset, page: int, page_size: int, total_items: int) -> tuple[list, Dict[str, Any]]:
+        """Offset pagination against an estimated total: pages are never rejected, and has_next comes from an extra row."""
+        offset = (page - 1) * page_size
+        rows = list(queryset[offset : offset + page_size + 1])
+        has_next = len(rows) > page_size
+        pagination_info = {
+            "current_page": page,
+            "page_size": page_size,
+            "total_items": total_items,
+            "total_items_estimated": True,
+            "total_pages": max(-(-total_items // page_size), page),
+            "has_next": has_next,
+            "has_previous": page > 1,
+            "next_page": page + 1 if has_next else None,
+            "previous_page": page - 1 if page > 1 else None,
+        }
+        return rows[:page_size], pagination_info
+
+    @staticmethod
+    def paginate_by_cursor(queryset, cursor: str, page_size: int, with_total: bool = False) -> tuple[list, Dict[str, Any]]:
+        """
+        Keyset pagination over the queryset's ordering (plus the primary key as a tie-breaker).
+
+        Each page is a single indexed range scan: no OFFSET, and no COUNT(*) unless with_total is set.
+        Cursors are signed, opaque tokens holding the sort values of the first or last row of a page and
+        are only valid for the ordering they were issued for. Sort fields (model fields or annotations)
+        must not be nullable.
+        """
+        ordering = PaginationHelper._keyset_ordering(queryset)
+        signature = [f"-{field}" if descending else field for field, descending in ordering]
+        total_items, estimated = QueryCounter.count(queryset) if with_total else (None, False)
+
+        direction, values = "next", None
+        if cursor:
+            try:
+                payload = signing.loads(cursor, salt=CURSOR_SALT)
+            except signing.BadSignature:
+                raise BadRequest("Invalid pagination cursor")
+            if payload.get("o") != signature:
+                raise BadRequest("Pagination cursor does not match the requested sort")
+            direction = payload["d"]
+            values = [PaginationHelper._field(queryset, field).to_python(value) for (field, _), value in zip(ordering, payload["v"])]
+
+        backwards = direction == "prev"
+        page_queryset = queryset
+        if values is not None:
+            page_queryset = page_queryset.filter(PaginationHelper._after(ordering, values, backwards))
+        if backwards:
+            page_queryset = page_queryset.order_by(*[field if descending else f"-{field}" for field, descending in ordering])
+        else:
+            page_queryset = page_queryset.order_by(*signature)
+
+        rows = list(page_queryset[: page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if backwards:
+            rows.reverse()
+
+        has_next = has_more if not backwards else True
+        has_previous = has_more if backwards else values is not None
+
+        def _cursor(row, cursor_direction):
+            row_values = [PaginationHelper._value(row, field) for field, _ in ordering]
+            return signing.dumps({"o": signature, "d": cursor_direction, "v": [str(value) for value in row_values]}, salt=CURSOR_SALT, compress=True)
+
+        pagination_info = {
+            "current_page": None,
+            "page_size": page_size,
+            "total_items": total_items,
+            "total_items_estimated": estimated,
+            "total_pages": -(-total_items // page_size) if total_items is not None else None,
+            "has_next": has_next and bool(rows),
+            "has_previous": has_previous and bool(rows),
+            "next_page": None,
+            "previous_page": None,
+            "next_cursor": _cursor(rows[-1], "next") if rows and has_next else None,
+            "previous_cursor": _cursor(rows[0], "prev") if rows and has_previous else None,
+        }
+
+        return rows, pagination_info
+
+    @staticmethod
+    def _keyset_ordering(queryset) -> list[tuple[str, bool]]:
+        """The queryset's ordering as [(field, descending)], always ending with the primary key."""
+        order_by = queryset.query.order_by or queryset.model._meta.ordering or ()
+        pk_name = queryset.model._meta.pk.name
+        ordering = []
+        for item in order_by:
+            if not isinstance(item, str) or item == "?":
+                raise BadRequest("Cursor pagination needs a field ordering")
+            descending = item.startswith("-")
+            field = item.lstrip("-+")
+            ordering.append((pk_name if field == "pk" else field, descending))
+        if not any(field == pk_name for field, _ in ordering):
+            ordering.append((pk_name, ordering[-1][1] if ordering else False))
+        return ordering
+
+    @staticmethod
+    def _after(ordering, values, backwards: bool) -> Q:
+        """Rows strictly after the given sort values: (a > x) OR (a = x AND b > y) OR ..."""
+        condition = Q()
+        for index, (field, descending) in enumerate(ordering):
+            lookup = "lt" if descending != backwards else "gt"
+            clause = Q(**{f"{field}__{lookup}": values[index]})
+            for previous_index in range(index):
+                clause &= Q(**{ordering[previous_index][0]: values[previous_index]})
+            condition |= clause
+        return condition
+
+    @staticmethod
+    def _field(queryset, path: str):
+        if path in queryset.query.annotations:
+            return queryset.query.annotations[path].output_field
+        model, field = queryset.model, None
+        for name in path.split("__"):
+            field = model._meta.get_field(name)
+            model = field.related_model or model
+        return field.target_field if field.is_relation else field
+
+    @staticmethod
+    def _value(row, path: str):
+        for name in path.split("__"):
+            row = getattr(row, name)
+        return row.pk if hasattr(row, "_meta") else row
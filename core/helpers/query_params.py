@@ -9,6 +9,9 @@ from core.helpers.param_serializer import ParamSerializer
 class BaseListParams(ParamSerializer):
     page = serializers.IntegerField(required=False, default=PAGINATION_DEFAULT_PAGE)
     page_size = serializers.IntegerField(required=False, default=PAGINATION_DEFAULT_PAGE_SIZE)
+    # Keyset pagination: pass an empty cursor for the first page, then the next/previous cursor from the response
+    cursor = serializers.CharField(required=False, allow_blank=True)
+    with_total = serializers.BooleanField(required=False, default=False)
 
     def validate_page_size(self, value):
         # Cap page size to prevent accidental large queries
@@ -0,0 +1,68 @@
+import re
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+# Setting holding the path prefixes for each flag
+FLAG_SETTINGS = {
+    "public": "SKIP_AUTH_PATTERNS",
+    "no_audit": "AUDIT_EXCLUDED_PATHS",
+    "no_log": "API_LOG_EXCLUDED_PATHS",
+}
+
+
+@dataclass(frozen=True)
+class RouteFlags:
+    public: bool = False  # no authentication (AuthMiddleware passes it straight through)
+    no_audit: bool = False  # no APIAuditLog row
+    no_log: bool = False  # no console logging and no APIAuditLog row
+
+
+class RouteClassifier:
+    """
+    Classifies request paths into RouteFlags.
+
+    Each flag's path prefixes are compiled once into a single anchored regex, so classifying a path
+    costs one match per flag however many prefixes are configured. The regexes are rebuilt when one
+    of the settings changes (e.g. override_settings).
+    """
+
+    _patterns: dict | None = None
+
+    @staticmethod
+    def _compile(prefixes) -> re.Pattern | None:
+        prefixes = [prefix for prefix in prefixes if prefix]
+        if not prefixes:
+            return None
+        # Longest first so that alternation never stops at a shorter prefix of a longer one
+        return re.compile("|".join(re.escape(prefix) for prefix in sorted(prefixes, key=len, reverse=True)))
+
+    @classmethod
+    def patterns(cls) -> dict:
+        if cls._patterns is None:
+            cls._patterns = {flag: cls._compile(getattr(settings, name, [])) for flag, name in FLAG_SETTINGS.items()}
+        return cls._patterns
+
+    @classmethod
+    def classify(cls, path: str) -> RouteFlags:
+        patterns = cls.patterns()
+        return RouteFlags(**{flag: bool(pattern and pattern.match(path)) for flag, pattern in patterns.items()})
+
+    @classmethod
+    def reset(cls):
+        cls._patterns = None
+
+
+def route_flags(request) -> RouteFlags:
+    """Returns the request's RouteFlags, classifying its path on first use and keeping the result on the request."""
+    if (flags := getattr(request, "route_flags", None)) is None:
+        flags = request.route_flags = RouteClassifier.classify(request.path_info)
+    return flags
+
+
+@receiver(setting_changed)
+def _reset_route_patterns(setting, **kwargs):
+    if setting in FLAG_SETTINGS.values():
+        RouteClassifier.reset()
@@ -1,24 +1,160 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from typing import Any, Tuple
+from typing import Any, Optional, Tuple
 
 import jwt
 from django.conf import settings
 from django.utils import timezone
 from passlib.context import CryptContext
 
-from core.exceptions import Unauthorized
+from core.exceptions import TooManyRequests, Unauthorized
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU cache of tokens that already passed jwt.decode, keyed by the SHA-256 digest of the token.
+
+    A hit skips the HMAC verification and costs one hash and one dict lookup. Entries are only
+    returned before the token's exp, and the cache empties itself when TOKEN_SECRET changes so a
+    rotated secret can never accept a token signed with the old one. revoke_staff drops every token of
+    a staff member (called when a Staff row is saved or deleted, see accounts.signals). At most
+    TOKEN_CACHE_SIZE entries are kept; 0 disables the cache.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+        self._secret = None
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def _check_secret(self):
+        # Called with the lock held
+        if self._secret != settings.TOKEN_SECRET:
+            self._entries.clear()
+            self._secret = settings.TOKEN_SECRET
+
+    def get(self, token: str) -> dict | None:
+        key = self.digest(token)
+        with self._lock:
+            self._check_secret()
+            claims = self._entries.get(key)
+            if claims is None or claims["exp"] <= time.time():
+                if claims is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(claims)
+
+    def set(self, token: str, claims: dict):
+        # Tokens without a numeric expiry are never cached
+        if settings.TOKEN_CACHE_SIZE <= 0 or not isinstance(claims.get("exp"), (int, float)):
+            return
+        key = self.digest(token)
+        with self._lock:
+            self._check_secret()
+            self._entries[key] = dict(claims)
+            self._entries.move_to_end(key)
+            while len(self._entries) > settings.TOKEN_CACHE_SIZE:
+                self._entries.popitem(last=False)
+
+    def revoke_staff(self, staff_id):
+        staff_id = str(staff_id)
+        with self._lock:
+            for key in [key for key, claims in self._entries.items() if str(claims.get("staff_id")) == staff_id]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+verified_token_cache = VerifiedTokenCache()
+
+
+class PasswordHashExecutor:
+    """
+    Runs bcrypt hashing and verification on a small dedicated thread pool.
+
+    At most PASSWORD_HASH_CONCURRENCY hashes run at once per process. A caller waits up to
+    PASSWORD_HASH_QUEUE_TIMEOUT seconds for a free slot and then gets TooManyRequests, so a burst of
+    logins is turned away quickly instead of occupying every worker and CPU core with bcrypt.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pool = None
+        self._slots = None
+        self._config = None
+
+    def _ensure_started(self):
+        # Rebuilt after a fork (each worker process gets its own pool) and when the concurrency setting changes
+        config = (os.getpid(), settings.PASSWORD_HASH_CONCURRENCY)
+        if self._config == config:
+            return
+        with self._lock:
+            if self._config == config:
+                return
+            if self._pool is not None and self._config[0] == config[0]:
+                self._pool.shutdown(wait=False)
+            self._pool = ThreadPoolExecutor(max_workers=config[1], thread_name_prefix="password-hash")
+            self._slots = threading.BoundedSemaphore(config[1])
+            self._config = config
+
+    def run(self, func, *args):
+        self._ensure_started()
+        slots, pool = self._slots, self._pool
+        if not slots.acquire(timeout=settings.PASSWORD_HASH_QUEUE_TIMEOUT):
+            raise TooManyRequests("Too many sign-ins in progress, please try again shortly")
+        try:
+            return pool.submit(func, *args).result()
+        finally:
+            slots.release()
+
+
+password_hash_executor = PasswordHashExecutor()
 
 
 class Security:
-    _pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    # Hashes at any other cost are rehashed on the next successful login (see verify_and_update_password)
+    _pwd_context = CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+        bcrypt__min_rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+        bcrypt__max_rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+    )
 
     @staticmethod
     def get_password_hash(password: str) -> str:
-        return str(Security._pwd_context.hash(password))
+        return str(password_hash_executor.run(Security._pwd_context.hash, password))
 
     @staticmethod
     def verify_password(password: str, hashed_password: str) -> bool:
-        return bool(Security._pwd_context.verify(password, hashed_password))
+        return bool(password_hash_executor.run(Security._pwd_context.verify, password, hashed_password))
+
+    @staticmethod
+    def verify_and_update_password(password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """Verify a password and return (verified, new hash); the new hash is set when the stored one uses outdated parameters"""
+        verified, new_hash = password_hash_executor.run(Security._pwd_context.verify_and_update, password, hashed_password)
+        return bool(verified), new_hash
 
     @staticmethod
     def create_token(data: dict):
@@ -34,6 +170,14 @@ class Security:
     @staticmethod
     def verify_token(token: str) -> Tuple[str, Any]:
         """Verify JWT token and return staff_id and expiry"""
+        payload = Security.verify_token_claims(token)
+        return payload["staff_id"], payload.get("exp")
+
+    @staticmethod
+    def verify_token_claims(token: str) -> dict:
+        """Verify JWT token and return its claims (staff_id, role, exp, iat)"""
+        if settings.TOKEN_CACHE_SIZE > 0 and (claims := verified_token_cache.get(token)):
+            return claims
         try:
             payload = jwt.decode(token, settings.TOKEN_SECRET, algorithms=[settings.ALGORITHM])
 
@@ -44,7 +188,8 @@ class Security:
             # JWT library handles expiration automatically
             # If token is expired, jwt.decode will raise jwt.ExpiredSignatureError
 
-            return staff_id, payload.get("exp")
+            verified_token_cache.set(token, payload)
+            return payload
         except jwt.ExpiredSignatureError:
             raise Unauthorized("Token expired")
         except jwt.InvalidTokenError as e:
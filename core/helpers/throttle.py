@@ -0,0 +1,47 @@
+import hashlib
+import time
+
+from django.core.cache import cache
+
+
+class SlidingWindowThrottle:
+    """
+    Sliding-window counters kept in the Django cache, shared by every process using the same cache backend.
+
+    Each (scope, key) is counted in fixed windows of `window` seconds. The current count is the
+    current window's count plus the previous window's count weighted by how much of it still lies
+    inside the sliding window, which approximates a true sliding log with two cache entries.
+    """
+
+    CACHE_PREFIX = "throttle"
+
+    @staticmethod
+    def _cache_keys(scope: str, key: str, window: int, now: float) -> tuple[str, str]:
+        # Hashed so that any phone number or address makes a valid cache key
+        digest = hashlib.sha256(str(key).encode()).hexdigest()[:32]
+        index = int(now // window)
+        prefix = f"{SlidingWindowThrottle.CACHE_PREFIX}:{scope}:{digest}"
+        return f"{prefix}:{index}", f"{prefix}:{index - 1}"
+
+    @staticmethod
+    def count(scope: str, key: str, window: int) -> float:
+        now = time.time()
+        current_key, previous_key = SlidingWindowThrottle._cache_keys(scope, key, window, now)
+        counts = cache.get_many([current_key, previous_key])
+        elapsed = (now % window) / window
+        return counts.get(current_key, 0) + counts.get(previous_key, 0) * (1 - elapsed)
+
+    @staticmethod
+    def hit(scope: str, key: str, window: int):
+        current_key, _ = SlidingWindowThrottle._cache_keys(scope, key, window, time.time())
+        # The entry must outlive the next window, where it is read as the previous one
+        cache.add(current_key, 0, timeout=window * 2)
+        try:
+            cache.incr(current_key)
+        except ValueError:
+            # Expired between add and incr
+            cache.set(current_key, 1, timeout=window * 2)
+
+    @staticmethod
+    def reset(scope: str, key: str, window: int):
+        cache.delete_many(SlidingWindowThrottle._cache_keys(scope, key, window, time.time()))
@@ -0,0 +1,42 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from core.helpers.api_response import JSON_RENDERERS, orjson
+from orders.views import BillView
+
+
+class Command(BaseCommand):
+    help = "Compare the API JSON renderers on bill list payloads and check they encode the same values"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--page-size", type=int, default=50, help="Bills per payload")
+        parser.add_argument("--repeat", type=int, default=200, help="Encodes per renderer")
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            raise CommandError("orjson is not installed; only the stdlib renderer is available")
+
+        # The bill list exactly as BillView builds it, before it is rendered
+        request = Request(APIRequestFactory().get("/api/v1/bills/", {"page_size": options["page_size"]}))
+        data, pagination = BillView.get.__wrapped__(BillView(), request)
+        if not data:
+            raise CommandError("No bills to encode")
+        payload = {"success": True, "data": data, "pagination": pagination}
+
+        outputs = {}
+        for name, renderer in JSON_RENDERERS.items():
+            renderer.render(payload)
+            start = time.perf_counter()
+            for _ in range(options["repeat"]):
+                output = renderer.render(payload)
+            elapsed = (time.perf_counter() - start) / options["repeat"]
+            outputs[name] = output
+            self.stdout.write(f"{name:>7}: {elapsed * 1000:.3f} ms per payload, {len(output):,} bytes")
+
+        if len({json.dumps(json.loads(output), sort_keys=True) for output in outputs.values()}) != 1:
+            raise CommandError("Renderers encoded different values")
+        self.stdout.write(f"{len(data)} bills: all renderers encode the same values")
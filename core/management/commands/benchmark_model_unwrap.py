@@ -0,0 +1,72 @@
+import time
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models.fields.related import ForeignKey, OneToOneField
+from django.test.utils import CaptureQueriesContext
+
+from core.utils import model_unwrap
+
+DEFAULT_MODELS = ["orders.Order", "orders.OrderItem", "orders.Bill", "orders.Payment", "inventory.InventoryTransaction"]
+
+
+def legacy_model_unwrap(instance, fields=None, exclude=None, include_timestamps=False):
+    """The reflective implementation model_unwrap replaced, kept as the benchmark baseline."""
+    if isinstance(instance, (list, tuple)) or hasattr(instance, "model"):
+        return [legacy_model_unwrap(obj, fields=fields, exclude=exclude, include_timestamps=include_timestamps) for obj in instance]
+
+    data = {}
+    exclude_set = set(exclude or ())
+    if not include_timestamps:
+        exclude_set |= {"created_at", "updated_at"}
+    for field in instance._meta.fields:
+        if fields is not None and field.name not in fields:
+            continue
+        if field.name in exclude_set:
+            continue
+        if isinstance(field, (ForeignKey, OneToOneField)):
+            related_obj = getattr(instance, field.name)
+            data[f"{field.name}_id"] = related_obj.pk if related_obj is not None else None
+            if related_obj is not None and hasattr(related_obj, "name"):
+                data[f"{field.name}_name"] = related_obj.name
+        else:
+            data[field.name] = getattr(instance, field.name)
+    return data
+
+
+class Command(BaseCommand):
+    help = "Compare queries and throughput of model_unwrap against the previous reflective implementation"
+
+    def add_arguments(self, parser):
+        parser.add_argument("models", nargs="*", default=DEFAULT_MODELS, help="app_label.Model to serialise")
+        parser.add_argument("--rows", type=int, default=200, help="Rows per model")
+        parser.add_argument("--repeat", type=int, default=5, help="Timed runs per implementation")
+
+    def handle(self, *args, **options):
+        for label in options["models"]:
+            try:
+                model = apps.get_model(label)
+            except (LookupError, ValueError) as e:
+                raise CommandError(str(e))
+
+            queryset = model._default_manager.order_by("pk")[: options["rows"]]
+            results = {}
+            for name, unwrap in (("legacy", legacy_model_unwrap), ("compiled", model_unwrap)):
+                timings = []
+                for _ in range(options["repeat"]):
+                    # A fresh list per run so neither implementation benefits from related objects cached by the other
+                    rows = list(queryset.all())
+                    with CaptureQueriesContext(connection) as context:
+                        start = time.perf_counter()
+                        output = unwrap(rows)
+                        timings.append(time.perf_counter() - start)
+                results[name] = (output, len(context.captured_queries), min(timings))
+
+            if not (count := len(results["legacy"][0])):
+                self.stdout.write(f"{label}: no rows")
+                continue
+            if results["legacy"][0] != results["compiled"][0]:
+                raise CommandError(f"{label}: compiled output differs from the legacy output")
+            line = ", ".join(f"{name} {queries} queries {count / seconds:,.0f} rows/s" for name, (_, queries, seconds) in results.items())
+            self.stdout.write(f"{label} ({count} rows): {line}")
@@ -0,0 +1,35 @@
+import time
+import uuid
+from datetime import timedelta
+
+import jwt
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from accounts.models import Staff
+from core.helpers.security import Security, verified_token_cache
+
+
+class Command(BaseCommand):
+    help = "Time token verification with and without the verified-token cache (behaviour is covered by core.tests.test_token_cache)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=10000, help="Verifications timed with and without the cache")
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        payload = {"staff_id": str(uuid.uuid4()), "role": Staff.Role.SALES, "exp": timezone.now() + timedelta(minutes=5), "iat": timezone.now()}
+        token = jwt.encode(payload, settings.TOKEN_SECRET, algorithm=settings.ALGORITHM)
+
+        verified_token_cache.clear()
+        for label, size in (("jwt.decode", 0), ("cached", settings.TOKEN_CACHE_SIZE or 1)):
+            with override_settings(TOKEN_CACHE_SIZE=size):
+                Security.verify_token(token)
+                start = time.perf_counter()
+                for _ in range(iterations):
+                    Security.verify_token(token)
+                elapsed = time.perf_counter() - start
+            self.stdout.write(f"{label:>10}: {elapsed / iterations * 1_000_000:.1f} us per verification")
+        verified_token_cache.clear()
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from core.authorization import EndpointRule, endpoint_permissions
+from core.checks import iter_endpoints
+
+
+class Command(BaseCommand):
+    help = "List every API endpoint handler with the permissions it declares"
+
+    def handle(self, *args, **options):
+        for route, handler in iter_endpoints():
+            rule = endpoint_permissions.get(handler)
+            if rule is None:
+                requirement = "UNDECLARED"
+            elif rule.kind == EndpointRule.ROLE:
+                requirement = f"role {rule.role}"
+            elif rule.permissions:
+                requirement = f"{rule.kind} of {', '.join(rule.permissions)}"
+            else:
+                requirement = rule.kind
+            self.stdout.write(f"{route:<55} {handler.__qualname__:<40} {requirement}")
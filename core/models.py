@@ -0,0 +1,22 @@
+from django.db import models
+
+from core.constants import LONG_TEXT_LENGTH, SHA256_HEX_LENGTH
+
+
+class MediaBlob(models.Model):
+    """A media file stored once under its SHA-256 digest, with the number of records referencing it"""
+
+    digest = models.CharField(max_length=SHA256_HEX_LENGTH, primary_key=True)
+    path = models.CharField(max_length=LONG_TEXT_LENGTH, unique=True)  # Relative to MEDIA_ROOT
+    size = models.BigIntegerField()
+    ref_count = models.IntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "media_blobs"
+        verbose_name = "Media Blob"
+        verbose_name_plural = "Media Blobs"
+
+    def __str__(self):
+        return f"{self.path} ({self.ref_count} refs)"
@@ -0,0 +1,33 @@
+import json
+import unittest
+from decimal import Decimal
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.test import SimpleTestCase, override_settings
+from django.utils import timezone
+
+from core.helpers.api_response import APIResponse, OrjsonJSONRenderer, StdlibJSONRenderer, get_json_renderer, orjson
+
+
+class JSONRendererTests(SimpleTestCase):
+    def test_default_renderer_matches_json_response_byte_for_byte(self):
+        data = {"success": True, "data": {"name": "é", "amount": Decimal("12.50"), "at": timezone.now()}}
+        self.assertIs(get_json_renderer(), StdlibJSONRenderer)
+        self.assertEqual(APIResponse(data=data["data"]).response().content, json.dumps(data, cls=DjangoJSONEncoder).encode())
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    @override_settings(API_JSON_RENDERER="orjson")
+    def test_orjson_encodes_the_same_values(self):
+        data = {"name": "é", "amount": Decimal("12.50"), "at": timezone.now(), "missing": None, "ratio": 0.25}
+        self.assertIs(get_json_renderer(), OrjsonJSONRenderer)
+        self.assertEqual(json.loads(OrjsonJSONRenderer.render(data)), json.loads(StdlibJSONRenderer.render(data)))
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_falls_back_for_non_finite_floats(self):
+        for data in ({"value": float("nan")}, {"values": [None, float("inf")]}, {"nested": {"value": float("-inf")}}):
+            self.assertEqual(OrjsonJSONRenderer.render(data), StdlibJSONRenderer.render(data))
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_falls_back_for_integers_it_cannot_encode(self):
+        data = {"value": 2**70}
+        self.assertEqual(OrjsonJSONRenderer.render(data), StdlibJSONRenderer.render(data))
@@ -0,0 +1,35 @@
+from django.db.models import Case, IntegerField, Value, When
+from django.test import TestCase, override_settings
+
+from core.helpers.counting import QueryCounter
+from core.helpers.pagination import PaginationHelper
+from inventory.models import Vendor
+
+
+@override_settings(PAGINATION_COUNT_CACHE_TTL=30)
+class EmptyQuerysetCountTests(TestCase):
+    def test_querysets_that_can_never_match_count_as_zero(self):
+        for queryset in (Vendor.objects.none(), Vendor.objects.filter(id__in=[])):
+            with self.subTest(queryset=queryset), self.assertNumQueries(0):
+                self.assertEqual(QueryCounter.count(queryset), (0, False))
+
+    def test_paginating_an_empty_filter_returns_an_empty_page(self):
+        data, pagination = PaginationHelper.paginate_queryset(Vendor.objects.filter(id__in=[]), page=1, page_size=10)
+        self.assertEqual(list(data), [])
+        self.assertEqual(pagination["total_items"], 0)
+        self.assertEqual(pagination["total_pages"], 1)
+
+
+class AnnotatedCursorTests(TestCase):
+    def test_cursor_pages_walk_an_annotated_ordering(self):
+        Vendor.objects.bulk_create([Vendor(name=f"Vendor {index}", phone="9000000000", is_active=index % 2 == 0) for index in range(5)])
+        rank = Case(When(is_active=True, then=Value(0)), default=Value(1), output_field=IntegerField())
+        queryset = Vendor.objects.annotate(status_rank=rank).order_by("status_rank", "name")
+
+        seen, cursor = [], ""
+        while cursor is not None:
+            rows, pagination = PaginationHelper.paginate_queryset(queryset, page=1, page_size=2, cursor=cursor)
+            seen.extend(vendor.name for vendor in rows)
+            cursor = pagination["next_cursor"]
+
+        self.assertEqual(seen, ["Vendor 0", "Vendor 2", "Vendor 4", "Vendor 1", "Vendor 3"])
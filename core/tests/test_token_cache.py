@@ -0,0 +1,82 @@
+import time
+import uuid
+from datetime import timedelta
+from unittest import mock
+
+import jwt
+from django.conf import settings
+from django.test import SimpleTestCase, override_settings
+from django.utils import timezone
+
+from accounts.models import Staff
+from accounts.signals import _invalidate_staff_auth
+from core.exceptions import Unauthorized
+from core.helpers.security import Security, verified_token_cache
+
+
+@override_settings(TOKEN_SECRET="token-cache-test-secret", ALGORITHM="HS256", TOKEN_CACHE_SIZE=16)
+class VerifiedTokenCacheTests(SimpleTestCase):
+    def setUp(self):
+        verified_token_cache.clear()
+        self.addCleanup(verified_token_cache.clear)
+
+    @staticmethod
+    def _token(staff_id=None, expires_in=timedelta(minutes=5)) -> str:
+        payload = {"staff_id": str(staff_id or uuid.uuid4()), "role": Staff.Role.SALES, "exp": timezone.now() + expires_in, "iat": timezone.now()}
+        return jwt.encode(payload, settings.TOKEN_SECRET, algorithm=settings.ALGORITHM)
+
+    def test_reuse_is_served_from_the_cache(self):
+        token = self._token()
+        first = Security.verify_token(token)
+        with mock.patch("core.helpers.security.jwt.decode") as decode:
+            second = Security.verify_token(token)
+        decode.assert_not_called()
+        self.assertEqual(first, second)
+        self.assertEqual(verified_token_cache.stats()["hits"], 1)
+
+    def test_expired_token_is_not_served_from_the_cache(self):
+        token = self._token(expires_in=timedelta(seconds=30))
+        _, exp = Security.verify_token(token)
+        # Past exp the cache must hand the token back to jwt.decode, which rejects it
+        with (
+            mock.patch("core.helpers.security.time.time", return_value=exp + 1),
+            mock.patch("core.helpers.security.jwt.decode", side_effect=jwt.ExpiredSignatureError("Signature has expired")) as decode,
+        ):
+            with self.assertRaises(Unauthorized):
+                Security.verify_token(token)
+        decode.assert_called_once()
+        self.assertEqual(verified_token_cache.stats()["size"], 0)
+
+    def test_saving_staff_revokes_only_their_tokens(self):
+        staff = Staff(id=uuid.uuid4())
+        token, other = self._token(staff.id), self._token()
+        Security.verify_token(token)
+        Security.verify_token(other)
+
+        _invalidate_staff_auth(Staff, staff)
+
+        self.assertEqual(verified_token_cache.stats()["size"], 1)
+        self.assertIsNone(verified_token_cache.get(token))
+        self.assertIsNotNone(verified_token_cache.get(other))
+
+    def test_rotated_secret_rejects_old_tokens(self):
+        token = self._token()
+        Security.verify_token(token)
+        with override_settings(TOKEN_SECRET=f"{settings.TOKEN_SECRET}-rotated"):
+            with self.assertRaises(Unauthorized):
+                Security.verify_token(token)
+            self.assertEqual(verified_token_cache.stats()["size"], 0)
+
+    @override_settings(TOKEN_CACHE_SIZE=8)
+    def test_cache_stays_within_token_cache_size(self):
+        tokens = [self._token() for _ in range(20)]
+        for token in tokens:
+            Security.verify_token(token)
+        self.assertEqual(verified_token_cache.stats()["size"], 8)
+        self.assertIsNone(verified_token_cache.get(tokens[0]))
+        self.assertIsNotNone(verified_token_cache.get(tokens[-1]))
+
+    def test_tokens_without_expiry_are_not_cached(self):
+        token = jwt.encode({"staff_id": str(uuid.uuid4()), "iat": int(time.time())}, settings.TOKEN_SECRET, algorithm=settings.ALGORITHM)
+        Security.verify_token(token)
+        self.assertEqual(verified_token_cache.stats()["size"], 0)
@@ -1,7 +1,89 @@
 from collections.abc import Iterable
 
+from django.core.exceptions import FieldDoesNotExist
 from django.db.models.fields.related import ForeignKey, OneToOneField
 
+# (model, fields, exclude, include_timestamps) -> compiled plan, see _compile_plan
+_PLANS: dict = {}
+
+
+def _compile_plan(model, fields, exclude, include_timestamps):
+    """
+    Resolves once which fields of `model` are emitted and how.
+
+    Returns a tuple of (key, attname, relation) steps. Plain fields are read by attname; foreign keys
+    are read through their <field>_id attname so the related row is never loaded just for its id,
+    and relation carries what is needed to resolve the optional <field>_name afterwards.
+    """
+    exclude_set = set(exclude or ())
+    if not include_timestamps:
+        exclude_set |= {"created_at", "updated_at"}
+
+    steps = []
+    for field in model._meta.fields:
+        if fields is not None and field.name not in fields:
+            continue
+        if field.name in exclude_set:
+            continue
+        if isinstance(field, (ForeignKey, OneToOneField)):
+            related_model = field.related_model
+            # The id always refers to the related primary key, even for foreign keys pointing at another column
+            reads_pk = field.target_field == related_model._meta.pk
+            try:
+                name_is_column = related_model._meta.get_field("name").concrete
+            except FieldDoesNotExist:
+                name_is_column = False
+            relation = (field, reads_pk, hasattr(related_model, "name"), name_is_column)
+            steps.append((f"{field.name}_id", field.attname, relation))
+        else:
+            steps.append((field.name, field.attname, None))
+    return tuple(steps)
+
+
+def _get_plan(model, fields, exclude, include_timestamps):
+    key = (model, frozenset(fields) if fields is not None else None, frozenset(exclude or ()), include_timestamps)
+    if (plan := _PLANS.get(key)) is None:
+        plan = _PLANS[key] = _compile_plan(model, fields, exclude, include_timestamps)
+    return plan
+
+
+def _unwrap_row(instance, plan, pending_names):
+    data = {}
+    for key, attname, relation in plan:
+        if relation is None:
+            data[key] = getattr(instance, attname)
+            continue
+
+        field, reads_pk, has_name, name_is_column = relation
+        if field.is_cached(instance) or not reads_pk:
+            # Already loaded (select_related/prefetch) or keyed on another column: read the object itself
+            related_obj = getattr(instance, field.name)
+            data[key] = related_obj.pk if related_obj is not None else None
+            if related_obj is not None and has_name:
+                data[f"{field.name}_name"] = related_obj.name
+            continue
+
+        related_pk = getattr(instance, attname)
+        data[key] = related_pk
+        if related_pk is not None and has_name:
+            # Placeholder keeps the key order; filled in by _resolve_names
+            data[f"{field.name}_name"] = None
+            pending_names.setdefault((field.related_model, name_is_column), {}).setdefault(related_pk, []).append((data, f"{field.name}_name"))
+    return data
+
+
+def _resolve_names(pending_names):
+    """Fills every pending <field>_name with one query per related model."""
+    for (related_model, name_is_column), targets in pending_names.items():
+        manager = related_model._base_manager
+        if name_is_column:
+            names = dict(manager.filter(pk__in=targets).values_list("pk", "name"))
+        else:
+            names = {pk: obj.name for pk, obj in manager.in_bulk(list(targets)).items()}
+        for related_pk, rows in targets.items():
+            for data, key in rows:
+                data[key] = names.get(related_pk)
+
 
 def model_unwrap(instance, fields=None, exclude=None, include_timestamps=False):
     """
@@ -9,47 +91,19 @@ def model_unwrap(instance, fields=None, exclude=None, include_timestamps=False):
     For ForeignKey and OneToOneField, only includes the related object's id to avoid recursion.
     Also adds a <field_name>_id key for ForeignKey/OneToOneField with the related object's id.
     By default, 'created_at' and 'updated_at' are excluded unless include_timestamps=True.
+    The per-model field plan is compiled once and cached, and <field_name>_name values are resolved with
+    one query per related model for the whole call instead of loading each related object.
     :param instance: The model instance, queryset, or list to convert.
     :param fields: Optional list of field names to include.
     :param exclude: Optional list of field names to exclude.
     :param include_timestamps: If True, includes 'created_at' and 'updated_at' fields.
     :return: dict or list of dicts representation of the model instance(s).
     """
+    pending_names: dict = {}
     # Handle QuerySet, list, or any iterable of model instances (but not string/bytes)
     if isinstance(instance, Iterable) and not isinstance(instance, (str, bytes, dict)) and hasattr(instance, "__iter__"):
-        return [
-            model_unwrap(
-                obj,
-                fields=fields,
-                exclude=exclude,
-                include_timestamps=include_timestamps,
-            )
-            for obj in instance
-        ]
-
-    data = {}
-    default_exclude = set()
-    if not include_timestamps:
-        default_exclude.update({"created_at", "updated_at"})
-    if exclude is not None:
-        exclude_set = set(exclude) | default_exclude
+        result = [_unwrap_row(obj, _get_plan(type(obj), fields, exclude, include_timestamps), pending_names) for obj in instance]
     else:
-        exclude_set = default_exclude
-
-    for field in instance._meta.fields:
-        field_name = field.name
-        if fields is not None and field_name not in fields:
-            continue
-        if field_name in exclude_set:
-            continue
-
-        # Handle ForeignKey and OneToOneField by including the related object's id and name
-        if isinstance(field, (ForeignKey, OneToOneField)):
-            related_obj = getattr(instance, field_name)
-            data[f"{field_name}_id"] = related_obj.pk if related_obj is not None else None
-            # Include name if the related model has a 'name' field
-            if related_obj is not None and hasattr(related_obj, "name"):
-                data[f"{field_name}_name"] = related_obj.name
-        else:
-            data[field_name] = getattr(instance, field_name)
-    return data
+        result = _unwrap_row(instance, _get_plan(type(instance), fields, exclude, include_timestamps), pending_names)
+    _resolve_names(pending_names)
+    return result
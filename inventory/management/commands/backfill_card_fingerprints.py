@@ -0,0 +1,63 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.helpers.image_upload import ImageUpload
+from core.helpers.image_utils import ImageUtils
+from inventory.models import Card
+
+FINGERPRINT_FIELDS = ["perceptual_hash", "phash", "dhash", "color_histogram"]
+
+
+def _fingerprint(task):
+    card_id, path = task
+    try:
+        return card_id, ImageUtils.fingerprint_file(path).as_card_fields(), None
+    except Exception as e:
+        return card_id, None, str(e)
+
+
+class Command(BaseCommand):
+    help = "Compute image fingerprints (aHash, pHash, dHash, colour histogram) for cards whose image files are under MEDIA_ROOT"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true", help="Recompute fingerprints for every card, not only those missing them")
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of worker processes")
+        parser.add_argument("--batch-size", type=int, default=500, help="Cards written per bulk update")
+
+    def handle(self, *args, **options):
+        cards = Card.objects.exclude(image="")
+        if not options["all"]:
+            cards = cards.filter(phash="")
+
+        tasks, missing = [], 0
+        for card_id, image_url in cards.values_list("id", "image").iterator():
+            path = ImageUpload.get_media_path(image_url)
+            if path and os.path.isfile(path):
+                tasks.append((card_id, path))
+            else:
+                missing += 1
+        self.stdout.write(f"Fingerprinting {len(tasks)} card image(s) with {options['workers']} worker(s); {missing} without a local file")
+
+        updated, failed, pending = 0, 0, []
+        with ProcessPoolExecutor(max_workers=max(options["workers"], 1)) as executor:
+            for card_id, fields, error in executor.map(_fingerprint, tasks, chunksize=16):
+                if error:
+                    failed += 1
+                    self.stderr.write(f"{card_id}: {error}")
+                    continue
+                pending.append(Card(id=card_id, updated_at=timezone.now(), **fields))
+                if len(pending) >= options["batch_size"]:
+                    updated += self._write(pending)
+                    pending = []
+        updated += self._write(pending)
+
+        self.stdout.write(self.style.SUCCESS(f"Updated {updated} card(s), {failed} failed"))
+
+    @staticmethod
+    def _write(cards):
+        # updated_at is set explicitly so other processes' similarity indexes pick up the new hashes
+        Card.objects.bulk_update(cards, FINGERPRINT_FIELDS + ["updated_at"])
+        return len(cards)
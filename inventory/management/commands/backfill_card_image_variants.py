@@ -0,0 +1,56 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from core.helpers.image_upload import ImageUpload
+from core.helpers.image_variants import ImageVariants
+from inventory.models import Card
+
+
+def _generate_variants(task):
+    card_id, path = task
+    try:
+        return card_id, ImageVariants.generate(path), None
+    except Exception as e:
+        return card_id, None, str(e)
+
+
+class Command(BaseCommand):
+    help = "Generate thumbnail/medium WebP and JPEG variants for card images stored under MEDIA_ROOT"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true", help="Process every card, not only those without variants")
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of worker processes")
+        parser.add_argument("--batch-size", type=int, default=500, help="Cards written per bulk update")
+
+    def handle(self, *args, **options):
+        cards = Card.objects.exclude(image="")
+        if not options["all"]:
+            cards = cards.filter(image_variants={})
+
+        tasks, missing = [], 0
+        for card_id, image_url in cards.values_list("id", "image").iterator():
+            path = ImageUpload.get_media_path(image_url)
+            if path and os.path.isfile(path):
+                tasks.append((card_id, path))
+            else:
+                missing += 1
+        self.stdout.write(f"Generating variants for {len(tasks)} card image(s) with {options['workers']} worker(s); {missing} without a local file")
+
+        updated, failed, pending = 0, 0, []
+        with ProcessPoolExecutor(max_workers=max(options["workers"], 1)) as executor:
+            for card_id, variants, error in executor.map(_generate_variants, tasks, chunksize=8):
+                if error:
+                    failed += 1
+                    self.stderr.write(f"{card_id}: {error}")
+                    continue
+                pending.append(Card(id=card_id, image_variants=variants))
+                if len(pending) >= options["batch_size"]:
+                    Card.objects.bulk_update(pending, ["image_variants"])
+                    updated += len(pending)
+                    pending = []
+        Card.objects.bulk_update(pending, ["image_variants"])
+        updated += len(pending)
+
+        self.stdout.write(self.style.SUCCESS(f"Updated {updated} card(s), {failed} failed"))
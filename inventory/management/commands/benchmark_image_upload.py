@@ -0,0 +1,99 @@
+import io
+import multiprocessing
+import os
+import tempfile
+
+import numpy as np
+from django.core.management.base import BaseCommand
+from PIL import Image
+
+
+def _rss_kib(field: str) -> int:
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith(field):
+                return int(line.split()[1])
+    return 0
+
+
+def _legacy_upload(source_path: str, media_root: str):
+    """The previous pipeline: in-memory upload, full-resolution aHash, then read() + write of the whole file."""
+    import imagehash
+    from django.core.files.uploadedfile import InMemoryUploadedFile
+
+    with open(source_path, "rb") as source:
+        data = source.read()
+    upload = InMemoryUploadedFile(io.BytesIO(data), "image", "upload.jpg", "image/jpeg", len(data), None)
+    upload.file.seek(0)
+    str(imagehash.average_hash(Image.open(upload.file)))
+    upload.file.seek(0)
+    with open(os.path.join(media_root, "legacy.jpg"), "wb") as out_file:
+        out_file.write(upload.file.read())
+
+
+def _streaming_upload(source_path: str, media_root: str):
+    """The current pipeline: disk-spooled upload streamed into storage, fingerprint and variants from one downsampled decode."""
+    from django.core.files.uploadedfile import TemporaryUploadedFile
+    from django.db import transaction
+
+    from core.helpers.image_upload import ImageUpload
+
+    upload = TemporaryUploadedFile("upload.jpg", "image/jpeg", os.path.getsize(source_path), None)
+    with open(source_path, "rb") as source:
+        for chunk in iter(lambda: source.read(64 * 1024), b""):
+            upload.write(chunk)
+    upload.seek(0)
+    with transaction.atomic():
+        ImageUpload.upload_card_image(upload)
+        transaction.set_rollback(True)
+
+
+def _measure(mode: str, source_path: str, media_root: str, results):
+    os.environ["MEDIA_ROOT"] = media_root
+    import django
+
+    django.setup()
+    # Import everything both pipelines need before taking the baseline
+    import imagehash  # noqa: F401
+    import scipy.fftpack  # noqa: F401  (imported lazily by imagehash.phash)
+    from PIL import WebPImagePlugin  # noqa: F401
+
+    import core.helpers.image_upload  # noqa: F401
+
+    # Reset the high-water mark so it only reflects the upload itself
+    with open("/proc/self/clear_refs", "w") as clear_refs:
+        clear_refs.write("5")
+    baseline = _rss_kib("VmRSS:")
+    (_legacy_upload if mode == "legacy" else _streaming_upload)(source_path, media_root)
+    results[mode] = _rss_kib("VmHWM:") - baseline
+
+
+class Command(BaseCommand):
+    help = "Compare peak RSS growth of the legacy in-memory image upload path and the streaming one (Linux only)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--width", type=int, default=4400, help="Width of the generated test JPEG")
+        parser.add_argument("--height", type=int, default=3000, help="Height of the generated test JPEG")
+
+    def handle(self, *args, **options):
+        with tempfile.TemporaryDirectory() as work_dir:
+            source_path = os.path.join(work_dir, "source.jpg")
+            # Noise compresses badly, which gives a realistically large file for the pixel count
+            pixels = np.random.default_rng(0).integers(0, 256, (options["height"], options["width"], 3), dtype=np.uint8)
+            Image.fromarray(pixels).save(source_path, "JPEG", quality=85)
+            del pixels
+            self.stdout.write(f"Test image: {options['width']}x{options['height']}, {os.path.getsize(source_path) / 1024 / 1024:.1f} MiB")
+
+            context = multiprocessing.get_context("spawn")
+            with context.Manager() as manager:
+                results = manager.dict()
+                for mode in ("legacy", "streaming"):
+                    media_root = os.path.join(work_dir, mode)
+                    os.makedirs(media_root)
+                    process = context.Process(target=_measure, args=(mode, source_path, media_root, results))
+                    process.start()
+                    process.join()
+                    if mode in results:
+                        self.stdout.write(f"{mode:>9}: peak RSS +{results[mode] / 1024:.1f} MiB")
+                    else:
+                        self.stderr.write(f"{mode:>9}: failed (exit code {process.exitcode})")
@@ -0,0 +1,83 @@
+import os
+from collections import Counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from core.helpers.image_variants import ImageVariants
+from core.helpers.media_storage import media_storage
+from core.models import MediaBlob
+from inventory.models import Card
+
+
+def recount_card_image_references() -> int:
+    """Recomputes MediaBlob.ref_count from the cards pointing at each blob; returns the number of blobs changed."""
+    image_urls = Card.objects.exclude(image="").values_list("image", flat=True)
+    references = Counter(media_storage.relative_path_for_url(image_url) for image_url in image_urls)
+    changed = []
+    for blob in MediaBlob.objects.all():
+        if blob.ref_count != references.get(blob.path, 0):
+            blob.ref_count = references.get(blob.path, 0)
+            blob.updated_at = timezone.now()
+            changed.append(blob)
+    MediaBlob.objects.bulk_update(changed, ["ref_count", "updated_at"])
+    return len(changed)
+
+
+class Command(BaseCommand):
+    help = "Move card images into content-addressed storage, merge duplicates and rewrite Card.image URLs"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Report what would change without touching files or rows")
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        upload_root = media_storage.path(settings.IMAGE_UPLOAD_FOLDER.strip("/"))
+
+        # 1. Copy every legacy file into the content-addressed layout (hard links where possible)
+        moves: dict[str, str] = {}  # legacy relative path -> content-addressed relative path
+        for directory, _, filenames in os.walk(upload_root):
+            for filename in filenames:
+                if filename.endswith(".tmp"):
+                    continue
+                source_path = os.path.join(directory, filename)
+                relative_path = os.path.relpath(source_path, settings.MEDIA_ROOT).replace(os.sep, "/")
+                if MediaBlob.objects.filter(path=relative_path).exists():
+                    continue
+                if dry_run:
+                    # Only the digest is needed to report how many distinct files there are
+                    moves[relative_path] = ImageVariants.file_digest(source_path)
+                    continue
+                blob = media_storage.adopt(source_path)
+                if blob.path != relative_path:
+                    moves[relative_path] = blob.path
+
+        # 2. Point cards at the stored copies
+        cards_to_update = []
+        for card in Card.objects.exclude(image="").only("id", "image"):
+            relative_path = media_storage.relative_path_for_url(card.image)
+            if relative_path in moves:
+                card.image = media_storage.url_for(moves[relative_path])
+                cards_to_update.append(card)
+
+        if dry_run:
+            unique = len(set(moves.values()))
+            self.stdout.write(f"{len(moves)} legacy file(s) ({unique} distinct), {len(cards_to_update)} card(s) would be rewritten")
+            return
+
+        with transaction.atomic():
+            Card.objects.bulk_update(cards_to_update, ["image"])
+            changed = recount_card_image_references()
+
+        # 3. The legacy copies are only removed once no card points at them
+        for relative_path in moves:
+            os.remove(media_storage.path(relative_path))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Moved {len(moves)} file(s) into {MediaBlob.objects.count()} blob(s), rewrote {len(cards_to_update)} card(s), "
+                f"updated {changed} reference count(s)"
+            )
+        )
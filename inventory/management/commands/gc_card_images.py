@@ -0,0 +1,24 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from core.helpers.media_storage import media_storage
+from inventory.management.commands.dedupe_card_images import recount_card_image_references
+
+
+class Command(BaseCommand):
+    help = "Delete stored card images (and their variants) that no card has referenced for a grace period"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--grace-hours", type=int, default=24, help="Keep unreferenced blobs younger than this")
+        parser.add_argument("--recount", action="store_true", help="Recompute reference counts from Card.image first")
+        parser.add_argument("--dry-run", action="store_true", help="List orphaned blobs without deleting them")
+
+    def handle(self, *args, **options):
+        if options["recount"]:
+            self.stdout.write(f"Corrected {recount_card_image_references()} reference count(s)")
+
+        orphans = media_storage.collect_garbage(timedelta(hours=options["grace_hours"]), dry_run=options["dry_run"])
+        for blob in orphans:
+            self.stdout.write(f"{'Would delete' if options['dry_run'] else 'Deleted'} {blob.path} ({blob.size} bytes)")
+        self.stdout.write(self.style.SUCCESS(f"{len(orphans)} orphaned blob(s)"))
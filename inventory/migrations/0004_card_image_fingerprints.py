@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0003_card_card_type'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='card',
+            name='color_histogram',
+            field=models.CharField(blank=True, max_length=128),
+        ),
+        migrations.AddField(
+            model_name='card',
+            name='dhash',
+            field=models.CharField(blank=True, max_length=16),
+        ),
+        migrations.AddField(
+            model_name='card',
+            name='phash',
+            field=models.CharField(blank=True, max_length=16),
+        ),
+    ]
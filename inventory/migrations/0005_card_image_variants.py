@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0004_card_image_fingerprints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='card',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -5,8 +5,10 @@ from django.db import models
 from accounts.models import Staff
 from core.constants import (
     CARD_TYPE_LENGTH,
+    COLOR_HISTOGRAM_LENGTH,
     DEFAULT_AMOUNT,
     DEFAULT_QUANTITY,
+    IMAGE_HASH_LENGTH,
     LONG_TEXT_LENGTH,
     NAME_LENGTH,
     PHONE_LENGTH,
@@ -73,7 +75,11 @@ class Card(models.Model):
     )
     quantity = models.IntegerField(default=DEFAULT_QUANTITY)
     image = models.URLField(max_length=LONG_TEXT_LENGTH, blank=True)
-    perceptual_hash = models.CharField(max_length=TEXT_LENGTH, blank=True)
+    image_variants = models.JSONField(default=dict, blank=True)  # {"thumbnail": {"webp": url, "jpeg": url}, "medium": {...}}
+    perceptual_hash = models.CharField(max_length=TEXT_LENGTH, blank=True)  # aHash
+    phash = models.CharField(max_length=IMAGE_HASH_LENGTH, blank=True)
+    dhash = models.CharField(max_length=IMAGE_HASH_LENGTH, blank=True)
+    color_histogram = models.CharField(max_length=COLOR_HISTOGRAM_LENGTH, blank=True)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
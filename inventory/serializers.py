@@ -1,6 +1,17 @@
 from rest_framework import serializers
 
-from core.constants import NAME_LENGTH, PAGINATION_DEFAULT_PAGE, PAGINATION_DEFAULT_PAGE_SIZE, PHONE_LENGTH, PRICE_DECIMAL_PLACES, PRICE_MAX_DIGITS
+from core.constants import (
+    NAME_LENGTH,
+    PAGINATION_DEFAULT_PAGE,
+    PAGINATION_DEFAULT_PAGE_SIZE,
+    PHONE_LENGTH,
+    PRICE_DECIMAL_PLACES,
+    PRICE_MAX_DIGITS,
+    SIMILARITY_DEFAULT_LIMIT,
+    SIMILARITY_DEFAULT_MAX_DISTANCE,
+    SIMILARITY_MAX_DISTANCE,
+    SIMILARITY_MAX_LIMIT,
+)
 from core.helpers.base_serializer import BaseSerializer
 from core.helpers.param_serializer import ParamSerializer
 from core.helpers.query_params import BaseListParams, build_range_fields
@@ -82,3 +93,5 @@ class CardPurchaseSerializer(BaseSerializer):
 
 class CardSimilaritySerializer(BaseSerializer):
     image = serializers.ImageField(required=True)
+    max_distance = serializers.IntegerField(required=False, min_value=0, max_value=SIMILARITY_MAX_DISTANCE, default=SIMILARITY_DEFAULT_MAX_DISTANCE)
+    limit = serializers.IntegerField(required=False, min_value=1, max_value=SIMILARITY_MAX_LIMIT, default=SIMILARITY_DEFAULT_LIMIT)
@@ -1,10 +1,17 @@
+from dataclasses import dataclass
+
 from django.core.files.uploadedfile import InMemoryUploadedFile
-from django.db import transaction
+from django.db import connection, transaction
+from django.utils import timezone
 
+from analytics import cache as analytics_cache
+from auditing.services import ModelAuditService
 from core.exceptions import Conflict, ResourceNotFound
 from core.helpers.image_upload import ImageUpload
-from core.helpers.image_utils import ImageUtils
+from core.helpers.image_utils import ImageFingerprint, ImageUtils
+from core.helpers.media_storage import media_storage
 from inventory.models import Card, InventoryTransaction, Vendor
+from inventory.similarity import card_similarity_index
 
 
 class CardService:
@@ -28,7 +35,18 @@ class CardService:
 
     @staticmethod
     @transaction.atomic
-    def create_card(vendor_id, staff, image_url, cost_price, sell_price, max_discount, quantity, perceptual_hash, card_type=None):
+    def create_card(
+        vendor_id,
+        staff,
+        image_url,
+        cost_price,
+        sell_price,
+        max_discount,
+        quantity,
+        fingerprint: ImageFingerprint,
+        card_type=None,
+        image_variants=None,
+    ):
         # 1. Generate unique identifiers
         barcode = ImageUtils.generate_unique_barcode(Card)
 
@@ -38,51 +56,58 @@ class CardService:
         card = Card.objects.create(
             vendor=vendor,
             image=image_url,
+            image_variants=image_variants or {},
             cost_price=cost_price,
             sell_price=sell_price,
             max_discount=max_discount,
             quantity=quantity,
             barcode=barcode,
-            perceptual_hash=perceptual_hash,
+            **fingerprint.as_card_fields(),
             card_type=card_type if card_type else Card.CardType.ENVELOPE_11X5,
         )
 
         # 3. Create the initial inventory transaction to log the purchase
         InventoryTransactionService.record_purchase_transaction(card, quantity, staff)
 
+        # 4. Count the card as a reference to its stored image
+        media_storage.acquire(card.image)
+
         return card
 
     @staticmethod
-    def find_similar_cards(image: InMemoryUploadedFile):
+    def find_similar_cards(image: InMemoryUploadedFile, max_distance: int, limit: int | None = None):
+        """Returns [(card, distance)] for active cards whose perceptual hash is within max_distance bits, closest first."""
         perceptual_hash = ImageUtils.generate_perceptual_hash(image)
-        return Card.objects.filter(perceptual_hash=perceptual_hash)
+        matches = card_similarity_index.search(perceptual_hash, max_distance=max_distance, limit=limit)
+        cards = Card.objects.filter(is_active=True).in_bulk([card_id for card_id, _ in matches])
+        return [(cards[card_id], distance) for card_id, distance in matches if card_id in cards]
 
     @staticmethod
-    @transaction.atomic  # Ensures the stock update and transaction log are a single operation
     def purchase_additional_stock(card_id, quantity_change, staff):
-        # Use select_for_update to lock the row and prevent race conditions
-        card = Card.objects.select_for_update().filter(id=card_id).first()
-        if not card:
+        if not (card := Card.objects.filter(id=card_id).first()):
             raise ResourceNotFound("Card not found")
 
-        card.quantity += quantity_change
-        card.save()
-
-        InventoryTransactionService.record_purchase_transaction(card, quantity_change, staff)
+        StockLedgerService.apply(
+            [StockMovement(card, quantity_change, InventoryTransaction.TransactionType.PURCHASE, notes="Initial stock")],
+            staff,
+        )
 
         return card
 
     @staticmethod
+    @transaction.atomic
     def update_card(card_id, **updates):
         card = CardService.get_card_by_id(card_id)
+        previous_image = card.image
 
         updatable_fields = {k: v for k, v in updates.items() if v is not None}
         for field, value in updatable_fields.items():
             if field == "image":
-                perceptual_hash = ImageUtils.generate_perceptual_hash(value)
-                image_url = ImageUpload.upload_image_and_get_url(value)
-                card.image = image_url
-                card.perceptual_hash = perceptual_hash
+                stored_image = ImageUpload.upload_card_image(value)
+                card.image = stored_image.url
+                card.image_variants = stored_image.variants
+                for fingerprint_field, fingerprint_value in stored_image.fingerprint.as_card_fields().items():
+                    setattr(card, fingerprint_field, fingerprint_value)
                 continue
             if field == "vendor_id":
                 vendor = VendorService.get_vendor_by_id(value)
@@ -92,6 +117,10 @@ class CardService:
             setattr(card, field, value)
 
         card.save()
+
+        if card.image != previous_image:
+            media_storage.acquire(card.image)
+            media_storage.release(previous_image)
         return card
 
     @staticmethod
@@ -114,29 +143,95 @@ class InventoryTransactionService:
             notes="Initial stock",
         )
 
+
+@dataclass
+class StockMovement:
+    """A change to a card's stock. Movements without a transaction_type adjust stock without a ledger row."""
+
+    card: Card
+    quantity_changed: int
+    transaction_type: str | None = None
+    order_item: object = None
+    notes: str = ""
+
+
+class StockLedgerService:
+    """Applies stock movements without loading and re-saving cards.
+
+    Each card is changed by one conditional UPDATE ... RETURNING that only matches while the result
+    stays non-negative, so the row lock lasts a single statement rather than a read-modify-save round
+    trip. Ledger rows are bulk-inserted, and the quantity changes are audited in one insert.
+    """
+
     @staticmethod
-    def record_sale_transaction(order_item):
-        InventoryTransaction.objects.create(
-            card=order_item.card,
-            staff=order_item.order.staff,
-            transaction_type=InventoryTransaction.TransactionType.SALE,
-            order_item=order_item,
-            quantity_changed=-order_item.quantity,
-            cost_price=order_item.card.cost_price,
-            notes="Sale",
+    def _apply_delta(card_id, delta) -> int | None:
+        """Returns the new quantity, or None when the card is missing or the stock would go negative."""
+        quote = connection.ops.quote_name
+        quantity = quote(Card._meta.get_field("quantity").column)
+        updated_at = Card._meta.get_field("updated_at")
+        pk = Card._meta.pk
+        sql = (
+            f"UPDATE {quote(Card._meta.db_table)} SET {quantity} = {quantity} + %s, {quote(updated_at.column)} = %s "
+            f"WHERE {quote(pk.column)} = %s AND {quantity} + %s >= 0 RETURNING {quantity}"
         )
+        params = [delta, updated_at.get_db_prep_value(timezone.now(), connection), pk.get_db_prep_value(card_id, connection), delta]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            row = cursor.fetchone()
+        return row[0] if row else None
 
     @staticmethod
-    def record_return_transaction(order_item):
-        InventoryTransaction.objects.create(
-            card=order_item.card,
-            staff=order_item.order.staff,
-            transaction_type=InventoryTransaction.TransactionType.RETURN,
-            order_item=order_item,
-            quantity_changed=order_item.quantity,
-            cost_price=order_item.card.cost_price,
-            notes="Return to stock",
-        )
+    @transaction.atomic
+    def apply(movements, staff=None) -> dict:
+        """Applies the movements atomically and returns {card_id: new quantity}.
+
+        Raises Conflict when any card would drop below zero and ResourceNotFound for unknown cards.
+        The in-memory card instances are updated with the new quantities.
+        """
+        deltas = {}
+        for movement in movements:
+            deltas[movement.card.id] = deltas.get(movement.card.id, 0) + movement.quantity_changed
+
+        quantities, stock_changes = {}, []
+        # Cards are always updated in id order so concurrent multi-card movements cannot deadlock
+        for card_id in sorted(deltas, key=str):
+            delta = deltas[card_id]
+            if delta == 0:
+                continue
+            new_quantity = StockLedgerService._apply_delta(card_id, delta)
+            if new_quantity is None:
+                if not Card.objects.filter(id=card_id).exists():
+                    raise ResourceNotFound("Card not found")
+                raise Conflict("Quantity in stock is less than the required quantity")
+            quantities[card_id] = new_quantity
+
+        transactions = []
+        for movement in movements:
+            card = movement.card
+            if card.id in quantities:
+                card.quantity = quantities[card.id]
+            if movement.transaction_type:
+                transactions.append(
+                    InventoryTransaction(
+                        card=card,
+                        staff=staff,
+                        transaction_type=movement.transaction_type,
+                        order_item=movement.order_item,
+                        quantity_changed=movement.quantity_changed,
+                        cost_price=card.cost_price,
+                        notes=movement.notes,
+                    )
+                )
+        InventoryTransaction.objects.bulk_create(transactions)
+
+        cards = {movement.card.id: movement.card for movement in movements}
+        for card_id, new_quantity in quantities.items():
+            stock_changes.append((cards[card_id], {"quantity": new_quantity - deltas[card_id]}, {"quantity": new_quantity}))
+        # The raw UPDATE and bulk_create skip the model signals
+        ModelAuditService.record_bulk_changes(created=transactions, updated=stock_changes)
+        analytics_cache.invalidate_models("inventory.Card", "inventory.InventoryTransaction")
+
+        return quantities
 
 
 class VendorService:
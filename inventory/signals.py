@@ -0,0 +1,18 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from inventory.models import Card
+from inventory.similarity import card_similarity_index
+
+
+@receiver(post_save, sender=Card)
+def _index_card_on_save(sender, instance, **kwargs):
+    card_id, perceptual_hash, is_active = instance.pk, instance.perceptual_hash, instance.is_active
+    transaction.on_commit(lambda: card_similarity_index.update_card(card_id, perceptual_hash, is_active))
+
+
+@receiver(post_delete, sender=Card)
+def _unindex_card_on_delete(sender, instance, **kwargs):
+    card_id = instance.pk
+    transaction.on_commit(lambda: card_similarity_index.remove_card(card_id))
@@ -0,0 +1,194 @@
+import threading
+import time
+from itertools import combinations
+
+import numpy as np
+from django.conf import settings
+from django.db.models import Max
+
+from inventory.models import Card
+
+HASH_BITS = 64
+CHUNK_BITS = 16
+CHUNK_COUNT = HASH_BITS // CHUNK_BITS
+CHUNK_MASK = (1 << CHUNK_BITS) - 1
+# Widest per-chunk radius probed through the chunk tables; wider searches scan every hash instead
+MAX_PROBE_RADIUS = 1
+# Upserts kept in the overlay before the packed arrays are rebuilt
+COMPACT_THRESHOLD = 1024
+
+
+def parse_hash(value: str) -> int | None:
+    """Parses a 64-bit hex perceptual hash (as produced by imagehash) into an int."""
+    if not value or len(value) != HASH_BITS // 4:
+        return None
+    try:
+        return int(value, 16)
+    except ValueError:
+        return None
+
+
+def _chunk(hash_value: int, index: int) -> int:
+    return (hash_value >> (index * CHUNK_BITS)) & CHUNK_MASK
+
+
+def _chunk_neighbours(value: int, radius: int) -> np.ndarray:
+    """All chunk values within `radius` bit flips of `value`."""
+    neighbours = [value]
+    for flips in range(1, radius + 1):
+        for bits in combinations(range(CHUNK_BITS), flips):
+            mask = 0
+            for bit in bits:
+                mask |= 1 << bit
+            neighbours.append(value ^ mask)
+    return np.array(sorted(neighbours), dtype=np.uint16)
+
+
+class CardSimilarityIndex:
+    """
+    In-process Hamming-distance index over the perceptual hashes of active cards.
+
+    Hashes are packed into a uint64 NumPy array. For multi-index hashing the 64 bits are split into
+    four 16-bit chunks, each kept sorted with its row numbers: two hashes within distance r share at
+    least one chunk within distance r // 4, so a radius query only probes those chunk neighbourhoods
+    and verifies the candidates with a vectorised popcount.
+
+    Card writes in this process are applied on commit through signals (see inventory.signals); writes
+    made by other processes are picked up by an incremental sync on updated_at every
+    CARD_SIMILARITY_SYNC_SECONDS. Recent upserts live in a small overlay until the arrays are rebuilt.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._synced_until = None
+        self._last_sync = 0.0
+        self._build({})
+
+    def _build(self, hashes: dict):
+        self._ids = np.array(list(hashes.keys()), dtype=object)
+        self._hashes = np.fromiter(hashes.values(), dtype=np.uint64, count=len(hashes))
+        self._alive = np.ones(len(hashes), dtype=bool)
+        self._row_by_id = {card_id: row for row, card_id in enumerate(self._ids)}
+        self._chunk_values = []
+        self._chunk_rows = []
+        for index in range(CHUNK_COUNT):
+            chunk = ((self._hashes >> np.uint64(index * CHUNK_BITS)) & np.uint64(CHUNK_MASK)).astype(np.uint16)
+            order = np.argsort(chunk, kind="stable")
+            self._chunk_values.append(chunk[order])
+            self._chunk_rows.append(order)
+        self._overlay: dict = {}
+
+    def _snapshot(self) -> dict:
+        hashes = {card_id: int(hash_value) for card_id, hash_value, alive in zip(self._ids, self._hashes, self._alive) if alive}
+        hashes.update(self._overlay)
+        return hashes
+
+    # ------------------------------------------------------------------
+    # Loading and maintenance
+    # ------------------------------------------------------------------
+    def load(self):
+        synced_until = Card.objects.aggregate(latest=Max("updated_at"))["latest"]
+        hashes = {}
+        for card_id, perceptual_hash in Card.objects.filter(is_active=True).exclude(perceptual_hash="").values_list("id", "perceptual_hash"):
+            hash_value = parse_hash(perceptual_hash)
+            if hash_value is not None:
+                hashes[card_id] = hash_value
+        with self._lock:
+            self._build(hashes)
+            self._synced_until = synced_until
+            self._last_sync = time.monotonic()
+            self._loaded = True
+
+    def sync(self):
+        """Applies cards changed since the last load/sync (including by other processes)."""
+        if self._synced_until is None:
+            return self.load()
+        changes = Card.objects.filter(updated_at__gt=self._synced_until).values_list("id", "perceptual_hash", "is_active", "updated_at")
+        with self._lock:
+            for card_id, perceptual_hash, is_active, updated_at in changes:
+                self._apply(card_id, perceptual_hash, is_active)
+                self._synced_until = max(self._synced_until, updated_at)
+            self._last_sync = time.monotonic()
+
+    def _ensure_ready(self):
+        if not self._loaded:
+            self.load()
+        elif time.monotonic() - self._last_sync >= settings.CARD_SIMILARITY_SYNC_SECONDS:
+            self.sync()
+
+    def _apply(self, card_id, perceptual_hash: str, is_active: bool):
+        row = self._row_by_id.get(card_id)
+        if row is not None:
+            self._alive[row] = False
+        self._overlay.pop(card_id, None)
+
+        hash_value = parse_hash(perceptual_hash) if is_active else None
+        if hash_value is not None:
+            self._overlay[card_id] = hash_value
+        if len(self._overlay) > COMPACT_THRESHOLD:
+            self._build(self._snapshot())
+
+    def update_card(self, card_id, perceptual_hash: str, is_active: bool):
+        """Adds, moves or drops a card after a local write. No-op until the index is first loaded."""
+        with self._lock:
+            if self._loaded:
+                self._apply(card_id, perceptual_hash, is_active)
+
+    def remove_card(self, card_id):
+        self.update_card(card_id, "", False)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def _candidate_rows(self, hash_value: int, chunk_radius: int) -> np.ndarray:
+        ranges = []
+        for index in range(CHUNK_COUNT):
+            neighbours = _chunk_neighbours(_chunk(hash_value, index), chunk_radius)
+            values = self._chunk_values[index]
+            starts = np.searchsorted(values, neighbours, side="left")
+            ends = np.searchsorted(values, neighbours, side="right")
+            rows = self._chunk_rows[index]
+            ranges.extend(rows[start:end] for start, end in zip(starts, ends) if end > start)
+        if not ranges:
+            return np.empty(0, dtype=np.intp)
+        return np.unique(np.concatenate(ranges))
+
+    def search(self, perceptual_hash: str, max_distance: int, limit: int | None = None) -> list[tuple]:
+        """
+        Returns [(card_id, distance)] for active cards within max_distance bits of the hash,
+        closest first, truncated to limit when given.
+        """
+        hash_value = parse_hash(perceptual_hash)
+        if hash_value is None:
+            return []
+
+        self._ensure_ready()
+        with self._lock:
+            chunk_radius = max_distance // CHUNK_COUNT
+            if chunk_radius > MAX_PROBE_RADIUS:
+                # Probing would touch most rows anyway; a straight vectorised scan is cheaper
+                distances = np.bitwise_count(self._hashes ^ np.uint64(hash_value))
+                rows = np.flatnonzero((distances <= max_distance) & self._alive)
+                distances = distances[rows]
+            else:
+                rows = self._candidate_rows(hash_value, chunk_radius)
+                rows = rows[self._alive[rows]]
+                distances = np.bitwise_count(self._hashes[rows] ^ np.uint64(hash_value))
+                keep = distances <= max_distance
+                rows, distances = rows[keep], distances[keep]
+            if limit is not None and len(rows) > limit:
+                top = np.argpartition(distances, limit - 1)[:limit]
+                rows, distances = rows[top], distances[top]
+            matches = [(card_id, int(distance)) for card_id, distance in zip(self._ids[rows], distances)]
+
+            for card_id, overlay_hash in self._overlay.items():
+                distance = (overlay_hash ^ hash_value).bit_count()
+                if distance <= max_distance:
+                    matches.append((card_id, distance))
+
+        matches.sort(key=lambda match: match[1])
+        return matches[:limit] if limit is not None else matches
+
+
+card_similarity_index = CardSimilarityIndex()
@@ -5,7 +5,6 @@ from core.authorization import Permission, require_permission
 from core.decorators import forge
 from core.exceptions import BadRequest, Unauthorized
 from core.helpers.image_upload import ImageUpload
-from core.helpers.image_utils import ImageUtils
 from core.helpers.pagination import PaginationHelper
 from core.helpers.query_filters import QueryFilterSortHelper
 from core.utils import model_unwrap
@@ -33,7 +32,13 @@ class VendorView(APIView):
 
         # Get all vendors with pagination
         vendors = VendorService.get_vendors()
-        vendors, page_info = PaginationHelper.paginate_queryset(vendors, params.get_value("page"), params.get_value("page_size"))
+        vendors, page_info = PaginationHelper.paginate_queryset(
+            vendors,
+            params.get_value("page"),
+            params.get_value("page_size"),
+            cursor=params.get_value("cursor", None),
+            with_total=params.get_value("with_total"),
+        )
 
         return [model_unwrap(vendor) for vendor in vendors], page_info
 
@@ -71,7 +76,13 @@ class CardView(APIView):
         )
         cards = helper.apply(cards, params)
 
-        cards, page_info = PaginationHelper.paginate_queryset(cards, params.get_value("page"), params.get_value("page_size"))
+        cards, page_info = PaginationHelper.paginate_queryset(
+            cards,
+            params.get_value("page"),
+            params.get_value("page_size"),
+            cursor=params.get_value("cursor", None),
+            with_total=params.get_value("with_total"),
+        )
 
         return [model_unwrap(card) for card in cards], page_info
 
@@ -84,19 +95,18 @@ class CardView(APIView):
         if not image:
             raise BadRequest("Image is required")
 
-        perceptual_hash = ImageUtils.generate_perceptual_hash(image)
-
-        image_url = ImageUpload.upload_image_and_get_url(image)
+        stored_image = ImageUpload.upload_card_image(image)
 
         card = CardService.create_card(
             vendor_id=body.get_value("vendor_id"),
             staff=request.staff,
-            image_url=image_url,
+            image_url=stored_image.url,
+            image_variants=stored_image.variants,
             cost_price=body.get_value("cost_price"),
             sell_price=body.get_value("sell_price"),
             max_discount=body.get_value("max_discount"),
             quantity=body.get_value("quantity"),
-            perceptual_hash=perceptual_hash,
+            fingerprint=stored_image.fingerprint,
             card_type=body.get_value("card_type"),
         )
 
@@ -137,15 +147,16 @@ class CardDetailView(APIView):
 
 class CardSimilarityView(APIView):
     @forge
+    @require_permission(Permission.CARD_READ)
     def post(self, request):
-        CardSimilaritySerializer.validate_request(request)
+        body = CardSimilaritySerializer.validate_request(request)
 
         image = request.FILES.get("image")
         if not image:
             raise BadRequest("Image is required")
 
-        cards = CardService.find_similar_cards(image)
-        return model_unwrap(cards)
+        matches = CardService.find_similar_cards(image, max_distance=body.get_value("max_distance"), limit=body.get_value("limit"))
+        return [{**model_unwrap(card), "distance": distance} for card, distance in matches]
 
 
 class CardPurchaseView(APIView):
@@ -0,0 +1,60 @@
+from collections import Counter
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIRequestFactory
+
+from accounts.models import Staff
+from auditing.buffer import audit_buffer
+from auditing.context import reset_current_staff, set_current_staff
+from orders.models import Order
+from orders.views import OrderView
+
+
+class Command(BaseCommand):
+    help = "Count the queries of an OrderView.patch call with and without load-time audit snapshots (changes are rolled back)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--order-id", help="Order to patch (defaults to the latest order with items)")
+        parser.add_argument("--items", type=int, default=5, help="Number of order items to edit")
+
+    def handle(self, *args, **options):
+        order = Order.objects.filter(id=options["order_id"]) if options["order_id"] else Order.objects.filter(order_items__isnull=False)
+        if not (order := order.order_by("-created_at").first()):
+            raise CommandError("No order to patch")
+        if not (staff := Staff.objects.filter(role=Staff.Role.ADMIN, is_active=True).first()):
+            raise CommandError("An active admin is required to call the view")
+
+        items = list(order.order_items.order_by("created_at")[: options["items"]])
+        payload = {
+            "order_items": [{"order_item_id": str(item.id), "discount_amount": "0.00", "quantity": item.quantity + 1} for item in items],
+            "special_instruction": "benchmark",
+        }
+        self.stdout.write(f"Patching order {order.id} ({len(items)} item(s))")
+
+        for label, snapshots in (("re-read on save", False), ("load-time snapshot", True)):
+            with override_settings(AUDIT_LOAD_SNAPSHOTS=snapshots):
+                queries = self._run(order, staff, payload)
+            kinds = Counter(query["sql"].split(None, 1)[0].upper() for query in queries)
+            breakdown = ", ".join(f"{kind}={count}" for kind, count in sorted(kinds.items()))
+            self.stdout.write(f"{label:>20}: {len(queries)} queries ({breakdown})")
+
+    @staticmethod
+    def _run(order, staff, payload):
+        request = APIRequestFactory().patch(f"/api/v1/orders/{order.id}/", payload, format="json")
+        request.staff = staff
+        request.is_authenticated = True
+        set_current_staff(staff)
+        try:
+            with transaction.atomic():
+                with CaptureQueriesContext(connection) as context:
+                    response = OrderView.as_view()(request, order_id=order.id)
+                    # Audit entries are normally written after commit; write them here so they are counted
+                    audit_buffer.spill()
+                if response.status_code >= 400:
+                    raise CommandError(f"Patch failed with {response.status_code}: {response.content[:500]!r}")
+                transaction.set_rollback(True)
+        finally:
+            reset_current_staff()
+        return context.captured_queries
@@ -0,0 +1,74 @@
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import models, transaction
+
+from analytics.services import OrderAnalyticsService
+from orders.models import Bill, BillAdjustment, Order, OrderFinancials, Payment
+from orders.services import BillService, OrderFinancialsService, OrderService
+
+
+class Command(BaseCommand):
+    help = "Rebuild the order_financials table and verify it against the Python bill calculation"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--verify-only", action="store_true", help="Only compare stored rows, do not rebuild")
+        parser.add_argument("--batch-size", type=int, default=500, help="Orders processed per query batch")
+
+    def handle(self, *args, **options):
+        batch_size = max(options["batch_size"], 1)
+
+        if not options["verify_only"]:
+            order_ids = list(Order.objects.order_by("id").values_list("id", flat=True))
+            for start in range(0, len(order_ids), batch_size):
+                with transaction.atomic():
+                    OrderFinancialsService.refresh_queryset(Order.objects.filter(id__in=order_ids[start : start + batch_size]))
+            self.stdout.write(f"Rebuilt financials for {len(order_ids)} orders")
+
+        mismatches = self._verify(batch_size)
+        if mismatches:
+            for order_id, field, stored, expected in mismatches:
+                self.stderr.write(f"Order {order_id}: {field} stored={stored} expected={expected}")
+            raise CommandError(f"{len(mismatches)} mismatched values found in order_financials")
+
+        self.stdout.write(self.style.SUCCESS("order_financials matches the Python calculation"))
+
+    def _verify(self, batch_size):
+        mismatches = []
+        bill_ids = list(Bill.objects.order_by("id").values_list("id", flat=True))
+
+        for start in range(0, len(bill_ids), batch_size):
+            bills = list(Bill.objects.select_related("order").filter(id__in=bill_ids[start : start + batch_size]))
+            order_ids = [bill.order_id for bill in bills]
+
+            stored_map = {f.order_id: f for f in OrderFinancials.objects.filter(order_id__in=order_ids)}
+            paid_map = dict(
+                Payment.objects.filter(bill__in=bills).values("bill_id").annotate(total=models.Sum("amount")).values_list("bill_id", "total")
+            )
+            adjusted_map = dict(
+                BillAdjustment.objects.filter(bill__in=bills).values("bill_id").annotate(total=models.Sum("amount")).values_list("bill_id", "total")
+            )
+            orders_map = {order.id: order for order in OrderService.get_orders_queryset().filter(id__in=order_ids)}
+
+            for bill_details in BillService.calculate_bills_details_in_bulk(bills):
+                bill = bill_details["bill_instance"]
+                stored = stored_map.get(bill.order_id)
+                if stored is None:
+                    mismatches.append((bill.order_id, "row", None, "present"))
+                    continue
+
+                expected = dict(bill_details["summary"])
+                expected["total_paid"] = paid_map.get(bill.id) or Decimal("0.00")
+                expected["total_adjusted"] = adjusted_map.get(bill.id) or Decimal("0.00")
+                expected["has_pending_expense"] = OrderAnalyticsService.calculate_order_profit(orders_map[bill.order_id]) is None
+
+                actual = stored.summary()
+                actual["total_paid"] = stored.total_paid
+                actual["total_adjusted"] = stored.total_adjusted
+                actual["has_pending_expense"] = stored.has_pending_expense
+
+                for field, expected_value in expected.items():
+                    if actual[field] != expected_value:
+                        mismatches.append((bill.order_id, field, actual[field], expected_value))
+
+        return mismatches
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:38
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0005_alter_serviceorderitem_service_type'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderFinancials',
+            fields=[
+                ('order', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='financials', serialize=False, to='orders.order')),
+                ('order_items_subtotal', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('service_items_subtotal', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('total_box_cost', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('total_printing_cost', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('grand_total', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('tax_percentage', models.DecimalField(decimal_places=2, default=0, max_digits=5)),
+                ('tax_amount', models.DecimalField(decimal_places=6, default=0, max_digits=18)),
+                ('total_with_tax', models.DecimalField(decimal_places=6, default=0, max_digits=18)),
+                ('total_paid', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('total_adjusted', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('has_pending_expense', models.BooleanField(default=False)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Order Financials',
+                'verbose_name_plural': 'Order Financials',
+                'db_table': 'order_financials',
+            },
+        ),
+    ]
@@ -14,6 +14,8 @@ from core.constants import (
     TAX_DECIMAL_PLACES,
     TAX_MAX_DIGITS,
     TEXT_LENGTH,
+    TOTAL_DECIMAL_PLACES,
+    TOTAL_MAX_DIGITS,
 )
 from inventory.models import Card
 
@@ -188,3 +190,47 @@ class ServiceOrderItem(models.Model):
 
     def __str__(self):
         return f"{self.service_type} x {self.quantity}"
+
+
+class OrderFinancials(models.Model):
+    """Denormalized per-order money summary, kept in sync by orders.signals"""
+
+    order = models.OneToOneField(Order, on_delete=models.CASCADE, primary_key=True, related_name="financials")
+    order_items_subtotal = models.DecimalField(max_digits=TOTAL_MAX_DIGITS, decimal_places=PRICE_DECIMAL_PLACES, default=DEFAULT_AMOUNT)
+    service_items_subtotal = models.DecimalField(max_digits=TOTAL_MAX_DIGITS, decimal_places=PRICE_DECIMAL_PLACES, default=DEFAULT_AMOUNT)
+    total_box_cost = models.DecimalField(max_digits=TOTAL_MAX_DIGITS, decimal_places=PRICE_DECIMAL_PLACES, default=DEFAULT_AMOUNT)
+    total_printing_cost = models.DecimalField(max_digits=TOTAL_MAX_DIGITS, decimal_places=PRICE_DECIMAL_PLACES, default=DEFAULT_AMOUNT)
+    grand_total = models.DecimalField(max_digits=TOTAL_MAX_DIGITS, decimal_places=PRICE_DECIMAL_PLACES, default=DEFAULT_AMOUNT)
+    tax_percentage = models.DecimalField(max_digits=TAX_MAX_DIGITS, decimal_places=TAX_DECIMAL_PLACES, default=DEFAULT_TAX_PERCENTAGE)
+    tax_amount = models.DecimalField(max_digits=TOTAL_MAX_DIGITS, decimal_places=TOTAL_DECIMAL_PLACES, default=DEFAULT_AMOUNT)
+    total_with_tax = models.DecimalField(max_digits=TOTAL_MAX_DIGITS, decimal_places=TOTAL_DECIMAL_PLACES, default=DEFAULT_AMOUNT)
+    total_paid = models.DecimalField(max_digits=TOTAL_MAX_DIGITS, decimal_places=PRICE_DECIMAL_PLACES, default=DEFAULT_AMOUNT)
+    total_adjusted = models.DecimalField(max_digits=TOTAL_MAX_DIGITS, decimal_places=PRICE_DECIMAL_PLACES, default=DEFAULT_AMOUNT)
+    has_pending_expense = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "order_financials"
+        verbose_name = "Order Financials"
+        verbose_name_plural = "Order Financials"
+
+    def __str__(self):
+        return f"Financials for Order {self.order_id}"
+
+    @property
+    def pending_amount(self):
+        return self.total_with_tax - (self.total_paid + self.total_adjusted)
+
+    def summary(self):
+        """Same shape as the summary returned by BillService.calculate_bill_details"""
+        return {
+            "order_items_subtotal": self.order_items_subtotal,
+            "service_items_subtotal": self.service_items_subtotal,
+            "items_subtotal": self.order_items_subtotal + self.service_items_subtotal,
+            "total_box_cost": self.total_box_cost,
+            "total_printing_cost": self.total_printing_cost,
+            "grand_total": self.grand_total,
+            "tax_percentage": self.tax_percentage,
+            "tax_amount": self.tax_amount,
+            "total_with_tax": self.total_with_tax,
+        }
@@ -37,6 +37,8 @@ class PaymentQueryParams(ParamSerializer):
     bill_id = serializers.UUIDField(required=False)
     page = serializers.IntegerField(required=False, default=PAGINATION_DEFAULT_PAGE)
     page_size = serializers.IntegerField(required=False, default=PAGINATION_DEFAULT_PAGE_SIZE)
+    cursor = serializers.CharField(required=False, allow_blank=True)
+    with_total = serializers.BooleanField(required=False, default=False)
 
 
 class BillAdjustmentQueryParams(ParamSerializer):
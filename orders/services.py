@@ -2,19 +2,24 @@ from decimal import Decimal
 
 from django.conf import settings
 from django.db import models, transaction
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 
+from analytics import cache as analytics_cache
+from auditing.services import ModelAuditService
+from core.constants import PRICE_DECIMAL_PLACES, TOTAL_MAX_DIGITS
 from core.exceptions import Conflict, ResourceNotFound
 from core.utils import model_unwrap
-from inventory.models import Card
-from inventory.services import InventoryTransactionService
-from orders.models import Bill, BillAdjustment, Order, OrderItem, Payment, ServiceOrderItem
+from inventory.models import Card, InventoryTransaction
+from inventory.services import StockLedgerService, StockMovement
+from orders.models import Bill, BillAdjustment, Order, OrderFinancials, OrderItem, Payment, ServiceOrderItem
 from production.models import BoxOrder, PrintingJob
 
 
 class OrderService:
     @staticmethod
     def get_orders_queryset():
-        return Order.objects.select_related("customer", "staff").prefetch_related(
+        return Order.objects.select_related("customer", "staff", "bill").prefetch_related(
             models.Prefetch(
                 "order_items",
                 queryset=OrderItem.objects.select_related("card").prefetch_related(
@@ -43,19 +48,15 @@ class OrderService:
         return qs.order_by("-created_at")
 
     @staticmethod
+    @transaction.atomic
     def create_order_item(order, card_id, discount_amount, quantity, requires_box, requires_printing):
-        card = Card.objects.select_for_update().filter(id=card_id, is_active=True).first()
+        card = Card.objects.filter(id=card_id, is_active=True).first()
         if not card:
             raise ResourceNotFound("Card not found")
-        if card.quantity < quantity:
-            raise Conflict("Quantity in stock is less than the required quantity")
 
         if discount_amount > card.max_discount or discount_amount < 0:
             raise Conflict("Discount amount is not valid")
 
-        card.quantity -= quantity
-        card.save()
-
         order_item = OrderItem.objects.create(
             order=order,
             card=card,
@@ -67,10 +68,102 @@ class OrderService:
         )
         print("Created Order Item \n", model_unwrap(order_item))
 
-        InventoryTransactionService.record_sale_transaction(order_item)
+        StockLedgerService.apply(
+            [StockMovement(card, -quantity, InventoryTransaction.TransactionType.SALE, order_item=order_item, notes="Sale")], order.staff
+        )
 
         return order_item
 
+    @staticmethod
+    @transaction.atomic
+    def create_order_items_bulk(order, items):
+        """Create every line of an order with a fixed number of queries, however many lines there are.
+
+        All referenced cards are locked in one SELECT ... FOR UPDATE ordered by id (a consistent lock
+        order, so concurrent orders cannot deadlock), stock and discounts are validated in memory, rows
+        are written with bulk_create and stock is decremented with a single UPDATE ... CASE.
+
+        Returns [(order_item, box_order | None, printing_job | None)] in request order.
+        """
+        if not items:
+            return []
+
+        requested = {}
+        for item in items:
+            requested[item.get("card_id")] = requested.get(item.get("card_id"), 0) + item.get("quantity")
+
+        cards = {card.id: card for card in Card.objects.select_for_update().filter(id__in=requested, is_active=True).order_by("id")}
+        if len(cards) != len(requested):
+            raise ResourceNotFound("Card not found")
+        for card_id, quantity in requested.items():
+            if cards[card_id].quantity < quantity:
+                raise Conflict("Quantity in stock is less than the required quantity")
+
+        order_items, box_orders, printing_jobs, transactions, created = [], [], [], [], []
+        for item in items:
+            card = cards[item.get("card_id")]
+            discount_amount = item.get("discount_amount", 0)
+            if discount_amount > card.max_discount or discount_amount < 0:
+                raise Conflict("Discount amount is not valid")
+
+            order_item = OrderItem(
+                order=order,
+                card=card,
+                quantity=item.get("quantity"),
+                price_per_item=card.sell_price,
+                discount_amount=discount_amount,
+                requires_box=item.get("requires_box"),
+                requires_printing=item.get("requires_printing"),
+            )
+            order_items.append(order_item)
+            transactions.append(
+                InventoryTransaction(
+                    card=card,
+                    staff=order.staff,
+                    transaction_type=InventoryTransaction.TransactionType.SALE,
+                    order_item=order_item,
+                    quantity_changed=-order_item.quantity,
+                    cost_price=card.cost_price,
+                    notes="Sale",
+                )
+            )
+            box_order = printing_job = None
+            if item.get("requires_box"):
+                box_order = BoxOrder(
+                    order_item=order_item, box_type=item.get("box_type"), box_quantity=order_item.quantity, total_box_cost=item.get("total_box_cost")
+                )
+                box_orders.append(box_order)
+            if item.get("requires_printing"):
+                printing_job = PrintingJob(
+                    order_item=order_item, print_quantity=order_item.quantity, total_printing_cost=item.get("total_printing_cost")
+                )
+                printing_jobs.append(printing_job)
+            created.append((order_item, box_order, printing_job))
+
+        stock_changes = []
+        for card_id, quantity in requested.items():
+            card = cards[card_id]
+            stock_changes.append((card, {"quantity": card.quantity}, {"quantity": card.quantity - quantity}))
+            card.quantity -= quantity
+        decrements = [models.When(id=card_id, then=models.Value(quantity)) for card_id, quantity in requested.items()]
+        Card.objects.filter(id__in=requested).update(
+            quantity=models.F("quantity") - models.Case(*decrements, output_field=models.IntegerField()), updated_at=timezone.now()
+        )
+
+        OrderItem.objects.bulk_create(order_items)
+        InventoryTransaction.objects.bulk_create(transactions)
+        BoxOrder.objects.bulk_create(box_orders)
+        PrintingJob.objects.bulk_create(printing_jobs)
+
+        # bulk_create and update() skip the model signals, so do their work here
+        ModelAuditService.record_bulk_changes(created=[*order_items, *transactions, *box_orders, *printing_jobs], updated=stock_changes)
+        OrderFinancialsService.refresh(order.id)
+        analytics_cache.invalidate_models(
+            "inventory.Card", "inventory.InventoryTransaction", "orders.OrderItem", "production.BoxOrder", "production.PrintingJob"
+        )
+
+        return created
+
     @staticmethod
     @transaction.atomic
     def create_order(customer, staff, name, order_date, delivery_date, special_instruction):
@@ -93,17 +186,8 @@ class OrderService:
         def _adjust_order_item_quantity(order_item, new_quantity):
             if new_quantity is None or new_quantity == order_item.quantity:
                 return
-            delta = new_quantity - order_item.quantity
-            locked_card = Card.objects.select_for_update().filter(id=order_item.card_id).first()
-            if not locked_card:
-                raise ResourceNotFound("Card not found")
-            if delta > 0:
-                if locked_card.quantity < delta:
-                    raise Conflict("Quantity in stock is less than the required quantity")
-                locked_card.quantity -= delta
-            elif delta < 0:
-                locked_card.quantity += -delta
-            locked_card.save()
+            # Line edits move stock without a ledger row, as they always have
+            StockLedgerService.apply([StockMovement(order_item.card, order_item.quantity - new_quantity)])
             order_item.quantity = new_quantity
 
         def _update_discount(order_item, discount_amount):
@@ -167,16 +251,17 @@ class OrderService:
         OrderStatusService.recalculate_ready(order)
         return order
 
+    @staticmethod
+    def _return_movement(order_item):
+        return StockMovement(
+            order_item.card, order_item.quantity, InventoryTransaction.TransactionType.RETURN, order_item=order_item, notes="Return to stock"
+        )
+
     @staticmethod
     def remove_order_items(order, remove_item_ids):
-        for oid in remove_item_ids or []:
-            order_item = OrderItem.objects.get(id=oid, order=order)
-            InventoryTransactionService.record_return_transaction(order_item)
-            locked_card = Card.objects.select_for_update().filter(id=order_item.card_id).first()
-            if not locked_card:
-                raise ResourceNotFound("Card not found")
-            locked_card.quantity += order_item.quantity
-            locked_card.save()
+        order_items = [OrderItem.objects.select_related("card").get(id=oid, order=order) for oid in remove_item_ids or []]
+        StockLedgerService.apply([OrderService._return_movement(order_item) for order_item in order_items], order.staff)
+        for order_item in order_items:
             order_item.delete()
         # Removing items may affect READY status
         OrderStatusService.recalculate_ready(order)
@@ -184,23 +269,7 @@ class OrderService:
 
     @staticmethod
     def add_order_items(order, add_items):
-        for item in add_items or []:
-            order_item = OrderService.create_order_item(
-                order=order,
-                card_id=item.get("card_id"),
-                discount_amount=item.get("discount_amount"),
-                quantity=item.get("quantity"),
-                requires_box=item.get("requires_box"),
-                requires_printing=item.get("requires_printing"),
-            )
-            if item.get("requires_box"):
-                from production.services import BoxOrderService
-
-                BoxOrderService.create_box_order(order_item, item.get("box_type"), item.get("quantity"), item.get("total_box_cost"))
-            if item.get("requires_printing"):
-                from production.services import PrintingJobService
-
-                PrintingJobService.create_printing_job(order_item, item.get("quantity"), item.get("total_printing_cost"))
+        OrderService.create_order_items_bulk(order, add_items or [])
         # Adding items might kick off work → IN_PROGRESS
         OrderStatusService.mark_in_progress_if_started(order)
         OrderStatusService.recalculate_ready(order)
@@ -241,17 +310,9 @@ class OrderService:
             if BillAdjustment.objects.filter(bill=bill).exists():
                 raise Conflict("Cannot delete order with bill adjustments. Remove adjustments first.")
 
-        # Revert inventory for all order items
+        # Revert inventory for all order items, recording a return transaction for each
         order_items = OrderItem.objects.filter(order=order).select_related("card")
-        for order_item in order_items:
-            # Record the return transaction then add quantity back
-            InventoryTransactionService.record_return_transaction(order_item)
-
-            locked_card = Card.objects.select_for_update().filter(id=order_item.card_id).first()
-            if not locked_card:
-                raise ResourceNotFound("Card not found")
-            locked_card.quantity += order_item.quantity
-            locked_card.save()
+        StockLedgerService.apply([OrderService._return_movement(order_item) for order_item in order_items], order.staff)
 
         # Finally delete the order (cascades will handle children)
         order.delete()
@@ -356,7 +417,7 @@ class BillService:
 
     @staticmethod
     def get_bill_by_id(bill_id):
-        bill = Bill.objects.select_related("order", "order__customer", "order__staff").filter(id=bill_id).first()
+        bill = Bill.objects.select_related("order", "order__customer", "order__staff", "order__financials").filter(id=bill_id).first()
         if not bill:
             raise ResourceNotFound("Bill not found")
 
@@ -364,18 +425,20 @@ class BillService:
 
     @staticmethod
     def get_bill_by_order_id(order_id):
-        bill = Bill.objects.select_related("order", "order__customer", "order__staff").filter(order_id=order_id).first()
+        bill = Bill.objects.select_related("order", "order__customer", "order__staff", "order__financials").filter(order_id=order_id).first()
         if not bill:
             raise ResourceNotFound("Bill not found")
         return bill
 
     @staticmethod
     def get_bills():
-        return Bill.objects.select_related("order", "order__customer", "order__staff").all().order_by("-created_at")
+        return Bill.objects.select_related("order", "order__customer", "order__staff", "order__financials").all().order_by("-created_at")
 
     @staticmethod
     def get_bills_by_phone(phone):
-        return Bill.objects.select_related("order", "order__customer").filter(order__customer__phone=phone).order_by("-created_at")
+        return (
+            Bill.objects.select_related("order", "order__customer", "order__financials").filter(order__customer__phone=phone).order_by("-created_at")
+        )
 
     @staticmethod
     def create_bill(order):
@@ -529,17 +592,11 @@ class BillService:
     @staticmethod
     def refresh_bill_payment_status(bill_id):
         bill = BillService.get_bill_by_id(bill_id)
-        bill_details = BillService.calculate_bill_details(bill)
-        total_due = bill_details["summary"]["total_with_tax"]
-
-        payments = Payment.objects.filter(bill=bill)
-        total_paid = payments.aggregate(total=models.Sum("amount"))["total"] or Decimal("0.00")
+        financials = OrderFinancialsService.get_for_order(bill.order)
+        total_due = financials.total_with_tax
 
         # Include bill adjustments as eligible credits towards payment status
-        adjustments = BillAdjustment.objects.filter(bill=bill)
-        total_adjusted = adjustments.aggregate(total=models.Sum("amount"))["total"] or Decimal("0.00")
-
-        total_credited = total_paid + total_adjusted
+        total_credited = financials.total_paid + financials.total_adjusted
 
         new_status = Bill.PaymentStatus.PENDING
         if total_credited >= total_due:
@@ -563,6 +620,128 @@ class BillService:
         return bill
 
 
+class OrderFinancialsService:
+    """Maintains the OrderFinancials table.
+
+    Every refresh recomputes the affected orders with a single aggregate SELECT
+    (one scalar subquery per child table) and writes them back with one upsert,
+    so callers never need to load the order graph just to know its totals.
+    """
+
+    UPDATE_FIELDS = [
+        "order_items_subtotal",
+        "service_items_subtotal",
+        "total_box_cost",
+        "total_printing_cost",
+        "grand_total",
+        "tax_percentage",
+        "tax_amount",
+        "total_with_tax",
+        "total_paid",
+        "total_adjusted",
+        "has_pending_expense",
+        "updated_at",
+    ]
+
+    @staticmethod
+    def _sum_subquery(queryset, order_field, expression):
+        output_field = models.DecimalField(max_digits=TOTAL_MAX_DIGITS, decimal_places=PRICE_DECIMAL_PLACES)
+        subquery = models.Subquery(
+            queryset.filter(**{order_field: models.OuterRef("pk")})
+            .order_by()
+            .values(order_field)
+            .annotate(total=models.Sum(expression, output_field=output_field))
+            .values("total")[:1],
+            output_field=output_field,
+        )
+        return Coalesce(subquery, models.Value(Decimal("0.00")), output_field=output_field)
+
+    @staticmethod
+    def _annotate_totals(orders_queryset):
+        item_total_expr = (models.F("price_per_item") - models.F("discount_amount")) * models.F("quantity")
+        sum_subquery = OrderFinancialsService._sum_subquery
+
+        return orders_queryset.annotate(
+            fin_items_total=sum_subquery(OrderItem.objects.all(), "order_id", item_total_expr),
+            fin_services_total=sum_subquery(ServiceOrderItem.objects.all(), "order_id", "total_cost"),
+            fin_box_total=sum_subquery(BoxOrder.objects.all(), "order_item__order_id", "total_box_cost"),
+            fin_printing_total=sum_subquery(PrintingJob.objects.all(), "order_item__order_id", "total_printing_cost"),
+            fin_paid=sum_subquery(Payment.objects.all(), "bill__order_id", "amount"),
+            fin_adjusted=sum_subquery(BillAdjustment.objects.all(), "bill__order_id", "amount"),
+            fin_tax_percentage=models.Subquery(Bill.objects.filter(order_id=models.OuterRef("pk")).values("tax_percentage")[:1]),
+            # Same readiness rules as the profit calculation in analytics
+            fin_pending_printing=models.Exists(
+                PrintingJob.objects.filter(order_item__order_id=models.OuterRef("pk"), order_item__requires_printing=True).filter(
+                    models.Q(total_printing_expense__isnull=True) | models.Q(total_tracing_expense__isnull=True)
+                )
+            ),
+            fin_pending_box=models.Exists(
+                BoxOrder.objects.filter(order_item__order_id=models.OuterRef("pk"), order_item__requires_box=True, total_box_expense__isnull=True)
+            ),
+            fin_pending_service=models.Exists(ServiceOrderItem.objects.filter(order_id=models.OuterRef("pk"), total_expense__isnull=True)),
+        )
+
+    @staticmethod
+    def _build(order):
+        tax_percentage = order.fin_tax_percentage if order.fin_tax_percentage is not None else Decimal("0.00")
+        grand_total = order.fin_items_total + order.fin_services_total + order.fin_box_total + order.fin_printing_total
+        # Mirrors BillService.calculate_bill_details so stored values match it exactly
+        tax_amount = grand_total * (tax_percentage / Decimal("100.0"))
+
+        return OrderFinancials(
+            order_id=order.id,
+            order_items_subtotal=order.fin_items_total,
+            service_items_subtotal=order.fin_services_total,
+            total_box_cost=order.fin_box_total,
+            total_printing_cost=order.fin_printing_total,
+            grand_total=grand_total,
+            tax_percentage=tax_percentage,
+            tax_amount=tax_amount,
+            total_with_tax=grand_total + tax_amount,
+            total_paid=order.fin_paid,
+            total_adjusted=order.fin_adjusted,
+            has_pending_expense=order.fin_pending_printing or order.fin_pending_box or order.fin_pending_service,
+        )
+
+    @staticmethod
+    def refresh_queryset(orders_queryset) -> list[OrderFinancials]:
+        """Recompute and upsert the financials of every order in the queryset"""
+        orders = OrderFinancialsService._annotate_totals(orders_queryset.order_by().only("id"))
+        rows = [OrderFinancialsService._build(order) for order in orders]
+        if rows:
+            OrderFinancials.objects.bulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=["order"],
+                update_fields=OrderFinancialsService.UPDATE_FIELDS,
+            )
+        return rows
+
+    @staticmethod
+    def refresh(order_id) -> OrderFinancials | None:
+        rows = OrderFinancialsService.refresh_queryset(Order.objects.filter(id=order_id))
+        return rows[0] if rows else None
+
+    @staticmethod
+    def refresh_for_order_item(order_item_id):
+        OrderFinancialsService.refresh_queryset(Order.objects.filter(order_items__id=order_item_id))
+
+    @staticmethod
+    def refresh_for_bill(bill_id):
+        OrderFinancialsService.refresh_queryset(Order.objects.filter(bill__id=bill_id))
+
+    @staticmethod
+    def get_for_order(order) -> OrderFinancials:
+        """Return the stored financials, building the row on first access for orders that predate the table"""
+        try:
+            return order.financials
+        except OrderFinancials.DoesNotExist:
+            financials = OrderFinancialsService.refresh(order.id)
+            if financials is None:
+                raise ResourceNotFound("Order not found")
+            return financials
+
+
 class PaymentService:
     @staticmethod
     def get_payment_by_id(payment_id):
@@ -580,6 +759,7 @@ class PaymentService:
         return Payment.objects.all().order_by("-created_at")
 
     @staticmethod
+    @transaction.atomic  # Payment and its OrderFinancials refresh commit together
     def create_payment(bill_id, amount, payment_mode, transaction_ref, notes):
         if not BillService.check_bill_exists(bill_id):
             raise ResourceNotFound("Bill not found")
@@ -0,0 +1,68 @@
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from orders.models import Bill, BillAdjustment, Order, OrderItem, Payment, ServiceOrderItem
+from orders.services import OrderFinancialsService
+from production.models import BoxOrder, PrintingJob
+
+
+def _cascading_from(origin, *models) -> bool:
+    """True when a delete was triggered by removing one of the given parent models.
+
+    The parent's own signal (or its removal) takes care of the financials row, and refreshing
+    half-deleted orders mid-cascade could recreate a row for an order that is about to vanish.
+    """
+    if isinstance(origin, QuerySet):
+        return origin.model in models
+    return isinstance(origin, models)
+
+
+@receiver(post_save, sender=OrderItem)
+@receiver(post_save, sender=ServiceOrderItem)
+def _refresh_financials_on_item_save(sender, instance, **kwargs):
+    OrderFinancialsService.refresh(instance.order_id)
+
+
+@receiver(post_delete, sender=OrderItem)
+@receiver(post_delete, sender=ServiceOrderItem)
+def _refresh_financials_on_item_delete(sender, instance, origin=None, **kwargs):
+    if _cascading_from(origin, Order):
+        return
+    OrderFinancialsService.refresh(instance.order_id)
+
+
+@receiver(post_save, sender=BoxOrder)
+@receiver(post_save, sender=PrintingJob)
+def _refresh_financials_on_production_save(sender, instance, **kwargs):
+    OrderFinancialsService.refresh_for_order_item(instance.order_item_id)
+
+
+@receiver(post_delete, sender=BoxOrder)
+@receiver(post_delete, sender=PrintingJob)
+def _refresh_financials_on_production_delete(sender, instance, origin=None, **kwargs):
+    if _cascading_from(origin, Order, OrderItem):
+        return
+    OrderFinancialsService.refresh_for_order_item(instance.order_item_id)
+
+
+@receiver(post_save, sender=Payment)
+@receiver(post_save, sender=BillAdjustment)
+def _refresh_financials_on_credit_save(sender, instance, **kwargs):
+    OrderFinancialsService.refresh_for_bill(instance.bill_id)
+
+
+@receiver(post_delete, sender=Payment)
+@receiver(post_delete, sender=BillAdjustment)
+def _refresh_financials_on_credit_delete(sender, instance, origin=None, **kwargs):
+    if _cascading_from(origin, Order, Bill):
+        return
+    OrderFinancialsService.refresh_for_bill(instance.bill_id)
+
+
+@receiver(post_save, sender=Bill)
+def _refresh_financials_on_bill_save(sender, instance, update_fields=None, **kwargs):
+    # Payment status syncs save the bill with update_fields; only the tax rate affects totals
+    if update_fields is not None and "tax_percentage" not in update_fields:
+        return
+    OrderFinancialsService.refresh(instance.order_id)
@@ -1,12 +1,12 @@
 from decimal import Decimal
 
-from django.db import models, transaction
+from django.db import transaction
 from django.utils import timezone
 from rest_framework.views import APIView
 
 from accounts.services import CustomerService
 from analytics.services import OrderAnalyticsService
-from core.authorization import Permission, require_permission
+from core.authorization import Permission, allow_authenticated, require_permission
 from core.decorators import forge
 from core.helpers.pagination import PaginationHelper
 from core.helpers.query_filters import QueryFilterSortHelper
@@ -22,14 +22,14 @@ from orders.serializers import (
     PaymentCreateSerializer,
     PaymentQueryParams,
 )
-from orders.services import BillAdjustmentService, BillService, OrderService, PaymentService, ServiceOrderItemService
-from production.services import BoxOrderService, PrintingJobService
+from orders.services import BillAdjustmentService, BillService, OrderFinancialsService, OrderService, PaymentService, ServiceOrderItemService
 
 
 class OrderView(APIView):
     @forge
+    @require_permission(Permission.ORDER_READ)
     def get(self, request, order_id=None):
-        def weave(order):
+        def weave(order, profit):
             order_data = model_unwrap(order)
             order_items_data = []
             for order_item in order.order_items.all():
@@ -42,14 +42,13 @@ class OrderView(APIView):
             order_data["order_items"] = order_items_data
             order_data["service_items"] = model_unwrap(order.service_items.all())
             order_data["bill_id"] = model_unwrap(order.bill).get("id")
-            # Compute order profit; None when pending expenses exist
-            profit = OrderAnalyticsService.calculate_order_profit(order)
+            # Order profit; None when pending expenses exist
             order_data["order_profit"] = f"{profit:.2f}" if isinstance(profit, Decimal) else None
             return order_data
 
         if order_id:
             order = OrderService.get_order_by_id(order_id)
-            return weave(order)
+            return weave(order, OrderAnalyticsService.calculate_order_profit(order))
 
         params = OrderQueryParams.validate_params(request)
 
@@ -97,9 +96,17 @@ class OrderView(APIView):
             else:
                 orders_queryset = orders_queryset.exclude(order_status__in=["FULLY_PAID", "DELIVERED"])  # non-terminal
 
-        orders, page_info = PaginationHelper.paginate_queryset(orders_queryset, params.get_value("page"), params.get_value("page_size"))
+        orders, page_info = PaginationHelper.paginate_queryset(
+            orders_queryset,
+            params.get_value("page"),
+            params.get_value("page_size"),
+            cursor=params.get_value("cursor", None),
+            with_total=params.get_value("with_total"),
+        )
 
-        weaved_orders = [weave(order) for order in orders]
+        # Profits for the whole page from the prefetched relations and one adjustments query
+        profits = OrderAnalyticsService.calculate_order_profits(orders)
+        weaved_orders = [weave(order, profits[order.id]) for order in orders]
 
         return weaved_orders, page_info
 
@@ -126,29 +133,12 @@ class OrderView(APIView):
         # Create Order Items and Production Services
         created_order_items = []
         created_service_items = []
-        for item in order_items:
-            order_item = OrderService.create_order_item(
-                order=order,
-                card_id=item.get("card_id"),
-                discount_amount=item.get("discount_amount", 0),
-                quantity=item.get("quantity"),
-                requires_box=item.get("requires_box"),
-                requires_printing=item.get("requires_printing"),
-            )
+        for order_item, box_order, printing_job in OrderService.create_order_items_bulk(order, order_items):
             order_item_data = model_unwrap(order_item)
-
-            if item.get("requires_box"):
-                box_order = BoxOrderService.create_box_order(
-                    order_item=order_item, box_type=item.get("box_type"), quantity=item.get("quantity"), total_box_cost=item.get("total_box_cost")
-                )
+            if box_order:
                 order_item_data["box_order"] = model_unwrap(box_order)
-
-            if item.get("requires_printing"):
-                printing_job = PrintingJobService.create_printing_job(
-                    order_item=order_item, quantity=item.get("quantity"), total_printing_cost=item.get("total_printing_cost")
-                )
+            if printing_job:
                 order_item_data["printing_job"] = model_unwrap(printing_job)
-
             created_order_items.append(order_item_data)
 
         # Create Service Items
@@ -219,16 +209,16 @@ class OrderView(APIView):
 
 class BillView(APIView):
     @forge
+    @require_permission(Permission.BILL_READ)
     def get(self, request, bill_id=None):
         def weave(bill_details):
             bill_instance = bill_details["bill_instance"]
             detailed_items = bill_details["detailed_order_items"]
-            summary = bill_details["summary"]
 
-            # Calculate pending amount = total_with_tax - sum(payments)
-            total_paid = bill_instance.payments.aggregate(total=models.Sum("amount")).get("total") or Decimal("0.00")
-            total_adjusted = bill_instance.adjustments.aggregate(total=models.Sum("amount")).get("total") or Decimal("0.00")
-            summary["pending_amount"] = summary["total_with_tax"] - (total_paid + total_adjusted)
+            # Totals and pending amount (total_with_tax - payments - adjustments) come from the maintained OrderFinancials row
+            financials = OrderFinancialsService.get_for_order(bill_instance.order)
+            summary = financials.summary()
+            summary["pending_amount"] = financials.pending_amount
 
             serialized_order_items = []
             serialized_service_items = []
@@ -290,7 +280,13 @@ class BillView(APIView):
             else:
                 bills_queryset = bills_queryset.filter(payment_status__in=["PENDING", "PARTIAL"])
 
-        bills, page_info = PaginationHelper.paginate_queryset(bills_queryset, params.get_value("page"), params.get_value("page_size"))
+        bills, page_info = PaginationHelper.paginate_queryset(
+            bills_queryset,
+            params.get_value("page"),
+            params.get_value("page_size"),
+            cursor=params.get_value("cursor", None),
+            with_total=params.get_value("with_total"),
+        )
 
         detailed_bills = BillService.calculate_bills_details_in_bulk(bills)
 
@@ -303,6 +299,7 @@ class BillView(APIView):
 
 class PaymentView(APIView):
     @forge
+    @allow_authenticated
     def get(self, request, payment_id=None):
         if payment_id:
             payment = PaymentService.get_payment_by_id(payment_id)
@@ -316,11 +313,18 @@ class PaymentView(APIView):
         else:
             payments_queryset = PaymentService.get_payments()
 
-        payments, page_info = PaginationHelper.paginate_queryset(payments_queryset, params.get_value("page"), params.get_value("page_size"))
+        payments, page_info = PaginationHelper.paginate_queryset(
+            payments_queryset,
+            params.get_value("page"),
+            params.get_value("page_size"),
+            cursor=params.get_value("cursor", None),
+            with_total=params.get_value("with_total"),
+        )
 
         return model_unwrap(payments), page_info
 
     @forge
+    @allow_authenticated
     def post(self, request):
         body = PaymentCreateSerializer.validate_request(request)
         bill_id = body.get_value("bill_id")
@@ -340,6 +344,7 @@ class PaymentView(APIView):
 
 class BillAdjustmentView(APIView):
     @forge
+    @allow_authenticated
     def get(self, request, adjustment_id=None):
         if adjustment_id:
             adj = BillAdjustmentService.get_adjustment_by_id(adjustment_id)
@@ -356,6 +361,7 @@ class BillAdjustmentView(APIView):
         return model_unwrap(adjustments), page_info
 
     @forge
+    @allow_authenticated
     @transaction.atomic
     def post(self, request):
         body = BillAdjustmentCreateSerializer.validate_request(request)
@@ -57,7 +57,9 @@ class BoxOrderService:
         return (
             BoxOrder.objects.filter(box_maker_id=box_maker_id)
             .select_related("order_item", "order_item__order")
-            .order_by(status_order, "-created_at")
+            # Annotated rather than ordered by the expression directly so the list also supports cursor pagination
+            .annotate(status_rank=status_order)
+            .order_by("status_rank", "-created_at")
         )
 
     @staticmethod
@@ -251,7 +253,9 @@ class PrintingJobService:
         return (
             PrintingJob.objects.filter(printer_id=printer_id)
             .select_related("order_item", "order_item__order")
-            .order_by(status_order, "-created_at")
+            # Annotated rather than ordered by the expression directly so the list also supports cursor pagination
+            .annotate(status_rank=status_order)
+            .order_by("status_rank", "-created_at")
         )
 
     @staticmethod
@@ -268,7 +272,9 @@ class PrintingJobService:
         return (
             PrintingJob.objects.filter(tracing_studio_id=tracing_studio_id)
             .select_related("order_item", "order_item__order")
-            .order_by(status_order, "-created_at")
+            # Annotated rather than ordered by the expression directly so the list also supports cursor pagination
+            .annotate(status_rank=status_order)
+            .order_by("status_rank", "-created_at")
         )
 
     @staticmethod
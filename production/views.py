@@ -1,5 +1,6 @@
 from rest_framework.views import APIView
 
+from core.authorization import allow_authenticated
 from core.decorators import forge
 from core.helpers.pagination import PaginationHelper
 from core.utils import model_unwrap
@@ -26,6 +27,7 @@ from production.services import BoxMakerService, BoxOrderService, PrinterService
 
 class BoxOrderView(APIView):
     @forge
+    @allow_authenticated
     def patch(self, request, box_order_id):
         body = BoxOrderUpdateSerializer.validate_request(request)
 
@@ -69,6 +71,7 @@ class BoxOrderView(APIView):
 
 class PrintingJobView(APIView):
     @forge
+    @allow_authenticated
     def patch(self, request, printing_job_id):
         body = PrintingJobUpdateSerializer.validate_request(request)
 
@@ -111,6 +114,7 @@ class PrintingJobView(APIView):
 
 class PrinterView(APIView):
     @forge
+    @allow_authenticated
     def get(self, request, printer_id=None):
         if printer_id:
             printer = PrinterService.get_printer_by_id(printer_id)
@@ -123,10 +127,17 @@ class PrinterView(APIView):
             return model_unwrap(printer)
 
         printers = PrinterService.get_printers()
-        printers, page_info = PaginationHelper.paginate_queryset(printers, params.get_value("page"), params.get_value("page_size"))
+        printers, page_info = PaginationHelper.paginate_queryset(
+            printers,
+            params.get_value("page"),
+            params.get_value("page_size"),
+            cursor=params.get_value("cursor", None),
+            with_total=params.get_value("with_total"),
+        )
         return [model_unwrap(printer) for printer in printers], page_info
 
     @forge
+    @allow_authenticated
     def post(self, request):
         body = PrinterCreateSerializer.validate_request(request)
         PrinterService.create_printer(name=body.get_value("name"), phone=body.get_value("phone"))
@@ -135,6 +146,7 @@ class PrinterView(APIView):
 
 class TracingStudioView(APIView):
     @forge
+    @allow_authenticated
     def get(self, request, tracing_studio_id=None):
         if tracing_studio_id:
             tracing_studio = TracingStudioService.get_tracing_studio_by_id(tracing_studio_id)
@@ -147,10 +159,17 @@ class TracingStudioView(APIView):
             return model_unwrap(tracing_studio)
 
         tracing_studios = TracingStudioService.get_tracing_studios()
-        tracing_studios, page_info = PaginationHelper.paginate_queryset(tracing_studios, params.get_value("page"), params.get_value("page_size"))
+        tracing_studios, page_info = PaginationHelper.paginate_queryset(
+            tracing_studios,
+            params.get_value("page"),
+            params.get_value("page_size"),
+            cursor=params.get_value("cursor", None),
+            with_total=params.get_value("with_total"),
+        )
         return [model_unwrap(tracing_studio) for tracing_studio in tracing_studios], page_info
 
     @forge
+    @allow_authenticated
     def post(self, request):
         body = TracingStudioCreateSerializer.validate_request(request)
         TracingStudioService.create_tracing_studio(name=body.get_value("name"), phone=body.get_value("phone"))
@@ -159,6 +178,7 @@ class TracingStudioView(APIView):
 
 class BoxMakerView(APIView):
     @forge
+    @allow_authenticated
     def get(self, request, box_maker_id=None):
         if box_maker_id:
             box_maker = BoxMakerService.get_box_maker_by_id(box_maker_id)
@@ -171,10 +191,17 @@ class BoxMakerView(APIView):
             return model_unwrap(box_maker)
 
         box_makers = BoxMakerService.get_box_makers()
-        box_makers, page_info = PaginationHelper.paginate_queryset(box_makers, params.get_value("page"), params.get_value("page_size"))
+        box_makers, page_info = PaginationHelper.paginate_queryset(
+            box_makers,
+            params.get_value("page"),
+            params.get_value("page_size"),
+            cursor=params.get_value("cursor", None),
+            with_total=params.get_value("with_total"),
+        )
         return [model_unwrap(box_maker) for box_maker in box_makers], page_info
 
     @forge
+    @allow_authenticated
     def post(self, request):
         body = BoxMakerCreateSerializer.validate_request(request)
         BoxMakerService.create_box_maker(name=body.get_value("name"), phone=body.get_value("phone"))
@@ -184,6 +211,7 @@ class BoxMakerView(APIView):
 class PrintingView(APIView):
 
     @forge
+    @allow_authenticated
     def get(self, request):
         params = PrintingListParams.validate_params(request)
 
@@ -192,7 +220,13 @@ class PrintingView(APIView):
 
         queryset = PrintingJobService.get_printing_jobs_by_printer(printer_id)
 
-        queryset, page_info = PaginationHelper.paginate_queryset(queryset, params.get_value("page"), params.get_value("page_size"))
+        queryset, page_info = PaginationHelper.paginate_queryset(
+            queryset,
+            params.get_value("page"),
+            params.get_value("page_size"),
+            cursor=params.get_value("cursor", None),
+            with_total=params.get_value("with_total"),
+        )
 
         results = [
             {
@@ -209,6 +243,7 @@ class PrintingView(APIView):
         return results, page_info
 
     @forge
+    @allow_authenticated
     def patch(self, request, printing_job_id):
         body = PrinterVendorStatusSerializer.validate_request(request)
 
@@ -224,6 +259,7 @@ class PrintingView(APIView):
 class TracingView(APIView):
 
     @forge
+    @allow_authenticated
     def get(self, request):
         params = TracingListParams.validate_params(request)
 
@@ -232,7 +268,13 @@ class TracingView(APIView):
 
         queryset = PrintingJobService.get_printing_jobs_by_tracing_studio(tracing_studio_id)
 
-        queryset, page_info = PaginationHelper.paginate_queryset(queryset, params.get_value("page"), params.get_value("page_size"))
+        queryset, page_info = PaginationHelper.paginate_queryset(
+            queryset,
+            params.get_value("page"),
+            params.get_value("page_size"),
+            cursor=params.get_value("cursor", None),
+            with_total=params.get_value("with_total"),
+        )
 
         results = [
             {
@@ -248,6 +290,7 @@ class TracingView(APIView):
         return results, page_info
 
     @forge
+    @allow_authenticated
     def patch(self, request, printing_job_id):
         body = TracingVendorStatusSerializer.validate_request(request)
 
@@ -263,6 +306,7 @@ class TracingView(APIView):
 
 class BoxingView(APIView):
     @forge
+    @allow_authenticated
     def get(self, request):
         params = BoxOrderListParams.validate_params(request)
 
@@ -271,7 +315,13 @@ class BoxingView(APIView):
 
         queryset = BoxOrderService.get_box_orders_by_box_maker(box_maker_id)
 
-        queryset, page_info = PaginationHelper.paginate_queryset(queryset, params.get_value("page"), params.get_value("page_size"))
+        queryset, page_info = PaginationHelper.paginate_queryset(
+            queryset,
+            params.get_value("page"),
+            params.get_value("page_size"),
+            cursor=params.get_value("cursor", None),
+            with_total=params.get_value("with_total"),
+        )
 
         results = [
             {
@@ -287,6 +337,7 @@ class BoxingView(APIView):
         return results, page_info
 
     @forge
+    @allow_authenticated
     def patch(self, request, box_order_id):
         body = BoxingVendorStatusSerializer.validate_request(request)
 
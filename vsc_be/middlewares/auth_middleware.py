@@ -2,11 +2,14 @@ import logging
 
 from django.conf import settings
 from rest_framework import status
+from rest_framework.permissions import SAFE_METHODS
 
+from accounts.models import Staff
 from accounts.services import StaffService
 from auditing.context import reset_current_staff, set_current_staff
 from core.exceptions import Unauthorized
 from core.helpers.api_response import APIResponse
+from core.helpers.routing import route_flags
 from core.helpers.security import Security
 
 logger = logging.getLogger(__name__)
@@ -15,11 +18,10 @@ logger = logging.getLogger(__name__)
 class AuthMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
-        self.skip_auth_patterns = getattr(settings, "SKIP_AUTH_PATTERNS", [])
 
     def __call__(self, request):
         try:
-            if any(pattern in request.path for pattern in self.skip_auth_patterns):
+            if route_flags(request).public:
                 return self.get_response(request)
 
             auth_header = request.headers.get("Authorization")
@@ -28,8 +30,12 @@ class AuthMiddleware:
 
             token = auth_header.split(" ")[1]
 
-            staff_id, expiry = Security.verify_token(token)
-            staff = StaffService.get_staff_by_id(staff_id)
+            claims = Security.verify_token_claims(token)
+            # Read-only requests may rely on the role the token was issued with instead of the staff row
+            trusted_role = None
+            if settings.AUTH_TRUST_TOKEN_ROLE_FOR_READS and request.method in SAFE_METHODS and claims.get("role") in Staff.Role.values:
+                trusted_role = claims["role"]
+            staff = StaffService.get_request_staff(claims["staff_id"], trusted_role=trusted_role)
 
             if not staff:
                 raise Unauthorized("Invalid Staff")
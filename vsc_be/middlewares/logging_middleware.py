@@ -8,6 +8,10 @@ from django.http import HttpRequest, HttpResponse
 from django.utils import timezone
 
 from auditing.models import APIAuditLog
+from auditing.writer import api_audit_writer
+from core.helpers.routing import route_flags
+
+_UNREADABLE = object()
 
 
 class LoggingMiddleware:
@@ -15,6 +19,10 @@ class LoggingMiddleware:
         self.get_response = get_response
 
     def __call__(self, request: HttpRequest) -> HttpResponse:
+        flags = route_flags(request)
+        if flags.no_log:
+            return self.get_response(request)
+
         enable_console = getattr(settings, "ENABLE_API_LOGGING", False)
         enable_db = getattr(settings, "ENABLE_API_DB_AUDIT", None)
         if enable_db is None:
@@ -29,7 +37,7 @@ class LoggingMiddleware:
 
         if enable_console:
             self._log_response(request, response)
-        if enable_db and not self._should_skip_audit(request):
+        if enable_db and not flags.no_audit:
             try:
                 duration_ms = int((time.monotonic() - start) * 1000)
                 self._persist_api_audit(request, response, request_id, duration_ms)
@@ -151,21 +159,15 @@ class LoggingMiddleware:
                 s = raw if raw is not None and len(raw) <= max_body_chars else (raw[:max_body_chars] if raw is not None else "")
                 return s
 
-        def _request_body(req: HttpRequest) -> Union[Dict[str, Any], list, str, None]:
-            if req.method in ["POST", "PUT", "PATCH"]:
-                try:
-                    return _parse_body(req.body.decode("utf-8"))
-                except Exception:
-                    return "<binary or unreadable>"
-            return {}
-
-        def _response_body(resp: HttpResponse) -> Union[Dict[str, Any], list, str, None]:
-            if hasattr(resp, "content"):
-                try:
-                    return _parse_body(resp.content.decode("utf-8"))
-                except Exception:
-                    return "<binary or unreadable>"
-            return {}
+        def _decoded_body(raw: Optional[bytes]) -> Union[Dict[str, Any], list, str, None]:
+            if raw is None:
+                return {}
+            if raw is _UNREADABLE:
+                return "<binary or unreadable>"
+            try:
+                return _parse_body(raw.decode("utf-8"))
+            except Exception:
+                return "<binary or unreadable>"
 
         def _sanitize_headers(h: Dict[str, Any]) -> Dict[str, Any]:
             result = {}
@@ -177,10 +179,19 @@ class LoggingMiddleware:
             return result
 
         try:
+            # Only the raw values are captured on the request thread; parsing and redaction happen when the row is built
+            request_raw = None
+            if request.method in ["POST", "PUT", "PATCH"]:
+                try:
+                    request_raw = request.body
+                except Exception:
+                    request_raw = _UNREADABLE
+            response_raw = None
             content_len = None
             if hasattr(response, "content"):
                 try:
-                    content_len = len(response.content)
+                    response_raw = response.content
+                    content_len = len(response_raw)
                 except Exception:
                     content_len = None
             if content_len is None:
@@ -188,28 +199,35 @@ class LoggingMiddleware:
                     content_len = int(response.headers.get("Content-Length", "")) if hasattr(response, "headers") else None
                 except Exception:
                     content_len = None
-            APIAuditLog.objects.create(
-                id=uuid.uuid4(),
-                staff=staff if staff else None,
-                endpoint=request.path,
-                request_method=request.method,
-                request_body=_request_body(request),
-                response_body=_response_body(response),
-                status_code=getattr(response, "status_code", None),
-                duration_ms=duration_ms,
-                ip_address=_client_ip(request),
-                user_agent=request.headers.get("User-Agent", ""),
-                query_params=dict(request.GET or {}),
-                headers=_sanitize_headers(dict(request.headers)),
-                request_id=request_id,
-                response_size_bytes=content_len,
-            )
+            status_code = getattr(response, "status_code", None)
+            fields = {
+                # Taken now rather than when the background writer saves the row
+                "created_at": timezone.now(),
+                "staff_id": staff.id if staff else None,
+                "endpoint": request.path,
+                "request_method": request.method,
+                "status_code": status_code,
+                "duration_ms": duration_ms,
+                "ip_address": _client_ip(request),
+                "user_agent": request.headers.get("User-Agent", ""),
+                "query_params": dict(request.GET or {}),
+                "headers": dict(request.headers),
+                "request_id": request_id,
+                "response_size_bytes": content_len,
+            }
+
+            def build_entry() -> APIAuditLog:
+                return APIAuditLog(
+                    id=uuid.uuid4(),
+                    **{**fields, "headers": _sanitize_headers(fields["headers"])},
+                    request_body=_decoded_body(request_raw),
+                    response_body=_decoded_body(response_raw),
+                )
+
+            if getattr(settings, "API_AUDIT_ASYNC", False):
+                queued_bytes = sum(len(raw) for raw in (request_raw, response_raw) if isinstance(raw, bytes))
+                api_audit_writer.submit(build_entry, is_error=bool(status_code and status_code >= 400), size=queued_bytes)
+            else:
+                build_entry().save(force_insert=True)
         except Exception:
             pass
-
-    def _should_skip_audit(self, request: HttpRequest) -> bool:
-        excluded = getattr(settings, "AUDIT_EXCLUDED_PATHS", [])
-        try:
-            return any(p and p in request.path for p in excluded)
-        except Exception:
-            return False
@@ -24,6 +24,22 @@ ALLOWED_HOSTS: List[str] = config("ALLOWED_HOSTS", default="localhost,127.0.0.1"
 TOKEN_SECRET = config("TOKEN_SECRET", default="")
 ALGORITHM = config("ALGORITHM", default="HS256")
 TOKEN_EXPIRE_MINUTES = config("TOKEN_EXPIRE_MINUTES", default=6000, cast=int)
+# Verified tokens kept per process so a reused token skips signature verification (0 disables)
+TOKEN_CACHE_SIZE = config("TOKEN_CACHE_SIZE", default=4096, cast=int)
+# Authenticated staff identities cached per process (0 disables); saving a staff row evicts it at once in that process
+STAFF_IDENTITY_CACHE_TTL = config("STAFF_IDENTITY_CACHE_TTL", default=60, cast=int)
+STAFF_IDENTITY_CACHE_SIZE = config("STAFF_IDENTITY_CACHE_SIZE", default=1024, cast=int)
+# Authenticate GET/HEAD/OPTIONS requests from the token's role claim without reading the staff row
+AUTH_TRUST_TOKEN_ROLE_FOR_READS = config("AUTH_TRUST_TOKEN_ROLE_FOR_READS", default=False, cast=bool)
+# bcrypt cost; stored hashes with another cost are rehashed on the next successful login
+PASSWORD_BCRYPT_ROUNDS = config("PASSWORD_BCRYPT_ROUNDS", default=12, cast=int)
+# Concurrent bcrypt operations per process, and seconds a login waits for a free slot before getting a 429
+PASSWORD_HASH_CONCURRENCY = config("PASSWORD_HASH_CONCURRENCY", default=2, cast=int)
+PASSWORD_HASH_QUEUE_TIMEOUT = config("PASSWORD_HASH_QUEUE_TIMEOUT", default=2.0, cast=float)
+# Login throttling over a sliding window kept in the cache: failed attempts per phone, attempts per client IP (0 disables)
+LOGIN_THROTTLE_WINDOW_SECONDS = config("LOGIN_THROTTLE_WINDOW_SECONDS", default=300, cast=int)
+LOGIN_THROTTLE_PHONE_LIMIT = config("LOGIN_THROTTLE_PHONE_LIMIT", default=10, cast=int)
+LOGIN_THROTTLE_IP_LIMIT = config("LOGIN_THROTTLE_IP_LIMIT", default=30, cast=int)
 
 # Database Settings
 # DATABASE_NAME = os.getenv("DATABASE_NAME")
@@ -46,12 +62,31 @@ MEDIA_URL = config("MEDIA_URL", default="/media/")
 MEDIA_ROOT = config("MEDIA_ROOT", default=os.path.join(BASE_DIR, "media"))
 PUBLIC_BASE_URL = config("PUBLIC_BASE_URL", default="")
 IMAGE_UPLOAD_FOLDER = config("IMAGE_UPLOAD_FOLDER", default="images")
+IMAGE_VARIANT_FOLDER = config("IMAGE_VARIANT_FOLDER", default="variants")
+# Uploads larger than this are spooled to a temp file instead of being held in worker memory
+FILE_UPLOAD_MAX_MEMORY_SIZE = config("FILE_UPLOAD_MAX_MEMORY_SIZE", default=1024 * 1024, cast=int)
+FILE_UPLOAD_TEMP_DIR = config("FILE_UPLOAD_TEMP_DIR", default=None)
 
 # Business Settings
 TAX_PERCENTAGE = config("TAX_PERCENTAGE", default=0.0, cast=float)
 LOW_STOCK_THRESHOLD = config("LOW_STOCK_THRESHOLD", default=100, cast=int)
 MEDIUM_STOCK_THRESHOLD = config("MEDIUM_STOCK_THRESHOLD", default=250, cast=int)
 OUT_OF_STOCK_THRESHOLD = config("OUT_OF_STOCK_THRESHOLD", default=0, cast=int)
+# Seconds between incremental refreshes of the in-process card similarity index
+CARD_SIMILARITY_SYNC_SECONDS = config("CARD_SIMILARITY_SYNC_SECONDS", default=30, cast=int)
+
+# Dashboard Settings
+DASHBOARD_PARALLEL_QUERIES = config("DASHBOARD_PARALLEL_QUERIES", default=False, cast=bool)
+DASHBOARD_MAX_WORKERS = config("DASHBOARD_MAX_WORKERS", default=4, cast=int)
+# Seconds analytics results stay cached (0 disables caching); writes to source models invalidate them sooner
+ANALYTICS_CACHE_TTL = config("ANALYTICS_CACHE_TTL", default=300, cast=int)
+ANALYTICS_CACHE_LOCK_TIMEOUT = config("ANALYTICS_CACHE_LOCK_TIMEOUT", default=10, cast=int)
+# List totals: exact counts are cached briefly; above the threshold PostgreSQL's planner estimate is used instead
+PAGINATION_COUNT_CACHE_TTL = config("PAGINATION_COUNT_CACHE_TTL", default=30, cast=int)
+PAGINATION_ESTIMATE_THRESHOLD = config("PAGINATION_ESTIMATE_THRESHOLD", default=10000, cast=int)
+# JSON encoder for API responses: "stdlib" (byte-for-byte what JsonResponse produces) or "orjson", an opt-in for
+# compact, unescaped UTF-8 output with the same values (falls back to "stdlib" when orjson is not installed)
+API_JSON_RENDERER = config("API_JSON_RENDERER", default="stdlib")
 # =================================================
 
 INSTALLED_APPS = [
@@ -67,6 +102,7 @@ INSTALLED_APPS = [
     "inventory",
     "orders",
     "production",
+    "analytics",
     "auditing",
     # Third Party Apps
     "django_extensions",
@@ -126,6 +162,13 @@ DATABASES = {
     }
 }
 
+CACHES = {
+    "default": {
+        "BACKEND": config("CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": config("CACHE_LOCATION", default="vsc-be"),
+    }
+}
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -156,7 +199,7 @@ STATIC_URL = "/static/"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 
-# Authentication Skip Patterns (endpoints that don't require authentication)
+# Authentication Skip Patterns (path prefixes of endpoints that don't require authentication, see core.helpers.routing)
 SKIP_AUTH_PATTERNS = [
     "/api/v1/auth/login/",
     # "/api/v1/auth/register/",
@@ -173,6 +216,8 @@ CORS_ALLOWED_ORIGIN_REGEXES = config("CORS_ALLOWED_ORIGIN_REGEXES", default="").
 
 # API logging toggle
 ENABLE_API_LOGGING = config("ENABLE_API_LOGGING", default=True, cast=bool)
+# Path prefixes that skip request logging and API auditing entirely (probes and static media)
+API_LOG_EXCLUDED_PATHS: List[str] = [p for p in config("API_LOG_EXCLUDED_PATHS", default="/api/v1/health/,/media/").split(",") if p]
 
 # API audit logging toggles
 ENABLE_API_DB_AUDIT = config("ENABLE_API_DB_AUDIT", default=True, cast=bool)
@@ -188,8 +233,24 @@ AUDIT_REDACTED_FIELDS: List[str] = [
     k for k in config("AUDIT_REDACTED_FIELDS", default="password,token,authorization,cookie,secret,api_key").split(",") if k
 ]
 AUDIT_MAX_BODY_CHARS = config("AUDIT_MAX_BODY_CHARS", default=4096, cast=int)
+# API audit rows are written by a background thread in batches (see auditing.writer)
+API_AUDIT_ASYNC = config("API_AUDIT_ASYNC", default=True, cast=bool)
+API_AUDIT_QUEUE_SIZE = config("API_AUDIT_QUEUE_SIZE", default=10000, cast=int)
+# Cap on the raw request and response bodies held by queued rows, in bytes
+API_AUDIT_QUEUE_MAX_BYTES = config("API_AUDIT_QUEUE_MAX_BYTES", default=64 * 1024 * 1024, cast=int)
+API_AUDIT_BATCH_SIZE = config("API_AUDIT_BATCH_SIZE", default=200, cast=int)
+API_AUDIT_FLUSH_INTERVAL_MS = config("API_AUDIT_FLUSH_INTERVAL_MS", default=500, cast=int)
+API_AUDIT_BUSY_SAMPLE_RATE = config("API_AUDIT_BUSY_SAMPLE_RATE", default=0.1, cast=float)
 
 AUDIT_INCLUDE_APPS: List[str] = ["accounts", "inventory", "orders", "production"]
 AUDIT_EXCLUDE_APPS: List[str] = []
-AUDIT_EXCLUDE_MODELS: List[str] = ["auditing.ModelAuditLog", "auditing.APIAuditLog"]
+AUDIT_EXCLUDE_MODELS: List[str] = ["auditing.ModelAuditLog", "auditing.APIAuditLog", "orders.OrderFinancials"]
 AUDIT_FIELD_IGNORE: Dict[str, List[str]] = {"*": ["created_at", "updated_at", "last_login"]}
+# Model audit entries buffered per transaction before they are written early (see auditing.buffer)
+AUDIT_BUFFER_MAX_ENTRIES = config("AUDIT_BUFFER_MAX_ENTRIES", default=1000, cast=int)
+# Snapshot audited instances when they are loaded so updates can be diffed without re-reading the row
+AUDIT_LOAD_SNAPSHOTS = config("AUDIT_LOAD_SNAPSHOTS", default=True, cast=bool)
+# Monthly audit table partitions (PostgreSQL): created ahead of time, archived and dropped past retention
+AUDIT_PARTITION_MONTHS_AHEAD = config("AUDIT_PARTITION_MONTHS_AHEAD", default=3, cast=int)
+AUDIT_RETENTION_MONTHS = config("AUDIT_RETENTION_MONTHS", default=12, cast=int)
+AUDIT_ARCHIVE_DIR = config("AUDIT_ARCHIVE_DIR", default=os.path.join(BASE_DIR, "audit_archive"))
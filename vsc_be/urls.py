@@ -4,7 +4,10 @@ from django.contrib import admin
 from django.http import JsonResponse
 from django.urls import include, path
 
+from core.authorization import allow_public
 
+
+@allow_public
 def health_view(request):
     return JsonResponse({"status": "ok"})
 